@@ -99,13 +99,12 @@ async def main():
         else:
             print("\n⚠️  改善可能 - さらなる最適化が推奨されます")
 
-        # 感情軌跡の可視化
-        print("\n📊 感情軌跡を可視化中...")
-        await plot_emotional_journey(result["narrative_metrics"])
-
-        # ファイル出力
-        print("\n💾 結果をファイルに保存中...")
-        await save_optimized_novel(result)
+        # 感情軌跡の可視化とファイル出力（互いに独立しているため並行実行）
+        print("\n📊 感情軌跡の可視化と結果のファイル保存を実行中...")
+        await asyncio.gather(
+            plot_emotional_journey(result["narrative_metrics"]),
+            save_optimized_novel(result),
+        )
 
         print("\n✨ 全て完了しました！生成された物語をお楽しみください。")
 
@@ -3,9 +3,52 @@
 物語構造の科学的分析と最適化
 """
 
-import random
+import re
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
+
+# 感情アークの5点グリッド上のS字カーブ（3t^2 - 2t^3）
+_ARC_GRID = np.linspace(0.0, 1.0, 5)
+_ARC_S_CURVE = 3 * _ARC_GRID**2 - 2 * _ARC_GRID**3
+
+# 成功確率の算出に使う指標・目標値・重み
+_SUCCESS_METRIC_KEYS = (
+    "reversal_frequency",
+    "average_reversal_intensity",
+    "emotional_variance",
+    "semantic_distance",
+)
+_SUCCESS_METRIC_TARGETS = np.array([2.5, 0.8, 0.6, 0.7])
+_SUCCESS_METRIC_WEIGHTS = np.array([0.3, 0.25, 0.25, 0.2])
+
+# 意味的複雑性分析で数える抽象的概念（簡略化）
+_ABSTRACT_CONCEPTS = ("運命", "正義", "愛", "憎しみ", "希望", "絶望", "真実", "嘘")
+_SENTENCE_ENDERS = ("。", "！", "？")
+
+# 文末記号と抽象概念を1回の走査でまとめて拾う（互いに重なり合う語はない）
+_TEXT_FEATURE_RE = re.compile("|".join(map(re.escape, _ABSTRACT_CONCEPTS + _SENTENCE_ENDERS)))
+
+
+@lru_cache(maxsize=512)
+def _count_text_features(text: str) -> tuple[int, int, int, int]:
+    """テキストの語数・異なり語数・文数・抽象概念数を数える
+
+    最適化の反復で同じシーンが再分析されるため、テキスト単位でメモ化する。
+    """
+
+    tokens = text.split()
+    word_count = len(tokens)
+    unique_word_count = len(set(tokens))
+
+    feature_counts = Counter(_TEXT_FEATURE_RE.findall(text))
+    sentence_count = sum(feature_counts[ender] for ender in _SENTENCE_ENDERS)
+    abstract_count = sum(feature_counts[concept] for concept in _ABSTRACT_CONCEPTS)
+
+    return word_count, unique_word_count, sentence_count, abstract_count
 
 
 class ReversalType(Enum):
@@ -19,7 +62,7 @@ class ReversalType(Enum):
     ROLE_REVERSAL = "role_reversal"
 
 
-@dataclass
+@dataclass(slots=True)
 class NarrativeReversal:
     """物語転換の構造"""
 
@@ -68,43 +111,43 @@ class ComputationalNarratologyEngine:
             },
         }
 
+        # 感情アークの変動用乱数生成器
+        self._rng = np.random.default_rng()
+
+        # 転換タイプの決定表
+        # 軸: (現在の感情価, 目標の感情価, 物語の位置)
+        #   感情価: 0=ネガティブ(< -0.3), 1=中立, 2=ポジティブ(> 0.3)
+        #   位置: 0=序盤(< 3), 1=中盤(3-7), 2=終盤(>= 8)
+        self._reversal_lut = np.full((3, 3, 3), ReversalType.ROLE_REVERSAL, dtype=object)
+        self._reversal_lut[2, 0] = [
+            ReversalType.BETRAYAL_CASCADE,
+            ReversalType.CLASSIC_PERIPETEIA,
+            ReversalType.PYRRHIC_VICTORY,
+        ]
+        self._reversal_lut[0, 2] = [
+            ReversalType.RECOGNITION_SCENE,
+            ReversalType.FALSE_DEFEAT,
+            ReversalType.RECOGNITION_SCENE,
+        ]
+
     def calculate_narrative_success_probability(self, metrics: dict[str, float]) -> float:
         """物語の成功確率を計算"""
 
-        # 各要素の成功寄与度
-        reversal_score = min(1.0, metrics.get("reversal_frequency", 0) / 2.5)
-        intensity_score = min(1.0, metrics.get("average_reversal_intensity", 0) / 0.8)
-        variance_score = min(1.0, metrics.get("emotional_variance", 0) / 0.6)
-        distance_score = min(1.0, metrics.get("semantic_distance", 0) / 0.7)
-
-        # 重み付き平均
-        weights = {
-            "reversal": 0.3,
-            "intensity": 0.25,
-            "variance": 0.25,
-            "distance": 0.2,
-        }
-
-        success_score = (
-            reversal_score * weights["reversal"]
-            + intensity_score * weights["intensity"]
-            + variance_score * weights["variance"]
-            + distance_score * weights["distance"]
-        )
+        # 各要素の成功寄与度（目標値で正規化し1.0で頭打ち）と重み付き平均
+        values = np.array([metrics.get(key, 0) for key in _SUCCESS_METRIC_KEYS], dtype=np.float64)
+        scores = np.minimum(1.0, values / _SUCCESS_METRIC_TARGETS)
 
-        return success_score
+        return float(scores @ _SUCCESS_METRIC_WEIGHTS)
 
     def optimize_reversal_sequence(self, base_sequence: list[float]) -> list[NarrativeReversal]:
         """転換シーケンスを最適化"""
 
-        optimized_reversals = []
+        # 最小強度の保証は直前の調整結果に依存するため逐次に解く
+        target_states = np.empty(len(base_sequence))
         current_state = 0.0
 
         for i, target_state in enumerate(base_sequence):
-            intensity = abs(target_state - current_state)
-
-            # 最小強度を保証
-            if intensity < 0.8:
+            if abs(target_state - current_state) < 0.8:
                 if target_state > current_state:
                     target_state = current_state + 0.8
                 else:
@@ -112,55 +155,47 @@ class ComputationalNarratologyEngine:
 
                 # 範囲内に収める
                 target_state = max(-1.0, min(1.0, target_state))
-                intensity = abs(target_state - current_state)
 
-            # 転換タイプを決定
-            reversal_type = self._select_optimal_reversal_type(current_state, target_state, i)
+            target_states[i] = target_state
+            current_state = target_state
+
+        # 強度・転換タイプ・感情アークは配列演算で一括計算
+        current_states = np.concatenate(([0.0], target_states[:-1]))
+        intensities = np.abs(target_states - current_states)
+        reversal_types = self._select_optimal_reversal_types(current_states, target_states)
+        emotional_arcs = self._generate_emotional_arcs(current_states, target_states)
 
+        optimized_reversals = []
+        for i, reversal_type in enumerate(reversal_types):
             reversal = NarrativeReversal(
                 type=reversal_type,
                 position=f"chapter_{i // 3 + 1}_scene_{i % 3 + 1}",
-                current_state=current_state,
-                target_state=target_state,
-                intensity=intensity,
+                current_state=float(current_states[i]),
+                target_state=float(target_states[i]),
+                intensity=float(intensities[i]),
                 narrative_function=self._determine_narrative_function(reversal_type),
-                emotional_arc=self._generate_emotional_arc(current_state, target_state),
+                emotional_arc=emotional_arcs[i].tolist(),
             )
 
             optimized_reversals.append(reversal)
-            current_state = target_state
 
         return optimized_reversals
 
-    def _select_optimal_reversal_type(
-        self, current: float, target: float, position: int
-    ) -> ReversalType:
-        """最適な転換タイプを選択"""
-
-        # 感情の方向性
-        is_positive_to_negative = current > 0.3 and target < -0.3
-        is_negative_to_positive = current < -0.3 and target > 0.3
+    def _select_optimal_reversal_types(
+        self, currents: np.ndarray, targets: np.ndarray
+    ) -> list[ReversalType]:
+        """シーケンス全体の転換タイプを決定表から一括で選択"""
 
-        # 物語の位置
-        is_early = position < 3
-        is_middle = 3 <= position < 8
+        positions = np.arange(len(currents))
 
-        if is_positive_to_negative:
-            if is_early:
-                return ReversalType.BETRAYAL_CASCADE
-            elif is_middle:
-                return ReversalType.CLASSIC_PERIPETEIA
-            else:
-                return ReversalType.PYRRHIC_VICTORY
+        current_buckets = (currents >= -0.3).astype(int) + (currents > 0.3)
+        target_buckets = (targets >= -0.3).astype(int) + (targets > 0.3)
+        position_buckets = (positions >= 3).astype(int) + (positions >= 8)
 
-        elif is_negative_to_positive:
-            if is_middle:
-                return ReversalType.FALSE_DEFEAT
-            else:
-                return ReversalType.RECOGNITION_SCENE
-
-        else:
-            return ReversalType.ROLE_REVERSAL
+        selected: list[ReversalType] = self._reversal_lut[
+            current_buckets, target_buckets, position_buckets
+        ].tolist()
+        return selected
 
     def _determine_narrative_function(self, reversal_type: ReversalType) -> str:
         """転換の物語的機能を決定"""
@@ -176,54 +211,28 @@ class ComputationalNarratologyEngine:
 
         return functions[reversal_type]
 
-    def _generate_emotional_arc(self, start: float, end: float) -> list[float]:
-        """感情アークを生成"""
-
-        # 5つのポイントで感情の軌跡を作成
-        arc = []
-        difference = end - start
+    def _generate_emotional_arcs(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """感情アークを転換ごとに一括生成（各行が5点の軌跡）"""
 
-        # 転換の途中での感情的な複雑さを表現
-        for i in range(5):
-            t = i / 4.0
-            # 非線形な変化（S字カーブ）
-            s_curve = 3 * t**2 - 2 * t**3
-            value = start + difference * s_curve
+        # 非線形な変化（S字カーブ）
+        arcs = starts[:, None] + (ends - starts)[:, None] * _ARC_S_CURVE
 
-            # 中間点でのランダムな変動を追加
-            if 1 <= i <= 3:
-                variation = random.uniform(-0.2, 0.2)
-                value += variation
+        # 転換の途中での感情的な複雑さを表現（中間点でのランダムな変動）
+        arcs[:, 1:4] += self._rng.uniform(-0.2, 0.2, size=(len(starts), 3))
 
-            arc.append(max(-1.0, min(1.0, value)))
-
-        return arc
+        return np.clip(arcs, -1.0, 1.0)
 
     def analyze_semantic_complexity(self, text: str) -> dict[str, float]:
         """意味的複雑性を分析"""
 
         # 簡略化された意味的分析
-        word_count = len(text.split())
-        sentence_count = text.count("。") + text.count("！") + text.count("？")
+        word_count, unique_word_count, sentence_count, abstract_count = _count_text_features(text)
 
         # 複雑性指標
         avg_sentence_length = word_count / max(1, sentence_count)
 
-        # 抽象的概念の頻度（簡略化）
-        abstract_concepts = [
-            "運命",
-            "正義",
-            "愛",
-            "憎しみ",
-            "希望",
-            "絶望",
-            "真実",
-            "嘘",
-        ]
-        abstract_count = sum(text.count(concept) for concept in abstract_concepts)
-
         return {
-            "lexical_diversity": len(set(text.split())) / max(1, word_count),
+            "lexical_diversity": unique_word_count / max(1, word_count),
             "sentence_complexity": avg_sentence_length / 20.0,  # 正規化
             "abstract_density": abstract_count / max(1, word_count),
             "overall_complexity": self._calculate_overall_complexity(
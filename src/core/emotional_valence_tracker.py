@@ -3,15 +3,32 @@
 物語の感情価をリアルタイムで追跡・分析
 """
 
-import random
+import math
 import re
+from collections import Counter
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 
+# 前処理用の正規表現（シーンごとの再コンパイルを避ける）
+_PUNCTUATION_RE = re.compile(r"[。！？\.\!\?]+")
+_WHITESPACE_RE = re.compile(r"\s+")
 
-@dataclass
+
+def _compile_lexicon(words: list[str]) -> re.Pattern[str]:
+    """語彙リストを1回の走査で全出現位置を拾う正規表現にまとめる
+
+    先読みの中でキャプチャするため、異なる語同士が重なっていても
+    語ごとの ``str.count`` の合計と同じ件数を返す（ある語が別の語の
+    接頭辞になっている場合は長い方のみが数えられる）。
+    """
+
+    alternatives = "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+    return re.compile(f"(?=({alternatives}))")
+
+
+@dataclass(slots=True)
 class EmotionalEvent:
     """感情的イベントの記録"""
 
@@ -28,9 +45,25 @@ class EmotionalValenceTracker:
     def __init__(self) -> None:
         self.valence_history: list[float] = []
         self.current_valence: float = 0.0
-        self.emotional_events: list[EmotionalEvent] = []
         self.window_size: int = 5  # 移動平均の窓サイズ
 
+        # 感情価統計の逐次集計（Welford法）
+        self._valence_count: int = 0
+        self._valence_mean: float = 0.0
+        self._valence_m2: float = 0.0
+        self._valence_min: float = math.inf
+        self._valence_max: float = -math.inf
+        self._positive_count: int = 0
+        self._negative_count: int = 0
+
+        # 感情的イベントの記録（数値列は配列ごとに保持し、容量不足時に倍に拡張）
+        self._event_count: int = 0
+        self._event_positions: np.ndarray = np.empty(16, dtype=np.int64)
+        self._event_valences: np.ndarray = np.empty(16, dtype=np.float64)
+        self._event_intensities: np.ndarray = np.empty(16, dtype=np.float64)
+        self._event_types: list[str] = []
+        self._event_descriptions: list[str] = []
+
         # 感情語彙データベース（拡張版）
         self.valence_vocabulary = {
             "positive": {
@@ -122,17 +155,52 @@ class EmotionalValenceTracker:
             },
         }
 
+        # 語彙を極性ごとの平坦な 語→重み（絶対値）辞書に展開
+        self._positive_weights: dict[str, float] = {
+            word: abs(data["weight"])
+            for data in self.valence_vocabulary["positive"].values()
+            for word in data["words"]
+        }
+        self._negative_weights: dict[str, float] = {
+            word: abs(data["weight"])
+            for data in self.valence_vocabulary["negative"].values()
+            for word in data["words"]
+        }
+
+        self._modifier_categories: dict[str, str] = {
+            word: category
+            for category, data in self.context_modifiers.items()
+            for word in data["words"]
+        }
+
+        # 感情語彙と修飾語をまとめて1回で走査する
+        self._lexicon_pattern = _compile_lexicon(
+            [*self._positive_weights, *self._negative_weights, *self._modifier_categories]
+        )
+
+        # 転換提案用の乱数（まとめて生成したバッファから順に消費する）
+        self._rng = np.random.default_rng()
+        self._uniform_buffer: np.ndarray = np.empty(0)
+        self._uniform_index: int = 0
+
+        # 走査結果のキャッシュ（同じシーンの再分析で走査を省く）
+        self._lexicon_cache: dict[str, Counter[str]] = {}
+        self._lexicon_cache_size: int = 512
+
     async def analyze_scene_valence(self, scene_text: str, scene_position: int = 0) -> float:
         """シーンの感情価を分析"""
 
         # テキストの前処理
         cleaned_text = self._preprocess_text(scene_text)
 
+        # 語彙の出現回数を1回の走査で取得
+        word_counts = self._scan_lexicon(cleaned_text)
+
         # 基本的な感情価計算
-        base_valence = self._calculate_base_valence(cleaned_text)
+        base_valence = self._calculate_base_valence(word_counts)
 
         # 文脈修飾子の適用
-        modified_valence = self._apply_context_modifiers(cleaned_text, base_valence)
+        modified_valence = self._apply_context_modifiers(word_counts, base_valence)
 
         # 物語位置による調整
         position_adjusted = self._adjust_for_narrative_position(modified_valence, scene_position)
@@ -140,52 +208,105 @@ class EmotionalValenceTracker:
         # 感情価履歴の更新
         self.valence_history.append(position_adjusted)
         self.current_valence = position_adjusted
+        self._update_statistics(position_adjusted)
 
         # 重要な感情的イベントの記録
         if abs(position_adjusted) > 0.7:
-            event = EmotionalEvent(
-                position=scene_position,
-                valence=position_adjusted,
-                intensity=abs(position_adjusted),
-                event_type=(
-                    "high_intensity" if abs(position_adjusted) > 0.8 else "moderate_intensity"
-                ),
-                description=self._describe_emotional_event(position_adjusted, cleaned_text),
+            self._record_emotional_event(
+                scene_position,
+                position_adjusted,
+                self._describe_emotional_event(position_adjusted, cleaned_text),
             )
-            self.emotional_events.append(event)
 
         return position_adjusted
 
+    @property
+    def emotional_events(self) -> list[EmotionalEvent]:
+        """記録された感情的イベント（参照時に組み立てる）"""
+
+        return [
+            EmotionalEvent(
+                position=int(self._event_positions[i]),
+                valence=float(self._event_valences[i]),
+                intensity=float(self._event_intensities[i]),
+                event_type=self._event_types[i],
+                description=self._event_descriptions[i],
+            )
+            for i in range(self._event_count)
+        ]
+
+    def _record_emotional_event(self, position: int, valence: float, description: str) -> None:
+        """感情的イベントを配列に追記"""
+
+        if self._event_count == len(self._event_positions):
+            capacity = 2 * len(self._event_positions)
+            self._event_positions = np.resize(self._event_positions, capacity)
+            self._event_valences = np.resize(self._event_valences, capacity)
+            self._event_intensities = np.resize(self._event_intensities, capacity)
+
+        intensity = abs(valence)
+        self._event_positions[self._event_count] = position
+        self._event_valences[self._event_count] = valence
+        self._event_intensities[self._event_count] = intensity
+        self._event_types.append("high_intensity" if intensity > 0.8 else "moderate_intensity")
+        self._event_descriptions.append(description)
+        self._event_count += 1
+
+    def _update_statistics(self, valence: float) -> None:
+        """感情価の逐次統計を更新（Welford法）"""
+
+        self._valence_count += 1
+        delta = valence - self._valence_mean
+        self._valence_mean += delta / self._valence_count
+        self._valence_m2 += delta * (valence - self._valence_mean)
+
+        self._valence_min = min(self._valence_min, valence)
+        self._valence_max = max(self._valence_max, valence)
+        if valence > 0:
+            self._positive_count += 1
+        elif valence < 0:
+            self._negative_count += 1
+
     def _preprocess_text(self, text: str) -> str:
         """テキストの前処理"""
 
         # 句読点の正規化
-        text = re.sub(r"[。！？\.\!\?]+", "。", text)
+        text = _PUNCTUATION_RE.sub("。", text)
 
         # 余分な空白の除去
-        text = re.sub(r"\s+", " ", text.strip())
+        text = _WHITESPACE_RE.sub(" ", text.strip())
 
         return text
 
-    def _calculate_base_valence(self, text: str) -> float:
-        """基本的な感情価を計算"""
+    def _scan_lexicon(self, text: str) -> Counter[str]:
+        """感情語彙と文脈修飾子の出現回数を1回の走査で数える
+
+        結果はテキストごとにキャッシュされ共有されるため、呼び出し側で変更しないこと。
+        """
+
+        cached = self._lexicon_cache.get(text)
+        if cached is not None:
+            return cached
+
+        word_counts = Counter(match.group(1) for match in self._lexicon_pattern.finditer(text))
 
-        positive_score = 0.0
-        negative_score = 0.0
+        if len(self._lexicon_cache) >= self._lexicon_cache_size:
+            # 最も古いエントリを捨てる（dictは挿入順を保持する）
+            del self._lexicon_cache[next(iter(self._lexicon_cache))]
+        self._lexicon_cache[text] = word_counts
 
-        # ポジティブ語彙のスコア計算
-        for _intensity_level, data in self.valence_vocabulary["positive"].items():
-            weight = data["weight"]
-            for word in data["words"]:
-                count = text.count(word)
-                positive_score += count * weight
+        return word_counts
 
-        # ネガティブ語彙のスコア計算
-        for _intensity_level, data in self.valence_vocabulary["negative"].items():
-            weight = abs(data["weight"])  # 絶対値を取って計算
-            for word in data["words"]:
-                count = text.count(word)
-                negative_score += count * weight
+    def _calculate_base_valence(self, word_counts: Counter[str]) -> float:
+        """基本的な感情価を計算"""
+
+        # 語彙順に加算する（丸め誤差を従来の計算と揃える）
+        positive_score = sum(
+            word_counts[word] * weight for word, weight in self._positive_weights.items()
+        )
+        negative_score = sum(
+            word_counts[word] * weight for word, weight in self._negative_weights.items()
+        )
 
         # 正規化
         total_score = positive_score + negative_score
@@ -196,33 +317,34 @@ class EmotionalValenceTracker:
 
         return max(-1.0, min(1.0, valence))
 
-    def _apply_context_modifiers(self, text: str, base_valence: float) -> float:
+    def _apply_context_modifiers(self, word_counts: Counter[str], base_valence: float) -> float:
         """文脈修飾子を適用"""
 
         modified_valence = base_valence
 
+        # 修飾語の出現回数をカテゴリごとに集計
+        modifier_counts = dict.fromkeys(self.context_modifiers, 0)
+        for word, count in word_counts.items():
+            category = self._modifier_categories.get(word)
+            if category is not None:
+                modifier_counts[category] += count
+
         # 強調語の検出
-        intensifier_count = 0
-        for word in self.context_modifiers["intensifiers"]["words"]:
-            intensifier_count += text.count(word)
+        intensifier_count = modifier_counts["intensifiers"]
 
         if intensifier_count > 0:
             multiplier = self.context_modifiers["intensifiers"]["multiplier"]
             modified_valence *= min(2.0, 1.0 + intensifier_count * 0.2)
 
         # 減弱語の検出
-        diminisher_count = 0
-        for word in self.context_modifiers["diminishers"]["words"]:
-            diminisher_count += text.count(word)
+        diminisher_count = modifier_counts["diminishers"]
 
         if diminisher_count > 0:
             multiplier = self.context_modifiers["diminishers"]["multiplier"]
             modified_valence *= max(0.2, multiplier)
 
         # 否定語の検出
-        negator_count = 0
-        for word in self.context_modifiers["negators"]["words"]:
-            negator_count += text.count(word)
+        negator_count = modifier_counts["negators"]
 
         if negator_count % 2 == 1:  # 奇数回の否定
             modified_valence *= -0.8  # 完全な反転ではなく緩和
@@ -272,7 +394,8 @@ class EmotionalValenceTracker:
         # 最近の転換履歴を分析
         if len(recent_reversals) > 0:
             last_reversal_intensity = abs(recent_reversals[-1])
-            avg_recent_intensity = np.mean([abs(r) for r in recent_reversals[-3:]])
+            last_three = recent_reversals[-3:]
+            avg_recent_intensity = sum(map(abs, last_three)) / len(last_three)
         else:
             last_reversal_intensity = 0.0
             avg_recent_intensity = 0.0
@@ -280,13 +403,13 @@ class EmotionalValenceTracker:
         # 転換の頻度と強度のバランスを考慮
         if last_reversal_intensity > 0.8:
             # 大きな転換の後は小さめの変化を推奨
-            suggested_intensity = random.uniform(0.4, 0.6)
+            suggested_intensity = self._draw_uniform(0.4, 0.6)
         elif avg_recent_intensity < 0.5:
             # 最近の転換が弱い場合は強い転換を推奨
-            suggested_intensity = random.uniform(0.8, 1.0)
+            suggested_intensity = self._draw_uniform(0.8, 1.0)
         else:
             # 通常は中程度から強い転換
-            suggested_intensity = random.uniform(0.6, 0.9)
+            suggested_intensity = self._draw_uniform(0.6, 0.9)
 
         # 現在の感情価から逆方向への転換を推奨
         if current_valence > 0.3:
@@ -297,7 +420,7 @@ class EmotionalValenceTracker:
             target_valence = current_valence + suggested_intensity
         else:
             # 中立付近では大きな転換をどちらかの方向へ
-            suggested_direction = random.choice(["positive", "negative"])
+            suggested_direction = "positive" if self._draw_uniform(0.0, 1.0) < 0.5 else "negative"
             multiplier = 1 if suggested_direction == "positive" else -1
             target_valence = suggested_intensity * multiplier
 
@@ -313,6 +436,18 @@ class EmotionalValenceTracker:
             "confidence": self._calculate_suggestion_confidence(recent_reversals),
         }
 
+    def _draw_uniform(self, low: float, high: float) -> float:
+        """[low, high) の一様乱数をバッファから取り出す"""
+
+        if self._uniform_index >= len(self._uniform_buffer):
+            self._uniform_buffer = self._rng.random(64)
+            self._uniform_index = 0
+
+        value = float(self._uniform_buffer[self._uniform_index])
+        self._uniform_index += 1
+
+        return low + (high - low) * value
+
     def _suggest_reversal_type(self, current: float, target: float) -> str:
         """転換タイプを提案"""
 
@@ -334,7 +469,8 @@ class EmotionalValenceTracker:
             return 0.5  # データ不足
 
         # 最近の転換のパターンを分析
-        variance = np.var(recent_reversals)
+        mean = sum(recent_reversals) / len(recent_reversals)
+        variance = sum((r - mean) ** 2 for r in recent_reversals) / len(recent_reversals)
         trend_consistency = self._analyze_trend_consistency(recent_reversals)
 
         # 適度な変動と一貫性があるほど信頼度が高い
@@ -366,20 +502,24 @@ class EmotionalValenceTracker:
         if not self.valence_history:
             return {"error": "感情価履歴が空です"}
 
-        history_array = np.array(self.valence_history)
+        count = self._valence_count
+        variance = self._valence_m2 / count
+        neutral_count = count - self._positive_count - self._negative_count
 
         return {
-            "mean_valence": float(np.mean(history_array)),
-            "valence_variance": float(np.var(history_array)),
-            "valence_std": float(np.std(history_array)),
-            "min_valence": float(np.min(history_array)),
-            "max_valence": float(np.max(history_array)),
-            "range": float(np.max(history_array) - np.min(history_array)),
-            "positive_ratio": float(np.sum(history_array > 0) / len(history_array)),
-            "negative_ratio": float(np.sum(history_array < 0) / len(history_array)),
-            "neutral_ratio": float(np.sum(history_array == 0) / len(history_array)),
-            "emotional_events_count": len(self.emotional_events),
-            "high_intensity_events": len([e for e in self.emotional_events if e.intensity > 0.8]),
+            "mean_valence": self._valence_mean,
+            "valence_variance": variance,
+            "valence_std": math.sqrt(variance),
+            "min_valence": self._valence_min,
+            "max_valence": self._valence_max,
+            "range": self._valence_max - self._valence_min,
+            "positive_ratio": self._positive_count / count,
+            "negative_ratio": self._negative_count / count,
+            "neutral_ratio": neutral_count / count,
+            "emotional_events_count": self._event_count,
+            "high_intensity_events": int(
+                np.count_nonzero(self._event_intensities[: self._event_count] > 0.8)
+            ),
         }
 
     def get_moving_average(self, window_size: int | None = None) -> list[float]:
@@ -391,9 +531,12 @@ class EmotionalValenceTracker:
         if len(self.valence_history) < window_size:
             return self.valence_history.copy()
 
-        moving_avg = []
-        for i in range(window_size - 1, len(self.valence_history)):
-            window = self.valence_history[i - window_size + 1 : i + 1]
-            moving_avg.append(sum(window) / window_size)
+        # 累積和の差分で各窓の合計をO(N)で求める
+        cumulative = np.cumsum(
+            np.insert(np.asarray(self.valence_history, dtype=np.float64), 0, 0.0)
+        )
+        moving_avg: list[float] = (
+            (cumulative[window_size:] - cumulative[:-window_size]) / window_size
+        ).tolist()
 
         return moving_avg
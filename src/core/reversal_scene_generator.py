@@ -3,12 +3,22 @@
 感情的転換を含むシーンを自動生成
 """
 
+import asyncio
+import hashlib
+import json
 import random
-from dataclasses import dataclass
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
 
 class SceneType(Enum):
@@ -21,100 +31,315 @@ class SceneType(Enum):
     REVELATION_SCENE = "revelation_scene"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SceneTemplate:
     """シーンテンプレート"""
 
     setup: str
     turning_point: str
     aftermath: str
-    emotional_beats: list[str]
-    required_elements: list[str]
+    emotional_beats: tuple[str, ...]
+    required_elements: tuple[str, ...]
+
+
+@dataclass(slots=True)
+class SceneBeat:
+    """シーンビート"""
+
+    sequence: int
+    emotion: str
+    target_valence: float
+    narrative_function: str
+    techniques: list[str]
+
+
+# シーンテンプレート（全インスタンスで共有する不変データ）
+_SCENE_TEMPLATES: Mapping[str, SceneTemplate] = MappingProxyType(
+    {
+        "classic_peripeteia": SceneTemplate(
+            setup="勝利の祝宴、権力の頂点、栄光の瞬間",
+            turning_point="隠された真実の発覚、致命的な過ちの露見、信頼する者の裏切り",
+            aftermath="全ての崩壊、失墜、孤立無援",
+            emotional_beats=("高揚", "困惑", "理解", "絶望", "受容"),
+            required_elements=(
+                "権力の象徴",
+                "信頼関係",
+                "隠された真実",
+                "破滅の予兆",
+            ),
+        ),
+        "false_defeat": SceneTemplate(
+            setup="絶望的な包囲、最後の抵抗、全てが失われた状況",
+            turning_point="予期せぬ援軍、隠された力の覚醒、奇跡的な発見",
+            aftermath="形勢逆転、新たな希望、力の再編",
+            emotional_beats=("絶望", "諦め", "微かな光", "驚愕", "歓喜"),
+            required_elements=(
+                "圧倒的劣勢",
+                "隠された同盟者",
+                "力の源",
+                "逆転の契機",
+            ),
+        ),
+        "betrayal_cascade": SceneTemplate(
+            setup="信頼関係の確認、絆の深まり、安心感",
+            turning_point="第一の裏切り、さらなる背信、連鎖的な崩壊",
+            aftermath="完全な孤立、信頼の喪失、世界観の転覆",
+            emotional_beats=("信頼", "疑念", "衝撃", "怒り", "虚無"),
+            required_elements=(
+                "重要な人間関係",
+                "秘密の動機",
+                "連鎖反応",
+                "最後の砦",
+            ),
+        ),
+        "pyrrhic_victory": SceneTemplate(
+            setup="最終決戦、勝利への道筋、目標の達成",
+            turning_point="勝利の代償の発覚、失ったものの大きさ、空虚な達成",
+            aftermath="勝利の空しさ、代償への直面、新たな責任",
+            emotional_beats=("決意", "奮闘", "勝利", "代償の理解", "空虚"),
+            required_elements=("重大な目標", "犠牲", "勝利の瞬間", "代償の重さ"),
+        ),
+        "recognition_scene": SceneTemplate(
+            setup="謎の状況、断片的な情報、混乱した現実",
+            turning_point="真実の開示、認識の転換、現実の再構築",
+            aftermath="新たな理解、世界観の変化、使命の明確化",
+            emotional_beats=("困惑", "探求", "発見", "驚愕", "受容"),
+            required_elements=("隠された真実", "証拠", "証人", "転換点"),
+        ),
+    }
+)
+
+# 感情的転換の技法
+_REVERSAL_TECHNIQUES: Mapping[str, str] = MappingProxyType(
+    {
+        "dramatic_irony": "読者は知っているが登場人物は知らない情報の活用",
+        "misdirection": "読者の注意を別の場所に向けて真実を隠す",
+        "red_herring": "偽の手がかりで読者を誤導",
+        "revelation": "隠されていた重要な情報の開示",
+        "role_reversal": "敵と味方、強者と弱者の立場の逆転",
+        "temporal_shift": "時間の非線形性を活用した驚き",
+    }
+)
+
+# ハイファンタジー特有の要素
+_FANTASY_ELEMENTS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "magic_system": ("古代魔法", "禁じられた呪文", "魔法の代償", "魔力の源"),
+        "mythical_beings": ("ドラゴン", "不死者", "精霊", "古き神々"),
+        "artifacts": ("伝説の剣", "禁断の書", "預言の石", "封印の鍵"),
+        "prophecies": ("古い予言", "神託", "運命の糸", "星の導き"),
+        "realms": ("異次元", "精霊界", "死者の国", "時の狭間"),
+    }
+)
+
+# 感覚的詳細（高強度用の全量と、通常用に各感覚2件へ絞ったもの）
+_SENSORY_FULL: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "visual": ("血の色が変わる瞬間", "光が急に陰る", "表情が凍りつく"),
+        "auditory": (
+            "静寂が雷鳴のように響く",
+            "心臓の鼓動が異常に大きく聞こえる",
+            "遠くで鐘が不吉に鳴る",
+        ),
+        "tactile": (
+            "冷たい汗が背中を流れる",
+            "手が震えて制御できない",
+            "足の力が抜ける",
+        ),
+    }
+)
+_SENSORY_SHORT: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {sense: details[:2] for sense, details in _SENSORY_FULL.items()}
+)
+
+# これを超える強度ではファンタジー要素と感覚的詳細を増やす
+_HIGH_INTENSITY_THRESHOLD = 0.8
+
+# シーンキャッシュのキー（転換タイプ, 強度帯, 高強度か, 文脈ダイジェスト）
+_SceneCacheKey = tuple[str, float, bool, str]
+
+# LLM 用の固定システムプロンプト（プロバイダ側のプロンプトキャッシュが効くよう、
+# シーンごとに変わる情報は含めず毎回同一のバイト列にする）
+_STATIC_SYSTEM_PROMPT = "\n\n".join(
+    (
+        "あなたはハイファンタジー小説の作家です。"
+        "ユーザーが渡すシーン設計(JSON)に従い、感情的転換を含むシーン本文を日本語で執筆してください。",
+        "## 転換テンプレート\n"
+        + json.dumps(
+            {name: asdict(template) for name, template in _SCENE_TEMPLATES.items()},
+            ensure_ascii=False,
+            sort_keys=True,
+            indent=2,
+        ),
+        "## 転換の技法\n"
+        + json.dumps(dict(_REVERSAL_TECHNIQUES), ensure_ascii=False, sort_keys=True, indent=2),
+        "## ファンタジー要素\n"
+        + json.dumps(dict(_FANTASY_ELEMENTS), ensure_ascii=False, sort_keys=True, indent=2),
+    )
+)
+
+# 時間帯と天候の組み合わせごとの雰囲気
+_ATMOSPHERES: Mapping[tuple[str, str], str] = MappingProxyType(
+    {
+        ("朝", "晴れ"): "希望に満ちた明るさ",
+        ("夜", "嵐"): "不吉な予感と緊張",
+        ("夕暮れ", "曇り"): "憂鬱で不安定",
+        ("深夜", "霧"): "神秘的で不気味",
+    }
+)
+
+# 転換の強度を示す語（1回の走査でまとめて数える）
+_INTENSITY_INDICATORS: tuple[str, ...] = (
+    "絶望",
+    "衝撃",
+    "驚愕",
+    "裏切り",
+    "破滅",
+    "奇跡",
+    "救済",
+    "真実",
+)
+_INTENSITY_RE = re.compile("|".join(map(re.escape, _INTENSITY_INDICATORS)))
+
+# 登場人物ごとの対話プロンプトの書式
+_DIALOGUE_TEMPLATES: tuple[str, ...] = (
+    "{c}の内心の動揺を表現する独白",
+    "{c}が真実に直面する瞬間の言葉",
+    "{c}の価値観が揺らぐ瞬間の表現",
+)
+
+# シーンテキストの書式（キャラクターの変化は行ブロックとして差し込む）
+_SCENE_TEXT_FORMAT = (
+    "【設定】{setup}\n"
+    "場所: {location}\n"
+    "雰囲気: {atmosphere}\n"
+    "\n【転換点】{turning_point}\n"
+    "\n【余波】{aftermath}"
+    "{character_block}\n"
+    "\n【感覚的詳細】\n"
+    "視覚: {visual}\n"
+    "聴覚: {auditory}"
+)
+
+
+@lru_cache(maxsize=256)
+def _beat_function(position: int, total_beats: int) -> str:
+    """ビート位置から物語的機能を求める（純粋関数のためメモ化）"""
+
+    if position == 0:
+        return "状況設定・感情的基盤の確立"
+    elif position < total_beats // 2:
+        return "緊張の構築・転換への準備"
+    elif position == total_beats // 2:
+        return "転換点・クライマックス"
+    elif position < total_beats - 1:
+        return "余波の展開・新状況の理解"
+    else:
+        return "新しい平衡・次への準備"
+
+
+@lru_cache(maxsize=256)
+def _atmosphere(time_of_day: str, weather: str) -> str:
+    """時間帯と天候から雰囲気を求める"""
+
+    return _ATMOSPHERES.get((time_of_day, weather), "緊張感のある静寂")
+
+
+@lru_cache(maxsize=256)
+def _character_arc_type(role: str, reversal_type: str) -> str | None:
+    """役割と転換タイプからアークタイプを求める"""
+
+    if role == "protagonist":
+        if reversal_type == "classic_peripeteia":
+            return "英雄の転落"
+        elif reversal_type == "false_defeat":
+            return "絶望からの復活"
+        elif reversal_type == "recognition_scene":
+            return "真実への覚醒"
+    elif role == "antagonist":
+        return "敵の一時的勝利" if reversal_type == "classic_peripeteia" else "敵の敗北"
+    else:
+        return "立場の変化"
+
+
+def _final_emotional_state(target_valence: float) -> str:
+    """目標感情価から最終感情状態を求める"""
+
+    if target_valence > 0.5:
+        return "希望・決意"
+    elif target_valence < -0.5:
+        return "絶望・怒り"
+    else:
+        return "混乱・探求"
+
+
+@lru_cache(maxsize=256)
+def _character_key_moments(reversal_type: str) -> tuple[str, ...]:
+    """転換タイプからキャラクターの重要な瞬間を求める"""
+
+    if reversal_type == "betrayal_cascade":
+        return ("裏切りの発覚", "信頼の崩壊", "孤立の受容")
+    elif reversal_type == "false_defeat":
+        return ("最後の抵抗", "援軍の到着", "希望の復活")
+    elif reversal_type == "recognition_scene":
+        return ("疑問の浮上", "証拠の発見", "真実の受容")
+
+    return ()
+
+
+@lru_cache(maxsize=512)
+def _intensity_score(scene_text: str) -> int:
+    """シーンテキスト中の強度指標語の出現数（同一テキストは再走査しない）"""
+
+    return len(_INTENSITY_RE.findall(scene_text))
+
+
+@lru_cache(maxsize=1024)
+def _dialogue_prompts_for(char_name: str) -> tuple[str, ...]:
+    """登場人物1人分の対話プロンプトを作成（同じ名前は再利用）"""
+
+    return tuple(template.format(c=char_name) for template in _DIALOGUE_TEMPLATES)
 
 
 class ReversalSceneGenerator:
     """感情的転換を含むシーンを自動生成"""
 
-    def __init__(self, llm: BaseChatModel | None = None):
-        self.scene_templates = {
-            "classic_peripeteia": SceneTemplate(
-                setup="勝利の祝宴、権力の頂点、栄光の瞬間",
-                turning_point="隠された真実の発覚、致命的な過ちの露見、信頼する者の裏切り",
-                aftermath="全ての崩壊、失墜、孤立無援",
-                emotional_beats=["高揚", "困惑", "理解", "絶望", "受容"],
-                required_elements=[
-                    "権力の象徴",
-                    "信頼関係",
-                    "隠された真実",
-                    "破滅の予兆",
-                ],
-            ),
-            "false_defeat": SceneTemplate(
-                setup="絶望的な包囲、最後の抵抗、全てが失われた状況",
-                turning_point="予期せぬ援軍、隠された力の覚醒、奇跡的な発見",
-                aftermath="形勢逆転、新たな希望、力の再編",
-                emotional_beats=["絶望", "諦め", "微かな光", "驚愕", "歓喜"],
-                required_elements=[
-                    "圧倒的劣勢",
-                    "隠された同盟者",
-                    "力の源",
-                    "逆転の契機",
-                ],
-            ),
-            "betrayal_cascade": SceneTemplate(
-                setup="信頼関係の確認、絆の深まり、安心感",
-                turning_point="第一の裏切り、さらなる背信、連鎖的な崩壊",
-                aftermath="完全な孤立、信頼の喪失、世界観の転覆",
-                emotional_beats=["信頼", "疑念", "衝撃", "怒り", "虚無"],
-                required_elements=[
-                    "重要な人間関係",
-                    "秘密の動機",
-                    "連鎖反応",
-                    "最後の砦",
-                ],
-            ),
-            "pyrrhic_victory": SceneTemplate(
-                setup="最終決戦、勝利への道筋、目標の達成",
-                turning_point="勝利の代償の発覚、失ったものの大きさ、空虚な達成",
-                aftermath="勝利の空しさ、代償への直面、新たな責任",
-                emotional_beats=["決意", "奮闘", "勝利", "代償の理解", "空虚"],
-                required_elements=["重大な目標", "犠牲", "勝利の瞬間", "代償の重さ"],
-            ),
-            "recognition_scene": SceneTemplate(
-                setup="謎の状況、断片的な情報、混乱した現実",
-                turning_point="真実の開示、認識の転換、現実の再構築",
-                aftermath="新たな理解、世界観の変化、使命の明確化",
-                emotional_beats=["困惑", "探求", "発見", "驚愕", "受容"],
-                required_elements=["隠された真実", "証拠", "証人", "転換点"],
-            ),
-        }
+    def __init__(
+        self,
+        llm: BaseChatModel | None = None,
+        cache_size: int = 256,
+        cache_ttl: float = 3600.0,
+        seed: int | None = None,
+    ):
+        self.scene_templates = _SCENE_TEMPLATES
 
         # 感情的転換の技法
-        self.reversal_techniques = {
-            "dramatic_irony": "読者は知っているが登場人物は知らない情報の活用",
-            "misdirection": "読者の注意を別の場所に向けて真実を隠す",
-            "red_herring": "偽の手がかりで読者を誤導",
-            "revelation": "隠されていた重要な情報の開示",
-            "role_reversal": "敵と味方、強者と弱者の立場の逆転",
-            "temporal_shift": "時間の非線形性を活用した驚き",
-        }
+        self.reversal_techniques = _REVERSAL_TECHNIQUES
 
         # ハイファンタジー特有の要素
-        self.fantasy_elements = {
-            "magic_system": ["古代魔法", "禁じられた呪文", "魔法の代償", "魔力の源"],
-            "mythical_beings": ["ドラゴン", "不死者", "精霊", "古き神々"],
-            "artifacts": ["伝説の剣", "禁断の書", "預言の石", "封印の鍵"],
-            "prophecies": ["古い予言", "神託", "運命の糸", "星の導き"],
-            "realms": ["異次元", "精霊界", "死者の国", "時の狭間"],
-        }
+        self.fantasy_elements = _FANTASY_ELEMENTS
 
         self.llm = llm
 
+        # インスタンス専用の乱数生成器（グローバルな random の状態を共有しない）
+        self._rng = random.Random(seed)
+
+        # 生成済みシーンのキャッシュ（キー -> (格納時刻, シーンテキスト)、LRU + TTL で破棄）
+        self._scene_cache: OrderedDict[_SceneCacheKey, tuple[float, str]] = OrderedDict()
+        self._scene_cache_size = cache_size
+        self._scene_cache_ttl = cache_ttl
+
     async def generate_reversal_scene(
         self, context: dict[str, Any], reversal_spec: dict[str, Any]
     ) -> str:
         """指定された転換を含むシーンを生成"""
 
+        # 同等の依頼（転換タイプ・強度帯・文脈が一致）は生成済みシーンを再利用
+        cache_key = self._scene_cache_key(context, reversal_spec)
+        cached_scene = self._get_cached_scene(cache_key)
+        if cached_scene is not None:
+            return cached_scene
+
         # テンプレートの選択
         template = self._select_scene_template(reversal_spec["reversal_type"])
 
@@ -129,11 +354,90 @@ class ReversalSceneGenerator:
         # 実際のシーン生成
         scene_text = await self._generate_scene_text(scene_design)
 
-        # 感情的転換の強度チェック
-        if not await self._verify_reversal_intensity(scene_text, reversal_spec):
-            scene_text = await self._intensify_reversal(scene_text, reversal_spec)
+        if self.llm is not None:
+            # 強度の目標は設計と一緒に LLM に渡している。キーワード数による検証と
+            # 強化項目の追記はテンプレート本文向けのため、LLM の本文はそのまま使う
+            scene = scene_text
+        else:
+            # 感情的転換の強度チェックと強化版の生成を並行して行い、検証結果で採否を決める
+            is_intense_enough, intensified_text = await asyncio.gather(
+                self._verify_reversal_intensity(scene_text, reversal_spec),
+                self._intensify_reversal(scene_text, reversal_spec),
+            )
+            scene = scene_text if is_intense_enough else intensified_text
+
+        self._store_cached_scene(cache_key, scene)
+
+        return scene
+
+    def _scene_cache_key(
+        self, context: dict[str, Any], reversal_spec: dict[str, Any]
+    ) -> _SceneCacheKey:
+        """キャッシュキー（転換タイプ, 強度帯, 高強度か, 文脈ダイジェスト）を作成"""
+
+        reversal_type = reversal_spec.get("reversal_type", "classic_peripeteia")
+        intensity = float(reversal_spec.get("intensity", 0.5))
+        intensity_bucket = round(intensity, 1)
+        # 強度帯 0.8 は閾値をまたぐため、要素数と感覚的詳細が変わる高強度かどうかも区別する
+        is_high_intensity = intensity > _HIGH_INTENSITY_THRESHOLD
+
+        # 強度以外の仕様と文脈は正規化したJSONのハッシュで比較する
+        spec_rest = {k: v for k, v in reversal_spec.items() if k != "intensity"}
+        canonical = json.dumps(
+            [context, spec_rest], sort_keys=True, ensure_ascii=False, default=str
+        )
+        digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+        return reversal_type, intensity_bucket, is_high_intensity, digest
+
+    def _get_cached_scene(self, key: _SceneCacheKey) -> str | None:
+        """キャッシュからシーンを取得（期限切れは破棄）"""
+
+        entry = self._scene_cache.get(key)
+        if entry is None:
+            return None
 
-        return scene_text
+        stored_at, scene = entry
+        if time.monotonic() - stored_at > self._scene_cache_ttl:
+            del self._scene_cache[key]
+            return None
+
+        self._scene_cache.move_to_end(key)
+        return scene
+
+    def _store_cached_scene(self, key: _SceneCacheKey, scene: str) -> None:
+        """シーンをキャッシュに格納（上限超過時は最も古く使われたものを破棄）"""
+
+        if self._scene_cache_size <= 0:
+            return
+
+        self._scene_cache[key] = (time.monotonic(), scene)
+        self._scene_cache.move_to_end(key)
+        while len(self._scene_cache) > self._scene_cache_size:
+            self._scene_cache.popitem(last=False)
+
+    async def generate_reversal_scenes(
+        self,
+        jobs: list[tuple[dict[str, Any], dict[str, Any]]],
+        max_concurrency: int = 32,
+    ) -> list[str]:
+        """
+        複数の転換シーンをまとめて生成する。
+
+        Args:
+            jobs: (context, reversal_spec) の組のリスト。
+            max_concurrency: 同時に実行する生成処理の上限。
+
+        Returns:
+            入力と同じ順序で並んだシーンテキストのリスト。
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _generate(context: dict[str, Any], reversal_spec: dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.generate_reversal_scene(context, reversal_spec)
+
+        return await asyncio.gather(*(_generate(context, spec) for context, spec in jobs))
 
     def _select_scene_template(self, reversal_type: str) -> SceneTemplate:
         """転換タイプに応じたテンプレートを選択"""
@@ -149,10 +453,12 @@ class ReversalSceneGenerator:
 
         # 転換の強度に応じて要素の数を決定
         intensity = reversal_spec.get("intensity", 0.5)
-        num_elements = 2 if intensity > 0.8 else 1
+        num_elements = 2 if intensity > _HIGH_INTENSITY_THRESHOLD else 1
 
         for category, elements in self.fantasy_elements.items():
-            selected_elements[category] = random.sample(elements, min(num_elements, len(elements)))
+            selected_elements[category] = self._rng.sample(
+                elements, min(num_elements, len(elements))
+            )
 
         return selected_elements
 
@@ -165,65 +471,64 @@ class ReversalSceneGenerator:
     ) -> dict[str, Any]:
         """シーンの詳細構造を設計"""
 
+        characters = self._normalize_characters(context.get("characters", []))
+
         return {
             "template": template,
             "context": context,
             "reversal_spec": reversal_spec,
             "fantasy_elements": fantasy_elements,
+            "normalized_characters": characters,
             "scene_beats": self._create_scene_beats(template, reversal_spec),
-            "character_arcs": self._design_character_arcs(context, reversal_spec),
+            "character_arcs": self._design_character_arcs(characters, reversal_spec),
             "setting_details": self._design_setting(context, fantasy_elements),
-            "dialogue_prompts": self._create_dialogue_prompts(template, context),
+            "dialogue_prompts": self._create_dialogue_prompts(template, characters),
             "sensory_details": self._design_sensory_elements(reversal_spec),
         }
 
     def _create_scene_beats(
         self, template: SceneTemplate, reversal_spec: dict[str, Any]
-    ) -> list[dict[str, Any]]:
+    ) -> list[SceneBeat]:
         """シーンビートを作成"""
 
-        beats = []
         emotional_arc = reversal_spec.get("emotional_arc", template.emotional_beats)
-
-        for i, (beat_emotion, template_beat) in enumerate(
-            zip(emotional_arc, template.emotional_beats, strict=False)
-        ):
-            beat = {
-                "sequence": i + 1,
-                "emotion": template_beat,
-                "target_valence": (beat_emotion if isinstance(beat_emotion, float) else 0.0),
-                "narrative_function": self._determine_beat_function(i, len(emotional_arc)),
-                "techniques": self._select_techniques_for_beat(i, reversal_spec),
-            }
-            beats.append(beat)
-
-        return beats
+        total_beats = len(emotional_arc)
+
+        # 技法の転換点は仕様に明示された感情アークの長さから決まる
+        turning_point = len(reversal_spec.get("emotional_arc", ())) // 2
+
+        return [
+            SceneBeat(
+                sequence=i + 1,
+                emotion=template_beat,
+                target_valence=(beat_emotion if isinstance(beat_emotion, float) else 0.0),
+                narrative_function=self._determine_beat_function(i, total_beats),
+                techniques=self._select_techniques_for_beat(i, reversal_spec, turning_point),
+            )
+            for i, (beat_emotion, template_beat) in enumerate(
+                zip(emotional_arc, template.emotional_beats, strict=False)
+            )
+        ]
 
     def _determine_beat_function(self, position: int, total_beats: int) -> str:
         """ビートの物語的機能を決定"""
 
-        if position == 0:
-            return "状況設定・感情的基盤の確立"
-        elif position < total_beats // 2:
-            return "緊張の構築・転換への準備"
-        elif position == total_beats // 2:
-            return "転換点・クライマックス"
-        elif position < total_beats - 1:
-            return "余波の展開・新状況の理解"
-        else:
-            return "新しい平衡・次への準備"
+        return _beat_function(position, total_beats)
 
     def _select_techniques_for_beat(
-        self, position: int, reversal_spec: dict[str, Any]
+        self, position: int, reversal_spec: dict[str, Any], turning_point: int | None = None
     ) -> list[str]:
         """ビートに適した技法を選択"""
 
         reversal_type = reversal_spec.get("reversal_type", "classic_peripeteia")
         techniques = []
 
+        if turning_point is None:
+            turning_point = len(reversal_spec.get("emotional_arc", [])) // 2
+
         if position == 0:  # 設定ビート
             techniques.append("dramatic_irony")
-        elif position == len(reversal_spec.get("emotional_arc", [])) // 2:  # 転換点
+        elif position == turning_point:  # 転換点
             if reversal_type == "classic_peripeteia":
                 techniques.extend(["revelation", "role_reversal"])
             elif reversal_type == "false_defeat":
@@ -233,33 +538,33 @@ class ReversalSceneGenerator:
 
         return techniques
 
+    @staticmethod
+    def _normalize_characters(characters: Any) -> dict[str, dict[str, Any]]:
+        """登場人物の指定（名前のリストまたは辞書）を名前→情報の辞書にそろえる"""
+
+        if isinstance(characters, dict):
+            return characters
+        if isinstance(characters, list):
+            return {
+                char_name: {"role": "supporter", "current_emotion": "中立"}
+                for char_name in characters
+            }
+        return {}
+
     def _design_character_arcs(
-        self, context: dict[str, Any], reversal_spec: dict[str, Any]
+        self, characters: dict[str, dict[str, Any]], reversal_spec: dict[str, Any]
     ) -> dict[str, dict[str, str]]:
         """キャラクターアークを設計"""
 
-        characters = context.get("characters", [])
         arcs = {}
 
-        # charactersがリストの場合の処理
-        if isinstance(characters, list):
-            for char_name in characters:
-                char_info = {"role": "supporter", "current_emotion": "中立"}
-                arcs[char_name] = {
-                    "initial_state": char_info.get("current_emotion", "中立"),
-                    "arc_type": self._determine_character_arc_type(char_info, reversal_spec),
-                    "final_state": self._calculate_final_emotional_state(char_info, reversal_spec),
-                    "key_moments": self._identify_character_key_moments(char_info, reversal_spec),
-                }
-        # charactersが辞書の場合の処理
-        elif isinstance(characters, dict):
-            for char_name, char_info in characters.items():
-                arcs[char_name] = {
-                    "initial_state": char_info.get("current_emotion", "中立"),
-                    "arc_type": self._determine_character_arc_type(char_info, reversal_spec),
-                    "final_state": self._calculate_final_emotional_state(char_info, reversal_spec),
-                    "key_moments": self._identify_character_key_moments(char_info, reversal_spec),
-                }
+        for char_name, char_info in characters.items():
+            arcs[char_name] = {
+                "initial_state": char_info.get("current_emotion", "中立"),
+                "arc_type": self._determine_character_arc_type(char_info, reversal_spec),
+                "final_state": self._calculate_final_emotional_state(char_info, reversal_spec),
+                "key_moments": self._identify_character_key_moments(char_info, reversal_spec),
+            }
 
         return arcs
 
@@ -268,51 +573,26 @@ class ReversalSceneGenerator:
     ) -> str:
         """キャラクターのアークタイプを決定"""
 
-        role = char_info.get("role", "supporter")
-        reversal_type = reversal_spec.get("reversal_type", "classic_peripeteia")
-
-        if role == "protagonist":
-            if reversal_type == "classic_peripeteia":
-                return "英雄の転落"
-            elif reversal_type == "false_defeat":
-                return "絶望からの復活"
-            elif reversal_type == "recognition_scene":
-                return "真実への覚醒"
-        elif role == "antagonist":
-            return "敵の一時的勝利" if reversal_type == "classic_peripeteia" else "敵の敗北"
-        else:
-            return "立場の変化"
+        return _character_arc_type(
+            char_info.get("role", "supporter"),
+            reversal_spec.get("reversal_type", "classic_peripeteia"),
+        )
 
     def _calculate_final_emotional_state(
         self, char_info: dict[str, Any], reversal_spec: dict[str, Any]
     ) -> str:
         """最終感情状態を計算"""
 
-        target_valence = reversal_spec.get("target_state", 0.0)
-
-        if target_valence > 0.5:
-            return "希望・決意"
-        elif target_valence < -0.5:
-            return "絶望・怒り"
-        else:
-            return "混乱・探求"
+        return _final_emotional_state(reversal_spec.get("target_state", 0.0))
 
     def _identify_character_key_moments(
         self, char_info: dict[str, Any], reversal_spec: dict[str, Any]
     ) -> list[str]:
         """キャラクターの重要な瞬間を特定"""
 
-        moments = []
-        reversal_type = reversal_spec.get("reversal_type", "classic_peripeteia")
-
-        if reversal_type == "betrayal_cascade":
-            moments.extend(["裏切りの発覚", "信頼の崩壊", "孤立の受容"])
-        elif reversal_type == "false_defeat":
-            moments.extend(["最後の抵抗", "援軍の到着", "希望の復活"])
-        elif reversal_type == "recognition_scene":
-            moments.extend(["疑問の浮上", "証拠の発見", "真実の受容"])
-
-        return moments
+        return list(
+            _character_key_moments(reversal_spec.get("reversal_type", "classic_peripeteia"))
+        )
 
     def _design_setting(
         self, context: dict[str, Any], fantasy_elements: dict[str, list[str]]
@@ -332,17 +612,7 @@ class ReversalSceneGenerator:
     def _determine_atmosphere(self, context: dict[str, Any]) -> str:
         """雰囲気を決定"""
 
-        time_of_day = context.get("time", "夜")
-        weather = context.get("weather", "嵐")
-
-        atmospheres = {
-            ("朝", "晴れ"): "希望に満ちた明るさ",
-            ("夜", "嵐"): "不吉な予感と緊張",
-            ("夕暮れ", "曇り"): "憂鬱で不安定",
-            ("深夜", "霧"): "神秘的で不気味",
-        }
-
-        return atmospheres.get((time_of_day, weather), "緊張感のある静寂")
+        return _atmosphere(context.get("time", "夜"), context.get("weather", "嵐"))
 
     def _create_environmental_mood(self, context: dict[str, Any]) -> str:
         """環境的ムードを作成"""
@@ -354,95 +624,75 @@ class ReversalSceneGenerator:
             "古い建物が過去の罪を証言する",
         ]
 
-        return random.choice(mood_elements)
+        return self._rng.choice(mood_elements)
 
     def _create_dialogue_prompts(
-        self, template: SceneTemplate, context: dict[str, Any]
+        self, template: SceneTemplate, characters: dict[str, dict[str, Any]]
     ) -> list[str]:
         """対話プロンプトを作成"""
 
-        prompts = []
-        characters = context.get("characters", [])
-
-        # charactersがリストの場合
-        if isinstance(characters, list):
-            char_names = characters
-        # charactersが辞書の場合
-        elif isinstance(characters, dict):
-            char_names = list(characters.keys())
-        else:
-            char_names = []
-
-        for char_name in char_names:
-            prompts.extend(
-                [
-                    f"{char_name}の内心の動揺を表現する独白",
-                    f"{char_name}が真実に直面する瞬間の言葉",
-                    f"{char_name}の価値観が揺らぐ瞬間の表現",
-                ]
-            )
-
-        return prompts
+        return [prompt for char_name in characters for prompt in _dialogue_prompts_for(char_name)]
 
-    def _design_sensory_elements(self, reversal_spec: dict[str, Any]) -> dict[str, list[str]]:
+    def _design_sensory_elements(
+        self, reversal_spec: dict[str, Any]
+    ) -> Mapping[str, tuple[str, ...]]:
         """感覚的詳細を設計"""
 
-        intensity = reversal_spec.get("intensity", 0.5)
-
-        details = {
-            "visual": ["血の色が変わる瞬間", "光が急に陰る", "表情が凍りつく"],
-            "auditory": [
-                "静寂が雷鳴のように響く",
-                "心臓の鼓動が異常に大きく聞こえる",
-                "遠くで鐘が不吉に鳴る",
-            ],
-            "tactile": [
-                "冷たい汗が背中を流れる",
-                "手が震えて制御できない",
-                "足の力が抜ける",
-            ],
+        # 強度に応じて詳細の数を調整
+        if reversal_spec.get("intensity", 0.5) > _HIGH_INTENSITY_THRESHOLD:
+            return _SENSORY_FULL
+        return _SENSORY_SHORT
+
+    def _build_scene_messages(self, scene_design: dict[str, Any]) -> list[BaseMessage]:
+        """LLM に渡すメッセージを作成（固定部分はシステム、シーン固有部分は末尾のユーザー側）"""
+
+        dynamic_part = {
+            "template": asdict(scene_design["template"]),
+            "reversal_spec": scene_design["reversal_spec"],
+            "scene_beats": [asdict(beat) for beat in scene_design["scene_beats"]],
+            "character_arcs": scene_design["character_arcs"],
+            "setting_details": scene_design["setting_details"],
+            "dialogue_prompts": scene_design["dialogue_prompts"],
+            "sensory_details": dict(scene_design["sensory_details"]),
         }
 
-        # 強度に応じて詳細の数を調整
-        if intensity > 0.8:
-            return details
-        else:
-            return {k: v[:2] for k, v in details.items()}
+        return [
+            SystemMessage(content=_STATIC_SYSTEM_PROMPT),
+            HumanMessage(content=json.dumps(dynamic_part, ensure_ascii=False, default=str)),
+        ]
 
     async def _generate_scene_text(self, scene_design: dict[str, Any]) -> str:
         """実際のシーンテキストを生成"""
 
-        # この部分は実際にはLLMを使用する
-        # ここでは構造化されたテンプレートを使用
+        if self.llm is not None:
+            # 固定のシステムプロンプトに続けてシーン設計を渡し、LLM に本文を書かせる
+            response = await self.llm.ainvoke(self._build_scene_messages(scene_design))
+            return str(response.content)
 
-        template = scene_design["template"]
-
-        scene_parts = []
-
-        # 設定部分
-        scene_parts.append(f"【設定】{template.setup}")
-        scene_parts.append(f"場所: {scene_design['setting_details']['location']}")
-        scene_parts.append(f"雰囲気: {scene_design['setting_details']['atmosphere']}")
-
-        # 転換点部分
-        scene_parts.append(f"\n【転換点】{template.turning_point}")
+        # LLM が無い場合は構造化されたテンプレートを使用
 
-        # 余波部分
-        scene_parts.append(f"\n【余波】{template.aftermath}")
+        template = scene_design["template"]
+        setting = scene_design["setting_details"]
+        sensory = scene_design["sensory_details"]
 
         # キャラクターの反応
-        for char_name, arc in scene_design["character_arcs"].items():
-            scene_parts.append(
-                f"\n{char_name}の変化: {arc['initial_state']} → {arc['final_state']}"
-            )
-
-        # 感覚的詳細
-        sensory = scene_design["sensory_details"]
-        scene_parts.append("\n【感覚的詳細】")
-        scene_parts.append(f"視覚: {', '.join(sensory['visual'][:2])}")
-        scene_parts.append(f"聴覚: {', '.join(sensory['auditory'][:2])}")
+        character_block = "".join(
+            f"\n\n{char_name}の変化: {arc['initial_state']} → {arc['final_state']}"
+            for char_name, arc in scene_design["character_arcs"].items()
+        )
 
-        return "\n".join(scene_parts)
+        return _SCENE_TEXT_FORMAT.format_map(
+            {
+                "setup": template.setup,
+                "location": setting["location"],
+                "atmosphere": setting["atmosphere"],
+                "turning_point": template.turning_point,
+                "aftermath": template.aftermath,
+                "character_block": character_block,
+                "visual": ", ".join(sensory["visual"][:2]),
+                "auditory": ", ".join(sensory["auditory"][:2]),
+            }
+        )
 
     async def _verify_reversal_intensity(
         self, scene_text: str, reversal_spec: dict[str, Any]
@@ -452,18 +702,7 @@ class ReversalSceneGenerator:
         target_intensity = reversal_spec.get("intensity", 0.8)
 
         # 簡単な強度測定（実際にはより sophisticated な分析を行う）
-        intensity_indicators = [
-            "絶望",
-            "衝撃",
-            "驚愕",
-            "裏切り",
-            "破滅",
-            "奇跡",
-            "救済",
-            "真実",
-        ]
-
-        intensity_score = sum(scene_text.count(indicator) for indicator in intensity_indicators)
+        intensity_score = _intensity_score(scene_text)
         estimated_intensity = min(1.0, intensity_score * 0.2)
 
         return estimated_intensity >= target_intensity * 0.8
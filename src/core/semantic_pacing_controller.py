@@ -3,8 +3,10 @@
 物語の意味的な速度と距離を制御
 """
 
-import math
-import random
+import asyncio
+import re
+import threading
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -22,30 +24,107 @@ class NarrativeSpeed(Enum):
     VERY_FAST = "very_fast"
 
 
-@dataclass
+# 意味的位置の次元（SemanticPosition.vec の並び順）
+DOMAINS: tuple[str, ...] = (
+    "physical",
+    "emotional",
+    "philosophical",
+    "political",
+    "spiritual",
+    "mythological",
+)
+_DOMAIN_INDEX: dict[str, int] = {domain: i for i, domain in enumerate(DOMAINS)}
+
+# 最も変化の大きい次元ごとの橋渡しの種類
+_BRIDGE_TYPES: dict[str, str] = {
+    "physical": "環境の変化・移動",
+    "emotional": "内面の変化・心境の推移",
+    "philosophical": "価値観の変化・思索",
+    "political": "権力関係の変化・状況の展開",
+    "spiritual": "信念の変化・神秘的体験",
+    "mythological": "過去の記憶・伝説の想起",
+}
+
+# 章の主要な次元ごとの焦点の説明
+_FOCUS_DESCRIPTIONS: dict[str, str] = {
+    "physical": "行動とアドベンチャー",
+    "emotional": "人間関係と感情の展開",
+    "philosophical": "価値観と世界観の探求",
+    "political": "権力と社会構造",
+    "spiritual": "信仰と超自然的要素",
+    "mythological": "伝説と古代の謎",
+}
+
+
+@dataclass(init=False, eq=False, slots=True)
 class SemanticPosition:
-    """意味的位置"""
+    """意味的位置（6次元の座標を1本のベクトルで保持）"""
 
-    physical: float
-    emotional: float
-    philosophical: float
-    political: float
-    spiritual: float
-    mythological: float
+    vec: np.ndarray
+
+    def __init__(
+        self,
+        physical: float = 0.0,
+        emotional: float = 0.0,
+        philosophical: float = 0.0,
+        political: float = 0.0,
+        spiritual: float = 0.0,
+        mythological: float = 0.0,
+    ) -> None:
+        self.vec = np.array(
+            (physical, emotional, philosophical, political, spiritual, mythological),
+            dtype=np.float64,
+        )
+
+    @classmethod
+    def from_vector(cls, vec: np.ndarray) -> "SemanticPosition":
+        """DOMAINS 順のベクトルから位置を作成"""
+        position = cls.__new__(cls)
+        position.vec = np.asarray(vec, dtype=np.float64)
+        return position
+
+    @classmethod
+    def from_rows(
+        cls, rows: np.ndarray, dims: tuple[str, ...] = DOMAINS
+    ) -> list["SemanticPosition"]:
+        """(位置数, 次元数) の配列から位置をまとめて作成（各行は dims 順の座標）"""
+        rows = np.asarray(rows, dtype=np.float64)
+        if dims != DOMAINS:
+            # dims 順の列を DOMAINS 順に並べ替える（指定の無い次元は 0.0）
+            reordered = np.zeros((rows.shape[0], len(DOMAINS)))
+            reordered[:, [_DOMAIN_INDEX[dim] for dim in dims]] = rows
+            rows = reordered
+        else:
+            rows = np.ascontiguousarray(rows)
+
+        # 1つの配列の行ビューを各位置のベクトルとし、__init__ の引数展開を省く
+        positions = []
+        for row in rows:
+            position = cls.__new__(cls)
+            position.vec = row
+            positions.append(position)
+        return positions
+
+    def __getattr__(self, name: str) -> float:
+        # 各次元は名前でも参照できるようにする（例: position.emotional）
+        index = _DOMAIN_INDEX.get(name)
+        if index is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return float(self.vec[index])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SemanticPosition):
+            return NotImplemented
+        return bool(np.array_equal(self.vec, other.vec))
+
+    __hash__ = None  # type: ignore[assignment]
 
     def distance_to(self, other: "SemanticPosition") -> float:
         """他の位置との距離を計算"""
-        return math.sqrt(
-            (self.physical - other.physical) ** 2
-            + (self.emotional - other.emotional) ** 2
-            + (self.philosophical - other.philosophical) ** 2
-            + (self.political - other.political) ** 2
-            + (self.spiritual - other.spiritual) ** 2
-            + (self.mythological - other.mythological) ** 2
-        )
+        return float(np.sqrt(((self.vec - other.vec) ** 2).sum()))
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticJourney:
     """意味的な旅程"""
 
@@ -110,6 +189,30 @@ class SemanticPacingController:
             },
         }
 
+        # 概念語は小文字化したものを事前に用意しておく
+        self._concepts_lower = {
+            domain: tuple(concept.lower() for concept in domain_info["concepts"])
+            for domain, domain_info in self.semantic_domains.items()
+        }
+
+        # 全領域の概念語を1回の走査で数える正規表現（先読み内でキャプチャし、
+        # 語ごとの str.count と同じ件数になるようにする）
+        all_concepts = sorted(
+            {concept for concepts in self._concepts_lower.values() for concept in concepts},
+            key=len,
+            reverse=True,
+        )
+        self._concept_first_chars = frozenset(concept[0] for concept in all_concepts)
+        self._concept_pattern = re.compile(f"(?=({'|'.join(map(re.escape, all_concepts))}))")
+
+        self._rng = np.random.default_rng()
+
+        # (イベントタイプ, 説明文) ごとの意味的座標のキャッシュ
+        self._position_cache: dict[tuple[str, str], tuple[float, ...]] = {}
+        self._position_cache_size: int = 1024
+        # 原稿の走査はワーカースレッドで行われるため、キャッシュの更新は排他する
+        self._position_cache_lock = threading.Lock()
+
         self.current_position = SemanticPosition(0, 0, 0, 0, 0, 0)
         self.trajectory_history: list[SemanticPosition] = []
 
@@ -156,7 +259,7 @@ class SemanticPacingController:
         # 各イベントの意味的位置を計算
         event_positions = []
         for event in chronological_events:
-            position = await self._calculate_semantic_position(event)
+            position = self._calculate_semantic_position(event)
             event_positions.append(
                 {
                     "event": event,
@@ -166,44 +269,87 @@ class SemanticPacingController:
             )
 
         # 意味的距離を最大化する再配列
-        optimized_sequence = await self._optimize_semantic_journey(event_positions)
+        optimized_sequence = self._optimize_semantic_journey(event_positions)
 
         # フラッシュバックとフラッシュフォワードの配置
-        temporal_structure = await self._design_temporal_complexity(optimized_sequence)
+        temporal_structure = self._design_temporal_complexity(optimized_sequence)
 
         # 複数視点の交錯
-        multi_pov_structure = await self._weave_perspectives(temporal_structure)
+        multi_pov_structure = self._weave_perspectives(temporal_structure)
 
         # 意味的軌跡の計算
         semantic_trajectory = self._calculate_semantic_trajectory(multi_pov_structure)
 
+        # 章ごとの密度と焦点は後段の複数の処理で使うため一度だけ計算する
+        chapters = multi_pov_structure["chapters"]
+        densities = {id(ch): self._calculate_chapter_semantic_density(ch) for ch in chapters}
+        focuses = {id(ch): self._determine_chapter_focus(ch) for ch in chapters}
+
         # ペーシングプロファイルの作成
-        pacing_profile = await self._create_pacing_profile(multi_pov_structure)
+        pacing_profile = self._create_pacing_profile(multi_pov_structure, densities=densities)
 
-        return {
+        result = {
             "structure": multi_pov_structure,
             "semantic_trajectory": semantic_trajectory,
             "pacing_profile": pacing_profile,
             "total_distance": semantic_trajectory["total_distance"],
-            "complexity_score": self._calculate_complexity_score(multi_pov_structure),
-            "reading_path": self._design_reading_path(multi_pov_structure),
+            "complexity_score": self._calculate_complexity_score(
+                multi_pov_structure, densities=densities
+            ),
+            "reading_path": self._design_reading_path(
+                multi_pov_structure, densities=densities, focuses=focuses
+            ),
         }
 
-    async def _calculate_semantic_position(self, event: dict[str, Any]) -> SemanticPosition:
+        # 計算用の座標行列は返り値に含めない（JSON にそのまま書き出せる形にする）
+        for chapter in chapters:
+            chapter.pop("_pos_matrix", None)
+
+        return result
+
+    def _calculate_semantic_position(self, event: dict[str, Any]) -> SemanticPosition:
         """イベントの意味的位置を計算"""
 
-        event_text = event.get("description", "")
+        description = event.get("description", "")
         event_type = event.get("type", "action")
 
+        # 同じ説明文の再評価は計算済みの座標を使う
+        cache_key = (event_type, description)
+        coordinates = self._position_cache.get(cache_key)
+        if coordinates is None:
+            coordinates = self._compute_position_coordinates(description.lower(), event_type)
+
+            with self._position_cache_lock:
+                if len(self._position_cache) >= self._position_cache_size:
+                    # 最も古いエントリを捨てる（dictは挿入順を保持する）
+                    self._position_cache.pop(next(iter(self._position_cache)), None)
+                self._position_cache[cache_key] = coordinates
+
+        return SemanticPosition(*coordinates)
+
+    def _calculate_semantic_positions(self, texts: list[str]) -> list[SemanticPosition]:
+        """複数のテキストの意味的位置をまとめて計算"""
+
+        return [self._calculate_semantic_position({"description": text}) for text in texts]
+
+    def _compute_position_coordinates(self, text_lower: str, event_type: str) -> tuple[float, ...]:
+        """小文字化済みテキストから DOMAINS 順の意味的座標を計算"""
+
+        # 概念語の先頭文字を1つも含まないテキストは走査せずに原点とする
+        if self._concept_first_chars.isdisjoint(text_lower):
+            return (0.0,) * len(DOMAINS)
+
+        # 各概念の出現頻度を計算
+        hits = Counter(match.group(1) for match in self._concept_pattern.finditer(text_lower))
+
         positions = {}
 
         for domain, domain_info in self.semantic_domains.items():
             score = 0.0
             concept_count = 0
 
-            # 各概念の出現頻度を計算
-            for concept in domain_info["concepts"]:
-                count = event_text.lower().count(concept.lower())
+            for concept in self._concepts_lower[domain]:
+                count = hits[concept]
                 if count > 0:
                     weight = domain_info["weights"].get(event_type, 0.5)
                     score += count * weight
@@ -218,9 +364,9 @@ class SemanticPacingController:
             else:
                 positions[domain] = 0.0
 
-        return SemanticPosition(**positions)
+        return tuple(positions[domain] for domain in DOMAINS)
 
-    async def _optimize_semantic_journey(
+    def _optimize_semantic_journey(
         self, event_positions: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
         """意味的な旅を最適化"""
@@ -229,89 +375,79 @@ class SemanticPacingController:
             return []
 
         optimized_sequence = []
-        remaining_events = event_positions.copy()
+
+        # 全イベントの位置を (イベント数, 次元数) の行列にまとめ、選択済みはマスクで除外する
+        # （座標は [-1, 1] に収まるため、候補の距離計算は float32 で十分）
+        position_matrix = np.stack([event["position"].vec for event in event_positions]).astype(
+            np.float32
+        )
+        remaining = np.ones(len(event_positions), dtype=bool)
+
+        # 時系列制約スコアは各イベントに1回だけまとめて割り当てる
+        # （制約があまり強くならないよう 0.3〜0.7 の範囲）
+        temporal_scores = self._rng.uniform(0.3, 0.7, size=len(event_positions))
 
         # 最初のイベントを選択（通常は時系列順）
-        current_event = min(remaining_events, key=lambda e: e["timestamp"])
+        current_index = min(
+            range(len(event_positions)), key=lambda i: event_positions[i]["timestamp"]
+        )
+        remaining[current_index] = False
+        current_event = event_positions[current_index]
         optimized_sequence.append(current_event)
-        remaining_events.remove(current_event)
 
         current_position = current_event["position"]
+        current_vector = position_matrix[current_index]
 
-        while remaining_events:
+        for _ in range(len(event_positions) - 1):
             # 次のイベントを選択（意味的距離を考慮）
-            next_event = self._select_next_event(current_position, remaining_events)
+            # 二乗距離を einsum で求め、平方根は候補全体に1回だけ適用する
+            # （距離スコアは 0.5 を頂点とする非単調関数なので平方根自体は省けない）
+            offsets = position_matrix - current_vector
+            distances = np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
+            next_index = self._select_next_event(distances, temporal_scores, remaining)
+            remaining[next_index] = False
+            next_event = event_positions[next_index]
 
             # 距離が大きすぎる場合は橋渡しイベントを作成
-            distance = current_position.distance_to(next_event["position"])
-            if distance > 0.7:
-                bridge_event = await self._create_bridge_event(
-                    current_position, next_event["position"]
-                )
+            if distances[next_index] > 0.7:
+                bridge_event = self._create_bridge_event(current_position, next_event["position"])
                 if bridge_event:
                     optimized_sequence.append(bridge_event)
 
             optimized_sequence.append(next_event)
-            remaining_events.remove(next_event)
             current_position = next_event["position"]
+            current_vector = position_matrix[next_index]
 
         return optimized_sequence
 
     def _select_next_event(
-        self, current_position: SemanticPosition, candidates: list[dict[str, Any]]
-    ) -> dict[str, Any]:
-        """次のイベントを選択"""
+        self, distances: np.ndarray, temporal_scores: np.ndarray, remaining: np.ndarray
+    ) -> int:
+        """次のイベントを選択（remaining が真の候補のうち総合スコア最大のものの添字を返す）"""
 
         # 意味的距離と時系列的制約を考慮
-        best_event = None
-        best_score = float("-inf")
-
-        for event in candidates:
-            event_position = event["position"]
-
-            # 意味的距離スコア（適度な距離を好む）
-            distance = current_position.distance_to(event_position)
-            distance_score = self._calculate_distance_score(distance)
-
-            # 時系列制約スコア
-            temporal_score = self._calculate_temporal_score(event)
+        distance_scores = self._calculate_distance_score(distances)
 
-            # 総合スコア
-            total_score = distance_score * 0.7 + temporal_score * 0.3
+        # 総合スコア（選択済みは除外し、同点の場合は先の候補を優先）
+        total_scores = distance_scores * 0.7 + temporal_scores * 0.3
+        total_scores[~remaining] = -np.inf
 
-            if total_score > best_score:
-                best_score = total_score
-                best_event = event
+        return int(total_scores.argmax())
 
-        return best_event if best_event else candidates[0]
-
-    def _calculate_distance_score(self, distance: float) -> float:
+    def _calculate_distance_score(self, distance: np.ndarray) -> np.ndarray:
         """距離スコアを計算（適度な距離を好む）"""
 
         optimal_distance = 0.5
-        deviation = abs(distance - optimal_distance)
-        return max(0.0, 1.0 - deviation * 2)
-
-    def _calculate_temporal_score(self, event: dict[str, Any]) -> float:
-        """時系列スコアを計算"""
-
-        # 時系列の制約があまり強くならないように調整
-        return random.uniform(0.3, 0.7)
+        deviation = np.abs(distance - optimal_distance)
+        return np.maximum(0.0, 1.0 - deviation * 2)
 
-    async def _create_bridge_event(
+    def _create_bridge_event(
         self, start_pos: SemanticPosition, end_pos: SemanticPosition
     ) -> dict[str, Any] | None:
         """橋渡しイベントを作成"""
 
         # 中間位置を計算
-        mid_position = SemanticPosition(
-            (start_pos.physical + end_pos.physical) / 2,
-            (start_pos.emotional + end_pos.emotional) / 2,
-            (start_pos.philosophical + end_pos.philosophical) / 2,
-            (start_pos.political + end_pos.political) / 2,
-            (start_pos.spiritual + end_pos.spiritual) / 2,
-            (start_pos.mythological + end_pos.mythological) / 2,
-        )
+        mid_position = SemanticPosition.from_vector((start_pos.vec + end_pos.vec) * 0.5)
 
         # 橋渡しの種類を決定
         bridge_type = self._determine_bridge_type(start_pos, end_pos)
@@ -333,39 +469,22 @@ class SemanticPacingController:
         """橋渡しの種類を決定"""
 
         # 最も変化の大きい次元を特定
-        changes = {
-            "physical": abs(end_pos.physical - start_pos.physical),
-            "emotional": abs(end_pos.emotional - start_pos.emotional),
-            "philosophical": abs(end_pos.philosophical - start_pos.philosophical),
-            "political": abs(end_pos.political - start_pos.political),
-            "spiritual": abs(end_pos.spiritual - start_pos.spiritual),
-            "mythological": abs(end_pos.mythological - start_pos.mythological),
-        }
+        changes = np.abs(end_pos.vec - start_pos.vec)
+        max_change_domain = DOMAINS[int(changes.argmax())]
 
-        max_change_domain = max(changes.keys(), key=lambda k: changes[k])
+        return _BRIDGE_TYPES.get(max_change_domain, "状況の推移")
 
-        bridge_types = {
-            "physical": "環境の変化・移動",
-            "emotional": "内面の変化・心境の推移",
-            "philosophical": "価値観の変化・思索",
-            "political": "権力関係の変化・状況の展開",
-            "spiritual": "信念の変化・神秘的体験",
-            "mythological": "過去の記憶・伝説の想起",
-        }
-
-        return bridge_types.get(max_change_domain, "状況の推移")
-
-    async def _design_temporal_complexity(self, sequence: list[dict[str, Any]]) -> dict[str, Any]:
+    def _design_temporal_complexity(self, sequence: list[dict[str, Any]]) -> dict[str, Any]:
         """時間的複雑性を設計"""
 
         # フラッシュバックの配置
-        flashbacks = await self._place_flashbacks(sequence)
+        flashbacks = self._place_flashbacks(sequence)
 
         # フラッシュフォワードの配置
-        flashforwards = await self._place_flashforwards(sequence)
+        flashforwards = self._place_flashforwards(sequence)
 
         # 並行時間軸の設計
-        parallel_timelines = await self._create_parallel_timelines(sequence)
+        parallel_timelines = self._create_parallel_timelines(sequence)
 
         return {
             "main_sequence": sequence,
@@ -377,7 +496,7 @@ class SemanticPacingController:
             ),
         }
 
-    async def _place_flashbacks(self, sequence: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _place_flashbacks(self, sequence: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """フラッシュバックを配置"""
 
         flashbacks = []
@@ -395,7 +514,7 @@ class SemanticPacingController:
 
         return flashbacks[:3]  # 最大3つまで
 
-    async def _place_flashforwards(self, sequence: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _place_flashforwards(self, sequence: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """フラッシュフォワードを配置"""
 
         # フラッシュフォワードは控えめに使用
@@ -412,9 +531,7 @@ class SemanticPacingController:
 
         return flashforwards
 
-    async def _create_parallel_timelines(
-        self, sequence: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
+    def _create_parallel_timelines(self, sequence: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """並行時間軸を作成"""
 
         parallel_timelines = []
@@ -447,7 +564,7 @@ class SemanticPacingController:
 
         return min(1.0, complexity / 3.0)
 
-    async def _weave_perspectives(self, temporal_structure: dict[str, Any]) -> dict[str, Any]:
+    def _weave_perspectives(self, temporal_structure: dict[str, Any]) -> dict[str, Any]:
         """複数視点を交錯させる"""
 
         main_sequence = temporal_structure["main_sequence"]
@@ -469,6 +586,8 @@ class SemanticPacingController:
                 "primary_perspective": "主人公",
                 "events": chapter_events,
                 "perspective_shifts": [],
+                # 後段の密度・焦点・強度・軌跡の計算で共有する座標行列
+                "_pos_matrix": self._event_position_matrix(chapter_events),
             }
 
             # 視点の切り替え
@@ -488,64 +607,66 @@ class SemanticPacingController:
         """意味的軌跡を計算"""
 
         chapters = structure.get("chapters", [])
-        positions = []
-        total_distance = 0.0
-
-        prev_position = None
-
-        for chapter in chapters:
-            for event in chapter.get("events", []):
-                position = event.get("position")
-                if position:
-                    positions.append(position)
-
-                    if prev_position:
-                        distance = prev_position.distance_to(position)
-                        total_distance += distance
+        positions = [
+            event["position"]
+            for chapter in chapters
+            for event in chapter.get("events", [])
+            if event.get("position")
+        ]
+
+        position_matrix = (
+            np.concatenate([self._chapter_position_matrix(chapter) for chapter in chapters])
+            if chapters
+            else np.empty((0, len(DOMAINS)))
+        )
 
-                    prev_position = position
+        # 連続する位置間の距離をまとめて計算
+        if len(positions) > 1:
+            steps = np.linalg.norm(np.diff(position_matrix, axis=0), axis=1)
+            total_distance = float(steps.sum())
+            average_step_distance = float(steps.mean())
+        else:
+            total_distance = 0.0
+            average_step_distance = 0.0
 
         return {
             "positions": positions,
             "total_distance": total_distance,
-            "average_step_distance": total_distance / max(1, len(positions) - 1),
-            "semantic_coverage": self._calculate_semantic_coverage(positions),
+            "average_step_distance": average_step_distance,
+            "semantic_coverage": self._calculate_semantic_coverage(position_matrix),
         }
 
-    def _calculate_semantic_coverage(self, positions: list[SemanticPosition]) -> dict[str, float]:
-        """意味的カバレッジを計算"""
+    def _calculate_semantic_coverage(self, position_matrix: np.ndarray) -> dict[str, float]:
+        """意味的カバレッジを計算（position_matrix は (位置数, 次元数) の配列）"""
 
-        if not positions:
+        if not len(position_matrix):
             return {}
 
+        ranges = position_matrix.max(axis=0) - position_matrix.min(axis=0)
+        variances = position_matrix.var(axis=0)
+
         coverage = {}
 
-        for domain in [
-            "physical",
-            "emotional",
-            "philosophical",
-            "political",
-            "spiritual",
-            "mythological",
-        ]:
-            values = [getattr(pos, domain) for pos in positions]
+        for i, domain in enumerate(DOMAINS):
             coverage[domain] = {
-                "range": max(values) - min(values),
-                "variance": float(np.var(values)),
-                "coverage_ratio": (max(values) - min(values)) / 2.0,  # -1から1の範囲での割合
+                "range": float(ranges[i]),
+                "variance": float(variances[i]),
+                "coverage_ratio": float(ranges[i]) / 2.0,  # -1から1の範囲での割合
             }
 
         return coverage
 
-    async def _create_pacing_profile(self, structure: dict[str, Any]) -> dict[int, NarrativeSpeed]:
-        """ペーシングプロファイルを作成"""
+    def _create_pacing_profile(
+        self, structure: dict[str, Any], densities: dict[int, float] | None = None
+    ) -> dict[int, NarrativeSpeed]:
+        """ペーシングプロファイルを作成（densities は id(章) -> 意味的密度 の計算済み値）"""
 
         chapters = structure.get("chapters", [])
         pacing_profile = {}
 
         for i, chapter in enumerate(chapters):
             # 章の意味的密度を計算
-            semantic_density = self._calculate_chapter_semantic_density(chapter)
+            semantic_density = self._chapter_density(chapter, densities)
 
             # 感情的強度を計算
             emotional_intensity = self._calculate_chapter_emotional_intensity(chapter)
@@ -562,6 +683,29 @@ class SemanticPacingController:
 
         return pacing_profile
 
+    def _event_position_matrix(self, events: list[dict[str, Any]]) -> np.ndarray:
+        """位置を持つイベントの座標を (イベント数, 次元数) の行列にまとめる"""
+
+        vectors = [event["position"].vec for event in events if event.get("position")]
+        return np.stack(vectors) if vectors else np.empty((0, len(DOMAINS)))
+
+    def _chapter_density(
+        self, chapter: dict[str, Any], densities: dict[int, float] | None
+    ) -> float:
+        """計算済みの密度があればそれを使い、なければ計算する"""
+
+        if densities is not None and id(chapter) in densities:
+            return densities[id(chapter)]
+        return self._calculate_chapter_semantic_density(chapter)
+
+    def _chapter_position_matrix(self, chapter: dict[str, Any]) -> np.ndarray:
+        """章の座標行列（_weave_perspectives で付与済みならそれを使う）"""
+
+        position_matrix = chapter.get("_pos_matrix")
+        if position_matrix is None:
+            position_matrix = self._event_position_matrix(chapter.get("events", []))
+        return position_matrix
+
     def _calculate_chapter_semantic_density(self, chapter: dict[str, Any]) -> float:
         """章の意味的密度を計算"""
 
@@ -569,44 +713,24 @@ class SemanticPacingController:
         if not events:
             return 0.0
 
-        total_complexity = 0.0
-        for event in events:
-            position = event.get("position")
-            if position:
-                # 複数の次元にまたがるほど密度が高い
-                non_zero_dimensions = sum(
-                    1
-                    for attr in [
-                        "physical",
-                        "emotional",
-                        "philosophical",
-                        "political",
-                        "spiritual",
-                        "mythological",
-                    ]
-                    if abs(getattr(position, attr)) > 0.3
-                )
-                total_complexity += non_zero_dimensions / 6.0
+        # 複数の次元にまたがるほど密度が高い
+        position_matrix = self._chapter_position_matrix(chapter)
+        non_zero_dimensions = np.count_nonzero(np.abs(position_matrix) > 0.3)
 
-        return total_complexity / len(events)
+        return non_zero_dimensions / (len(DOMAINS) * len(events))
 
     def _calculate_chapter_emotional_intensity(self, chapter: dict[str, Any]) -> float:
         """章の感情的強度を計算"""
 
-        events = chapter.get("events", [])
-        if not events:
+        if not chapter.get("events"):
             return 0.0
 
-        max_emotional_value = 0.0
-        for event in events:
-            position = event.get("position")
-            if position:
-                emotional_magnitude = abs(position.emotional)
-                max_emotional_value = max(max_emotional_value, emotional_magnitude)
-
-        return max_emotional_value
+        emotional_values = self._chapter_position_matrix(chapter)[:, _DOMAIN_INDEX["emotional"]]
+        return float(np.abs(emotional_values).max()) if len(emotional_values) else 0.0
 
-    def _calculate_complexity_score(self, structure: dict[str, Any]) -> float:
+    def _calculate_complexity_score(
+        self, structure: dict[str, Any], densities: dict[int, float] | None = None
+    ) -> float:
         """構造の複雑性スコアを計算"""
 
         chapters = structure.get("chapters", [])
@@ -626,24 +750,31 @@ class SemanticPacingController:
         )
 
         # 意味的複雑性
-        semantic_complexity = np.mean(
-            [self._calculate_chapter_semantic_density(chapter) for chapter in chapters]
-        )
+        chapter_densities = [self._chapter_density(chapter, densities) for chapter in chapters]
+        semantic_complexity = sum(chapter_densities) / len(chapter_densities)
 
         return (perspective_diversity + temporal_complexity + semantic_complexity) / 3.0
 
-    def _design_reading_path(self, structure: dict[str, Any]) -> list[dict[str, Any]]:
+    def _design_reading_path(
+        self,
+        structure: dict[str, Any],
+        densities: dict[int, float] | None = None,
+        focuses: dict[int, str] | None = None,
+    ) -> list[dict[str, Any]]:
         """読書経路を設計"""
 
         chapters = structure.get("chapters", [])
         reading_path = []
 
         for chapter in chapters:
+            focus = self._chapter_focus(chapter, focuses)
             path_element = {
                 "chapter": chapter["chapter_number"],
-                "primary_focus": self._determine_chapter_focus(chapter),
-                "reading_instructions": self._create_reading_instructions(chapter),
-                "expected_duration": self._estimate_reading_duration(chapter),
+                "primary_focus": focus,
+                "reading_instructions": self._create_reading_instructions(chapter, focus=focus),
+                "expected_duration": self._estimate_reading_duration(
+                    chapter, density=self._chapter_density(chapter, densities)
+                ),
             }
             reading_path.append(path_element)
 
@@ -657,34 +788,25 @@ class SemanticPacingController:
             return "transitional"
 
         # 最も強い意味的次元を特定
-        domain_strengths = dict.fromkeys(
-            ["physical", "emotional", "philosophical", "political", "spiritual", "mythological"],
-            0.0,
-        )
+        domain_strengths = np.abs(self._chapter_position_matrix(chapter)).sum(axis=0)
+        primary_domain = DOMAINS[int(domain_strengths.argmax())]
 
-        for event in events:
-            position = event.get("position")
-            if position:
-                for domain in domain_strengths:
-                    domain_strengths[domain] += abs(getattr(position, domain))
-
-        primary_domain = max(domain_strengths.keys(), key=lambda k: domain_strengths[k])
-
-        focus_descriptions = {
-            "physical": "行動とアドベンチャー",
-            "emotional": "人間関係と感情の展開",
-            "philosophical": "価値観と世界観の探求",
-            "political": "権力と社会構造",
-            "spiritual": "信仰と超自然的要素",
-            "mythological": "伝説と古代の謎",
-        }
+        return _FOCUS_DESCRIPTIONS.get(primary_domain, "総合的展開")
 
-        return focus_descriptions.get(primary_domain, "総合的展開")
+    def _chapter_focus(self, chapter: dict[str, Any], focuses: dict[int, str] | None) -> str:
+        """計算済みの焦点があればそれを使い、なければ決定する"""
 
-    def _create_reading_instructions(self, chapter: dict[str, Any]) -> str:
+        if focuses is not None and id(chapter) in focuses:
+            return focuses[id(chapter)]
+        return self._determine_chapter_focus(chapter)
+
+    def _create_reading_instructions(
+        self, chapter: dict[str, Any], focus: str | None = None
+    ) -> str:
         """読書指示を作成"""
 
-        focus = self._determine_chapter_focus(chapter)
+        if focus is None:
+            focus = self._determine_chapter_focus(chapter)
         has_perspective_shifts = bool(chapter.get("perspective_shifts"))
 
         if has_perspective_shifts:
@@ -692,11 +814,15 @@ class SemanticPacingController:
         else:
             return f"{focus}を中心に物語の展開を追う"
 
-    def _estimate_reading_duration(self, chapter: dict[str, Any]) -> str:
+    def _estimate_reading_duration(
+        self, chapter: dict[str, Any], density: float | None = None
+    ) -> str:
         """読書時間を推定"""
 
         events_count = len(chapter.get("events", []))
-        complexity = self._calculate_chapter_semantic_density(chapter)
+        complexity = (
+            density if density is not None else self._calculate_chapter_semantic_density(chapter)
+        )
 
         if events_count > 4 or complexity > 0.7:
             return "長時間（じっくりと）"
@@ -772,7 +898,7 @@ class SemanticPacingController:
         原稿全体を分析し、意味的な総移動距離を計算する。
 
         Args:
-            manuscript: 章ごとのテキストを格納した辞書。
+            manuscript: 章ごとのテキストを章順に格納した辞書。
 
         Returns:
             正規化された意味的総移動距離スコア (0.0 - 1.0)。
@@ -780,18 +906,16 @@ class SemanticPacingController:
         if not manuscript:
             return 0.0
 
-        positions = []
-        sorted_chapters = sorted(manuscript.keys())
-
-        for chapter_key in sorted_chapters:
-            chapter_text = manuscript[chapter_key]
-            position = await self._calculate_semantic_position({"description": chapter_text})
-            positions.append(position)
-
-        total_distance = sum(
-            positions[i].distance_to(positions[i + 1]) for i in range(len(positions) - 1)
+        # 章の並びは辞書の格納順に従う（"chapter_N" の文字列ソートは章番号順にならない）
+        # 章ごとの解析はCPU処理のみなので、イベントループを塞がないようワーカースレッドで実行
+        positions = await asyncio.to_thread(
+            self._calculate_semantic_positions, list(manuscript.values())
         )
 
+        # 連続する章間の距離をまとめて計算（距離のみの用途なので float32 で扱う）
+        position_matrix = np.stack([position.vec for position in positions]).astype(np.float32)
+        total_distance = float(np.linalg.norm(np.diff(position_matrix, axis=0), axis=1).sum())
+
         # 正規化: 1章あたりの最大距離を約2.0と仮定して正規化する
         max_possible_distance = len(positions) * 2.0
         return min(1.0, total_distance / max(1.0, max_possible_distance))
@@ -3,11 +3,26 @@
 複雑な時間構造を設計・実装
 """
 
-import random
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
+# ジャンル推定用のキーワードと対応ジャンル
+_GENRE_KEYWORDS = (
+    ("magic", "fantasy"),
+    ("war", "epic"),
+    ("mystery", "mystery"),
+)
+
+# 敵対者視点イベントの本文（前後の定型句でメインイベントの記述を挟む）
+_ANTAGONIST_VIEW_PREFIX = "敵対者の視点: "
+_ANTAGONIST_VIEW_SUFFIX = "への対応"
+
 
 class TemporalTechnique(Enum):
     """時間操作技法"""
@@ -22,7 +37,106 @@ class TemporalTechnique(Enum):
     CONVERGENT_TIMELINES = "convergent_timelines"
 
 
-@dataclass
+# 時間操作技法の特性
+_TEMPORAL_TECHNIQUES: Mapping[TemporalTechnique, Mapping[str, Any]] = MappingProxyType(
+    {
+        TemporalTechnique.IN_MEDIAS_RES: MappingProxyType(
+            {
+                "description": "物語を中間から始める",
+                "complexity": 0.3,
+                "reader_engagement": 0.8,
+                "suitable_for": ("action", "mystery", "thriller"),
+            }
+        ),
+        TemporalTechnique.FRAME_NARRATIVE: MappingProxyType(
+            {
+                "description": "額縁物語（物語内物語）",
+                "complexity": 0.5,
+                "reader_engagement": 0.6,
+                "suitable_for": ("epic", "historical", "philosophical"),
+            }
+        ),
+        TemporalTechnique.PARALLEL_TIMELINES: MappingProxyType(
+            {
+                "description": "並行する時間軸",
+                "complexity": 0.7,
+                "reader_engagement": 0.9,
+                "suitable_for": ("epic", "multi_character", "complex_plot"),
+            }
+        ),
+        TemporalTechnique.REVERSE_CHRONOLOGY: MappingProxyType(
+            {
+                "description": "逆行する時系列",
+                "complexity": 0.8,
+                "reader_engagement": 0.7,
+                "suitable_for": ("mystery", "tragedy", "revelation"),
+            }
+        ),
+        TemporalTechnique.TIME_LOOPS: MappingProxyType(
+            {
+                "description": "時間のループ構造",
+                "complexity": 0.9,
+                "reader_engagement": 0.8,
+                "suitable_for": ("fantasy", "philosophical", "character_study"),
+            }
+        ),
+        TemporalTechnique.PROPHETIC_VISIONS: MappingProxyType(
+            {
+                "description": "予言的ビジョン",
+                "complexity": 0.4,
+                "reader_engagement": 0.7,
+                "suitable_for": ("fantasy", "epic", "destiny"),
+            }
+        ),
+        TemporalTechnique.NESTED_FLASHBACKS: MappingProxyType(
+            {
+                "description": "入れ子状のフラッシュバック",
+                "complexity": 0.6,
+                "reader_engagement": 0.6,
+                "suitable_for": ("character_development", "mystery", "trauma"),
+            }
+        ),
+        TemporalTechnique.CONVERGENT_TIMELINES: MappingProxyType(
+            {
+                "description": "収束する複数時間軸",
+                "complexity": 0.8,
+                "reader_engagement": 0.9,
+                "suitable_for": ("epic", "climax", "resolution"),
+            }
+        ),
+    }
+)
+
+# スコア計算用に平坦化した技法ごとの数値
+_COMPLEXITY_BY_TECH: Mapping[TemporalTechnique, float] = MappingProxyType(
+    {technique: spec["complexity"] for technique, spec in _TEMPORAL_TECHNIQUES.items()}
+)
+_ENGAGEMENT_BY_TECH: Mapping[TemporalTechnique, float] = MappingProxyType(
+    {technique: spec["reader_engagement"] for technique, spec in _TEMPORAL_TECHNIQUES.items()}
+)
+
+# 物語の各段階での推奨技法
+_STAGE_RECOMMENDATIONS: Mapping[str, tuple[TemporalTechnique, ...]] = MappingProxyType(
+    {
+        "opening": (TemporalTechnique.IN_MEDIAS_RES, TemporalTechnique.PROPHETIC_VISIONS),
+        "development": (
+            TemporalTechnique.PARALLEL_TIMELINES,
+            TemporalTechnique.NESTED_FLASHBACKS,
+        ),
+        "climax": (TemporalTechnique.CONVERGENT_TIMELINES, TemporalTechnique.TIME_LOOPS),
+        "resolution": (TemporalTechnique.FRAME_NARRATIVE, TemporalTechnique.REVERSE_CHRONOLOGY),
+    }
+)
+
+
+@lru_cache(maxsize=64)
+def _technique_values(techniques: tuple[TemporalTechnique, ...]) -> tuple[str, ...]:
+    """技法の組み合わせを文字列値のタプルに変換（組み合わせは少数なのでキャッシュ）"""
+
+    return tuple(technique.value for technique in techniques)
+
+
+@dataclass(slots=True)
 class TemporalEvent:
     """時間的イベント"""
 
@@ -35,7 +149,7 @@ class TemporalEvent:
     reveals: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Timeline:
     """時間軸"""
 
@@ -46,114 +160,80 @@ class Timeline:
     intersection_points: list[int]
 
 
+@dataclass(slots=True)
+class _TimelineArrays:
+    """時間軸イベントの列指向（SoA）表現。時系列順で安定ソート済み"""
+
+    chrono: np.ndarray  # ソート済みの時系列順 (int32)
+    order: np.ndarray  # chrono の各要素に対応する元のイベント位置
+    events: list[TemporalEvent]
+
+    @classmethod
+    def from_timeline(cls, timeline: Timeline) -> "_TimelineArrays":
+        chrono = np.fromiter(
+            (event.chronological_order for event in timeline.events),
+            dtype=np.int32,
+            count=len(timeline.events),
+        )
+        order = np.argsort(chrono, kind="stable")
+        return cls(chrono=chrono[order], order=order, events=timeline.events)
+
+    def events_at(self, chronological_order: int) -> list[TemporalEvent]:
+        """指定した時系列順のイベントを元の並び順で返す"""
+
+        start, stop = np.searchsorted(
+            self.chrono, (chronological_order, chronological_order + 1)
+        ).tolist()
+        return [self.events[k] for k in self.order[start:stop].tolist()]
+
+
 class TemporalStructureDesigner:
     """複雑な時間構造を設計"""
 
-    def __init__(self) -> None:
-        self.temporal_techniques = {
-            TemporalTechnique.IN_MEDIAS_RES: {
-                "description": "物語を中間から始める",
-                "complexity": 0.3,
-                "reader_engagement": 0.8,
-                "suitable_for": ["action", "mystery", "thriller"],
-            },
-            TemporalTechnique.FRAME_NARRATIVE: {
-                "description": "額縁物語（物語内物語）",
-                "complexity": 0.5,
-                "reader_engagement": 0.6,
-                "suitable_for": ["epic", "historical", "philosophical"],
-            },
-            TemporalTechnique.PARALLEL_TIMELINES: {
-                "description": "並行する時間軸",
-                "complexity": 0.7,
-                "reader_engagement": 0.9,
-                "suitable_for": ["epic", "multi_character", "complex_plot"],
-            },
-            TemporalTechnique.REVERSE_CHRONOLOGY: {
-                "description": "逆行する時系列",
-                "complexity": 0.8,
-                "reader_engagement": 0.7,
-                "suitable_for": ["mystery", "tragedy", "revelation"],
-            },
-            TemporalTechnique.TIME_LOOPS: {
-                "description": "時間のループ構造",
-                "complexity": 0.9,
-                "reader_engagement": 0.8,
-                "suitable_for": ["fantasy", "philosophical", "character_study"],
-            },
-            TemporalTechnique.PROPHETIC_VISIONS: {
-                "description": "予言的ビジョン",
-                "complexity": 0.4,
-                "reader_engagement": 0.7,
-                "suitable_for": ["fantasy", "epic", "destiny"],
-            },
-            TemporalTechnique.NESTED_FLASHBACKS: {
-                "description": "入れ子状のフラッシュバック",
-                "complexity": 0.6,
-                "reader_engagement": 0.6,
-                "suitable_for": ["character_development", "mystery", "trauma"],
-            },
-            TemporalTechnique.CONVERGENT_TIMELINES: {
-                "description": "収束する複数時間軸",
-                "complexity": 0.8,
-                "reader_engagement": 0.9,
-                "suitable_for": ["epic", "climax", "resolution"],
-            },
-        }
+    def __init__(self, seed: int | None = None) -> None:
+        self.temporal_techniques = _TEMPORAL_TECHNIQUES
+        self._complexity_by_tech = _COMPLEXITY_BY_TECH
+        self._engagement_by_tech = _ENGAGEMENT_BY_TECH
+
+        # インスタンス専用の乱数生成器（フラッシュバックの遡り幅に使用）
+        self._rng = np.random.default_rng(seed)
 
         # 物語の各段階での推奨技法
-        self.stage_recommendations = {
-            "opening": [
-                TemporalTechnique.IN_MEDIAS_RES,
-                TemporalTechnique.PROPHETIC_VISIONS,
-            ],
-            "development": [
-                TemporalTechnique.PARALLEL_TIMELINES,
-                TemporalTechnique.NESTED_FLASHBACKS,
-            ],
-            "climax": [
-                TemporalTechnique.CONVERGENT_TIMELINES,
-                TemporalTechnique.TIME_LOOPS,
-            ],
-            "resolution": [
-                TemporalTechnique.FRAME_NARRATIVE,
-                TemporalTechnique.REVERSE_CHRONOLOGY,
-            ],
-        }
+        self.stage_recommendations = _STAGE_RECOMMENDATIONS
 
-    async def create_temporal_complexity(self, linear_plot: dict[str, Any]) -> dict[str, Any]:
+    def create_temporal_complexity(self, linear_plot: dict[str, Any]) -> dict[str, Any]:
         """線形プロットを時間的に複雑化"""
 
         # プロットの分析
-        plot_analysis = await self._analyze_linear_plot(linear_plot)
+        plot_analysis = self._analyze_linear_plot(linear_plot)
 
         # 最適な技法の組み合わせを選択
-        selected_techniques = await self._select_optimal_techniques(plot_analysis)
+        selected_techniques = self._select_optimal_techniques(plot_analysis)
 
         # 物語の開始点を決定
-        starting_point = await self._determine_optimal_starting_point(
-            linear_plot, selected_techniques
-        )
+        starting_point = self._determine_optimal_starting_point(linear_plot, selected_techniques)
 
         # 複数時間軸の設計
-        timelines = await self._design_multiple_timelines(linear_plot, selected_techniques)
+        timelines = self._design_multiple_timelines(linear_plot, selected_techniques)
 
         # フラッシュバック構造の設計
-        flashback_structure = await self._design_flashback_structure(linear_plot, timelines)
+        flashback_structure = self._design_flashback_structure(
+            plot_analysis["revelation_points"], timelines
+        )
 
         # 予言的要素の配置
-        prophetic_elements = await self._place_prophetic_elements(linear_plot, selected_techniques)
+        prophetic_elements = self._place_prophetic_elements(linear_plot, selected_techniques)
 
         # 時間軸の収束点を設計
-        convergence_points = await self._design_convergence_points(timelines)
+        convergence_points = self._design_convergence_points(timelines)
 
         # 読書経路の最適化
-        reading_path = await self._optimize_reading_path(
+        reading_path = self._optimize_reading_path(
             timelines, flashback_structure, prophetic_elements, convergence_points
         )
 
         return {
-            "structure_type": [t.value for t in selected_techniques],
+            "structure_type": list(_technique_values(tuple(selected_techniques))),
             "starting_point": starting_point,
             "timelines": timelines,
             "flashback_structure": flashback_structure,
@@ -164,119 +244,127 @@ class TemporalStructureDesigner:
             "estimated_reader_engagement": self._estimate_reader_engagement(selected_techniques),
         }
 
-    async def _analyze_linear_plot(self, linear_plot: dict[str, Any]) -> dict[str, Any]:
+    def _analyze_linear_plot(self, linear_plot: dict[str, Any]) -> dict[str, Any]:
         """線形プロットを分析"""
 
         events = linear_plot.get("events", [])
         characters = linear_plot.get("characters", {})
 
+        scan = self._scan_events(events, characters)
+
         analysis = {
             "event_count": len(events),
             "character_count": len(characters),
-            "plot_complexity": self._assess_plot_complexity(events),
-            "emotional_intensity_curve": self._analyze_emotional_curve(events),
-            "revelation_points": self._identify_revelation_points(events),
-            "character_development_arcs": self._analyze_character_arcs(events, characters),
-            "thematic_elements": self._extract_thematic_elements(events),
+            "plot_complexity": self._assess_plot_complexity(
+                len(events), len(scan["event_types"]), scan["dependencies"], scan["secrets"]
+            ),
+            "emotional_intensity_curve": scan["emotional_curve"],
+            "revelation_points": scan["revelation_points"],
+            "character_development_arcs": scan["character_arcs"],
+            "thematic_elements": list(scan["themes"]),
             "genre_indicators": self._identify_genre_indicators(linear_plot),
         }
 
         return analysis
 
-    def _assess_plot_complexity(self, events: list[dict[str, Any]]) -> float:
-        """プロットの複雑性を評価"""
-
-        # イベントの種類の多様性
-        event_types = {event.get("type", "unknown") for event in events}
-        type_diversity = len(event_types) / 10.0  # 正規化
+    def _scan_events(
+        self, events: list[dict[str, Any]], characters: dict[str, Any]
+    ) -> dict[str, Any]:
+        """イベント列を一度だけ走査して分析に必要な集計値をまとめて求める"""
 
-        # イベント間の依存関係
+        event_types = set()
         dependencies = 0
-        for event in events:
-            dependencies += len(event.get("dependencies", []))
+        secrets = 0
+        emotional_curve = []
+        revelation_flags = []  # type / tags による啓示判定
+        importances = []
+        themes = set()
+        character_arcs = {char_name: [] for char_name in characters}
 
-        dependency_complexity = min(1.0, dependencies / len(events))
+        for event in events:
+            tags = event.get("tags", [])
+            description = event.get("description", "")
+            emotional_impact = event.get("emotional_impact", 0.0)
+            event_type = event.get("type", "unknown")
 
-        # 秘密と謎の数
-        secrets = sum(1 for event in events if "secret" in event.get("tags", []))
-        mystery_factor = min(1.0, secrets / max(1, len(events) * 0.3))
+            event_types.add(event_type)
+            dependencies += len(event.get("dependencies", []))
+            if "secret" in tags:
+                secrets += 1
+            emotional_curve.append(emotional_impact)
+            themes.update(event.get("themes", []))
 
-        return (type_diversity + dependency_complexity + mystery_factor) / 3.0
+            # 啓示判定用の値（type が未指定なら "unknown" なので revelation とは一致しない）
+            revelation_flags.append(event_type == "revelation" or "revelation" in tags)
+            importances.append(event.get("importance", 0))
 
-    def _analyze_emotional_curve(self, events: list[dict[str, Any]]) -> list[float]:
-        """感情曲線を分析"""
+            # キャラクターアーク（イベント側の登場人物から逆引きし、重複登場は一度だけ数える）
+            for char_name in set(event.get("characters", ())):
+                arc_points = character_arcs.get(char_name)
+                if arc_points is not None:
+                    arc_points.append(description)
 
-        curve = []
-        for event in events:
-            emotional_value = event.get("emotional_impact", 0.0)
-            curve.append(emotional_value)
-
-        return curve
-
-    def _identify_revelation_points(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """重要な啓示ポイントを特定"""
-
-        revelations = []
-        for i, event in enumerate(events):
-            if (
-                event.get("type") == "revelation"
-                or "revelation" in event.get("tags", [])
-                or event.get("importance", 0) > 0.7
-            ):
-                revelations.append(
-                    {
-                        "position": i,
-                        "content": event.get("description", ""),
-                        "impact": event.get("emotional_impact", 0.0),
-                        "reveals": event.get("reveals", []),
-                    }
-                )
+        # 啓示ポイントは重要度の閾値判定をまとめてベクトル化して抽出
+        revelation_mask = np.asarray(revelation_flags, dtype=bool) | (
+            np.asarray(importances, dtype=np.float64) > 0.7
+        )
+        revelation_points = [
+            {
+                "position": i,
+                "content": events[i].get("description", ""),
+                "impact": emotional_curve[i],
+                "reveals": events[i].get("reveals", []),
+            }
+            for i in np.flatnonzero(revelation_mask).tolist()
+        ]
 
-        return revelations
+        return {
+            "event_types": event_types,
+            "dependencies": dependencies,
+            "secrets": secrets,
+            "emotional_curve": emotional_curve,
+            "revelation_points": revelation_points,
+            "themes": themes,
+            "character_arcs": character_arcs,
+        }
 
-    def _analyze_character_arcs(
-        self, events: list[dict[str, Any]], characters: dict[str, Any]
-    ) -> dict[str, list[str]]:
-        """キャラクターアークを分析"""
+    def _assess_plot_complexity(
+        self, event_count: int, type_count: int, dependencies: int, secrets: int
+    ) -> float:
+        """プロットの複雑性を評価"""
 
-        arcs = {}
-        for char_name in characters.keys():
-            character_events = [e for e in events if char_name in e.get("characters", [])]
-            arc_points = [e.get("description", "") for e in character_events]
-            arcs[char_name] = arc_points
+        # イベントの種類の多様性
+        type_diversity = type_count / 10.0  # 正規化
 
-        return arcs
+        n = event_count or 1  # イベントが無い場合のゼロ除算を防ぐ
 
-    def _extract_thematic_elements(self, events: list[dict[str, Any]]) -> list[str]:
-        """テーマ要素を抽出"""
+        # イベント間の依存関係
+        dependency_complexity = min(1.0, dependencies / n)
 
-        themes = set()
-        for event in events:
-            themes.update(event.get("themes", []))
+        # 秘密と謎の数
+        mystery_factor = min(1.0, secrets / max(1, n * 0.3))
 
-        return list(themes)
+        return (type_diversity + dependency_complexity + mystery_factor) / 3.0
 
     def _identify_genre_indicators(self, linear_plot: dict[str, Any]) -> list[str]:
         """ジャンル指標を特定"""
 
-        indicators = []
-
-        # 設定やイベントからジャンルを推測
-        if "magic" in str(linear_plot).lower():
-            indicators.append("fantasy")
-        if "war" in str(linear_plot).lower():
-            indicators.append("epic")
-        if "mystery" in str(linear_plot).lower():
-            indicators.append("mystery")
+        # 設定やイベントからジャンルを推測（文字列化と小文字化は一度だけ）
+        plot_text = str(linear_plot).lower()
+        indicators = [genre for keyword, genre in _GENRE_KEYWORDS if keyword in plot_text]
 
         return indicators if indicators else ["general"]
 
-    async def _select_optimal_techniques(
-        self, plot_analysis: dict[str, Any]
-    ) -> list[TemporalTechnique]:
+    def _select_optimal_techniques(self, plot_analysis: dict[str, Any]) -> list[TemporalTechnique]:
         """最適な技法の組み合わせを選択"""
 
-        selected_techniques = []
+        selected_techniques: list[TemporalTechnique] = []
+        selected_set: set[TemporalTechnique] = set()  # 重複判定用
+
+        def select(technique: TemporalTechnique) -> None:
+            if technique not in selected_set:
+                selected_set.add(technique)
+                selected_techniques.append(technique)
 
         complexity = plot_analysis["plot_complexity"]
         genre_indicators = plot_analysis["genre_indicators"]
@@ -284,31 +372,28 @@ class TemporalStructureDesigner:
 
         # 複雑性に基づく基本選択
         if complexity > 0.7:
-            selected_techniques.append(TemporalTechnique.PARALLEL_TIMELINES)
-            selected_techniques.append(TemporalTechnique.CONVERGENT_TIMELINES)
+            select(TemporalTechnique.PARALLEL_TIMELINES)
+            select(TemporalTechnique.CONVERGENT_TIMELINES)
         elif complexity > 0.5:
-            selected_techniques.append(TemporalTechnique.IN_MEDIAS_RES)
-            selected_techniques.append(TemporalTechnique.NESTED_FLASHBACKS)
+            select(TemporalTechnique.IN_MEDIAS_RES)
+            select(TemporalTechnique.NESTED_FLASHBACKS)
         else:
-            selected_techniques.append(TemporalTechnique.IN_MEDIAS_RES)
+            select(TemporalTechnique.IN_MEDIAS_RES)
 
         # ジャンルに基づく追加選択
         for genre in genre_indicators:
             if genre == "fantasy":
-                if TemporalTechnique.PROPHETIC_VISIONS not in selected_techniques:
-                    selected_techniques.append(TemporalTechnique.PROPHETIC_VISIONS)
+                select(TemporalTechnique.PROPHETIC_VISIONS)
             elif genre == "mystery":
-                if TemporalTechnique.REVERSE_CHRONOLOGY not in selected_techniques:
-                    selected_techniques.append(TemporalTechnique.REVERSE_CHRONOLOGY)
+                select(TemporalTechnique.REVERSE_CHRONOLOGY)
 
         # 啓示の数に基づく調整
         if revelation_count > 3:
-            if TemporalTechnique.NESTED_FLASHBACKS not in selected_techniques:
-                selected_techniques.append(TemporalTechnique.NESTED_FLASHBACKS)
+            select(TemporalTechnique.NESTED_FLASHBACKS)
 
         return selected_techniques[:3]  # 最大3つの技法
 
-    async def _determine_optimal_starting_point(
+    def _determine_optimal_starting_point(
         self, linear_plot: dict[str, Any], techniques: list[TemporalTechnique]
     ) -> dict[str, Any]:
         """最適な開始点を決定"""
@@ -330,9 +415,7 @@ class TemporalStructureDesigner:
             return {
                 "technique": "in_medias_res",
                 "starting_event_index": starting_index,
-                "starting_event": (
-                    events[starting_index] if starting_index < len(events) else events[0]
-                ),
+                "starting_event": events[starting_index] if events else None,
                 "justification": "劇的な中間点からの開始で読者の関心を即座に引く",
             }
 
@@ -353,7 +436,7 @@ class TemporalStructureDesigner:
                 "justification": "時系列順の自然な開始",
             }
 
-    async def _design_multiple_timelines(
+    def _design_multiple_timelines(
         self, linear_plot: dict[str, Any], techniques: list[TemporalTechnique]
     ) -> list[Timeline]:
         """複数時間軸を設計"""
@@ -361,13 +444,28 @@ class TemporalStructureDesigner:
         timelines = []
         events = linear_plot.get("events", [])
         characters = linear_plot.get("characters", {})
+        event_count = len(events)
 
-        # メイン時間軸
+        # メイン時間軸（イベントごとのメソッド呼び出しを避けて内包表記で一括変換）
+        # 引数は content, chronological_order, narrative_order（後で調整）, timeline_id,
+        # event_type, dependencies, reveals の順
+        main_events = [
+            TemporalEvent(
+                event.get("description", ""),
+                i,
+                i,
+                "main",
+                event.get("type", "action"),
+                event.get("dependencies", []),
+                event.get("reveals", []),
+            )
+            for i, event in enumerate(events)
+        ]
         main_timeline = Timeline(
             timeline_id="main",
             perspective="主人公",
-            events=[self._convert_to_temporal_event(e, i, "main") for i, e in enumerate(events)],
-            time_range=(0, len(events)),
+            events=main_events,
+            time_range=(0, event_count),
             intersection_points=[],
         )
         timelines.append(main_timeline)
@@ -375,56 +473,41 @@ class TemporalStructureDesigner:
         # 並行時間軸の作成
         if TemporalTechnique.PARALLEL_TIMELINES in techniques:
             # 敵対者の時間軸
-            antagonist_events = await self._create_antagonist_timeline(events, characters)
+            antagonist_events = self._create_antagonist_timeline(events)
             antagonist_timeline = Timeline(
                 timeline_id="antagonist",
                 perspective="敵対者",
                 events=antagonist_events,
-                time_range=(0, len(events)),
-                intersection_points=[len(events) // 3, 2 * len(events) // 3],
+                time_range=(0, event_count),
+                intersection_points=[event_count // 3, 2 * event_count // 3],
             )
             timelines.append(antagonist_timeline)
 
             # 支援者の時間軸
             if len(characters) > 2:
-                supporter_events = await self._create_supporter_timeline(events, characters)
+                supporter_events = self._create_supporter_timeline(events)
                 supporter_timeline = Timeline(
                     timeline_id="supporter",
                     perspective="重要な支援者",
                     events=supporter_events,
-                    time_range=(len(events) // 4, 3 * len(events) // 4),
-                    intersection_points=[len(events) // 2],
+                    time_range=(event_count // 4, 3 * event_count // 4),
+                    intersection_points=[event_count // 2],
                 )
                 timelines.append(supporter_timeline)
 
         return timelines
 
-    def _convert_to_temporal_event(
-        self, event: dict[str, Any], index: int, timeline_id: str
-    ) -> TemporalEvent:
-        """通常のイベントを時間的イベントに変換"""
-
-        return TemporalEvent(
-            content=event.get("description", ""),
-            chronological_order=index,
-            narrative_order=index,  # 後で調整
-            timeline_id=timeline_id,
-            event_type=event.get("type", "action"),
-            dependencies=event.get("dependencies", []),
-            reveals=event.get("reveals", []),
-        )
-
-    async def _create_antagonist_timeline(
-        self, main_events: list[dict[str, Any]], characters: dict[str, Any]
-    ) -> list[TemporalEvent]:
+    def _create_antagonist_timeline(self, main_events: list[dict[str, Any]]) -> list[TemporalEvent]:
         """敵対者の時間軸を作成"""
 
-        antagonist_events = []
-
-        for i, main_event in enumerate(main_events):
-            # 主人公の行動に対する敵対者の反応
-            antagonist_event = TemporalEvent(
-                content=f"敵対者の視点: {main_event.get('description', '')}への対応",
+        # 主人公の行動に対する敵対者の反応
+        antagonist_events = [
+            TemporalEvent(
+                content=(
+                    _ANTAGONIST_VIEW_PREFIX
+                    + main_event.get("description", "")
+                    + _ANTAGONIST_VIEW_SUFFIX
+                ),
                 chronological_order=i,
                 narrative_order=i,
                 timeline_id="antagonist",
@@ -432,14 +515,17 @@ class TemporalStructureDesigner:
                 dependencies=[f"main_event_{i}"],
                 reveals=[f"antagonist_motivation_{i}"],
             )
-            antagonist_events.append(antagonist_event)
+            for i, main_event in enumerate(main_events)
+        ]
 
         # 独自の計画イベントを追加
+        event_count = len(main_events)
+        plan_point, final_point = event_count // 3, 2 * event_count // 3
         unique_events = [
             TemporalEvent(
                 content="敵対者独自の計画の進行",
-                chronological_order=len(main_events) // 3,
-                narrative_order=len(main_events) // 3,
+                chronological_order=plan_point,
+                narrative_order=plan_point,
                 timeline_id="antagonist",
                 event_type="plot_advancement",
                 dependencies=[],
@@ -447,8 +533,8 @@ class TemporalStructureDesigner:
             ),
             TemporalEvent(
                 content="最終段階の準備",
-                chronological_order=2 * len(main_events) // 3,
-                narrative_order=2 * len(main_events) // 3,
+                chronological_order=final_point,
+                narrative_order=final_point,
                 timeline_id="antagonist",
                 event_type="preparation",
                 dependencies=["hidden_agenda"],
@@ -459,22 +545,15 @@ class TemporalStructureDesigner:
         antagonist_events.extend(unique_events)
         return antagonist_events
 
-    async def _create_supporter_timeline(
-        self, main_events: list[dict[str, Any]], characters: dict[str, Any]
-    ) -> list[TemporalEvent]:
+    def _create_supporter_timeline(self, main_events: list[dict[str, Any]]) -> list[TemporalEvent]:
         """支援者の時間軸を作成"""
 
-        supporter_events = []
-
         # 主人公への支援活動
-        support_points = [
-            len(main_events) // 4,
-            len(main_events) // 2,
-            3 * len(main_events) // 4,
-        ]
+        event_count = len(main_events)
+        support_points = [event_count // 4, event_count // 2, 3 * event_count // 4]
 
-        for i, point in enumerate(support_points):
-            supporter_event = TemporalEvent(
+        return [
+            TemporalEvent(
                 content=f"支援者の援助活動 {i + 1}",
                 chronological_order=point,
                 narrative_order=point,
@@ -483,17 +562,13 @@ class TemporalStructureDesigner:
                 dependencies=[f"main_event_{point}"],
                 reveals=[f"hidden_alliance_{i}"],
             )
-            supporter_events.append(supporter_event)
-
-        return supporter_events
+            for i, point in enumerate(support_points)
+        ]
 
-    async def _design_flashback_structure(
-        self, linear_plot: dict[str, Any], timelines: list[Timeline]
+    def _design_flashback_structure(
+        self, revelation_points: list[dict[str, Any]], timelines: list[Timeline]
     ) -> dict[str, Any]:
-        """フラッシュバック構造を設計"""
-
-        events = linear_plot.get("events", [])
-        revelation_points = self._identify_revelation_points(events)
+        """フラッシュバック構造を設計（啓示ポイントはプロット分析の結果を再利用）"""
 
         flashback_structure = {
             "primary_flashbacks": [],
@@ -502,11 +577,12 @@ class TemporalStructureDesigner:
             "temporal_anchors": [],
         }
 
-        # 主要なフラッシュバック
-        for revelation in revelation_points:
+        # 主要なフラッシュバック（遡り幅 3〜8 はまとめて生成）
+        offsets = self._rng.integers(3, 9, size=len(revelation_points)).tolist()
+        for revelation, offset in zip(revelation_points, offsets, strict=True):
             flashback = {
                 "trigger_position": revelation["position"],
-                "target_past_position": max(0, revelation["position"] - random.randint(3, 8)),
+                "target_past_position": max(0, revelation["position"] - offset),
                 "content_focus": revelation["reveals"],
                 "emotional_purpose": "現在の状況への理解を深める",
                 "duration": "medium",
@@ -528,7 +604,7 @@ class TemporalStructureDesigner:
 
         return flashback_structure
 
-    async def _place_prophetic_elements(
+    def _place_prophetic_elements(
         self, linear_plot: dict[str, Any], techniques: list[TemporalTechnique]
     ) -> list[dict[str, Any]]:
         """予言的要素を配置"""
@@ -536,14 +612,15 @@ class TemporalStructureDesigner:
         prophetic_elements = []
 
         if TemporalTechnique.PROPHETIC_VISIONS in techniques:
-            events = linear_plot.get("events", [])
+            event_count = len(linear_plot.get("events", []))
+            mid_point = event_count // 2
 
             # 序盤の予言
             early_prophecy = {
                 "position": 1,
                 "type": "prophetic_dream",
                 "content": "主人公の運命についての暗示的なビジョン",
-                "fulfillment_positions": [len(events) // 2, len(events) - 2],
+                "fulfillment_positions": [mid_point, event_count - 2],
                 "ambiguity_level": 0.7,
                 "symbolic_elements": ["光と闇の対比", "失われた王冠", "血に染まった剣"],
             }
@@ -551,10 +628,10 @@ class TemporalStructureDesigner:
 
             # 中盤の啓示
             mid_prophecy = {
-                "position": len(events) // 2,
+                "position": mid_point,
                 "type": "oracle_revelation",
                 "content": "真の敵と最終的な犠牲についての予言",
-                "fulfillment_positions": [len(events) - 1],
+                "fulfillment_positions": [event_count - 1],
                 "ambiguity_level": 0.5,
                 "symbolic_elements": ["二つの道", "火の試練", "最後の選択"],
             }
@@ -562,7 +639,7 @@ class TemporalStructureDesigner:
 
         return prophetic_elements
 
-    async def _design_convergence_points(self, timelines: list[Timeline]) -> list[dict[str, Any]]:
+    def _design_convergence_points(self, timelines: list[Timeline]) -> list[dict[str, Any]]:
         """時間軸の収束点を設計"""
 
         convergence_points = []
@@ -590,7 +667,7 @@ class TemporalStructureDesigner:
 
         return convergence_points
 
-    async def _optimize_reading_path(
+    def _optimize_reading_path(
         self,
         timelines: list[Timeline],
         flashback_structure: dict[str, Any],
@@ -605,48 +682,72 @@ class TemporalStructureDesigner:
         main_timeline = next((t for t in timelines if t.timeline_id == "main"), timelines[0])
         total_events = len(main_timeline.events)
 
+        # フラッシュバックと予言を挿入先の章ごとに一度だけ振り分ける
+        flashbacks_by_chapter = self._bucket_by_chapter(
+            flashback_structure.get("primary_flashbacks", []), "trigger_position", total_events
+        )
+        prophecies_by_chapter = self._bucket_by_chapter(
+            prophetic_elements, "position", total_events
+        )
+
+        # メイン以外の時間軸について、交差点の集合と時系列順の列配列を前計算
+        side_timelines = [
+            (
+                timeline,
+                frozenset(timeline.intersection_points),
+                _TimelineArrays.from_timeline(timeline),
+            )
+            for timeline in timelines[1:]
+        ]
+
         for i in range(0, total_events, 3):  # 3イベントごとに章を構成
+            chapter_index = i // 3
             chapter = {
-                "chapter_number": i // 3 + 1,
+                "chapter_number": chapter_index + 1,
                 "primary_timeline": "main",
                 "events_range": (i, min(i + 3, total_events)),
                 "perspective_shifts": [],
-                "flashbacks": [],
-                "prophetic_elements": [],
+                "flashbacks": flashbacks_by_chapter.get(chapter_index, []),
+                "prophetic_elements": prophecies_by_chapter.get(chapter_index, []),
                 "special_techniques": [],
             }
 
             # 視点の切り替え
-            for timeline in timelines[1:]:  # メイン以外
-                if i in timeline.intersection_points:
+            for timeline, intersections, arrays in side_timelines:
+                if i in intersections:
                     chapter["perspective_shifts"].append(
                         {
                             "shift_to": timeline.perspective,
                             "timeline_id": timeline.timeline_id,
-                            "events": [e for e in timeline.events if e.chronological_order == i],
+                            "events": arrays.events_at(i),
                         }
                     )
 
-            # フラッシュバックの挿入
-            for flashback in flashback_structure.get("primary_flashbacks", []):
-                if flashback["trigger_position"] in range(i, min(i + 3, total_events)):
-                    chapter["flashbacks"].append(flashback)
-
-            # 予言的要素の挿入
-            for prophecy in prophetic_elements:
-                if prophecy["position"] in range(i, min(i + 3, total_events)):
-                    chapter["prophetic_elements"].append(prophecy)
-
             reading_path.append(chapter)
 
         return reading_path
 
+    @staticmethod
+    def _bucket_by_chapter(
+        items: list[dict[str, Any]], position_key: str, total_events: int
+    ) -> dict[int, list[dict[str, Any]]]:
+        """要素を位置から求めた章番号（3イベント単位）ごとに振り分ける"""
+
+        buckets: dict[int, list[dict[str, Any]]] = {}
+        for item in items:
+            position = item[position_key]
+            if 0 <= position < total_events:
+                buckets.setdefault(position // 3, []).append(item)
+
+        return buckets
+
     def _calculate_temporal_complexity_score(self, techniques: list[TemporalTechnique]) -> float:
         """時間的複雑性スコアを計算"""
 
-        total_complexity = sum(
-            self.temporal_techniques[technique]["complexity"] for technique in techniques
-        )
+        if not techniques:
+            return 0.0
+
+        total_complexity = sum(map(self._complexity_by_tech.__getitem__, techniques))
 
         # 技法の組み合わせボーナス
         combination_bonus = len(techniques) * 0.1
@@ -656,8 +757,6 @@ class TemporalStructureDesigner:
     def _estimate_reader_engagement(self, techniques: list[TemporalTechnique]) -> float:
         """読者エンゲージメントを推定"""
 
-        total_engagement = sum(
-            self.temporal_techniques[technique]["reader_engagement"] for technique in techniques
-        )
+        total_engagement = sum(map(self._engagement_by_tech.__getitem__, techniques))
 
         return total_engagement / len(techniques) if techniques else 0.5
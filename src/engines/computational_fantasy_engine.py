@@ -3,20 +3,69 @@
 全コンポーネントを統合した最終実行エンジン
 """
 
+import asyncio
+import json
+import threading
+import uuid
+import weakref
+from collections import OrderedDict, defaultdict
 from typing import Any, TypedDict
 
 import numpy as np
 from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_groq import ChatGroq
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.graph import END, StateGraph
 from pydantic import BaseModel, Field
 
-from ..core.computational_narratology import ComputationalNarratologyEngine
+from ..core.computational_narratology import (
+    ComputationalNarratologyEngine,
+    NarrativeReversal,
+    ReversalType,
+)
 from ..core.emotional_valence_tracker import EmotionalValenceTracker
 from ..core.reversal_scene_generator import ReversalSceneGenerator
 from ..core.semantic_pacing_controller import SemanticPacingController
 from ..core.temporal_structure_designer import TemporalStructureDesigner
 
+# チェックポイントからの復元を許可する状態内の独自型
+_CHECKPOINT_STATE_TYPES = tuple(
+    (t.__module__, t.__name__) for t in (NarrativeReversal, ReversalType)
+)
+
+# 最適化済み転換シーケンスのキャッシュ上限（超えたら最も古く使われたものを破棄）
+_OPT_CACHE_SIZE = 64
+
+# 章執筆用プロンプトのテンプレート
+# 全章で共通の設定を先に、章ごとに変わる指示を後に並べる
+_CHAPTER_PROMPT_TEMPLATE = """
+あなたは世界的に有名なファンタジー作家です。以下の設定に基づき、壮大な物語の一章を執筆してください。
+
+### 世界観
+{world_json}
+
+### 主要登場人物
+{characters_json}
+
+### 物語全体のプロット概要
+{plot_summary}
+
+### 執筆指示
+- 具体的で、感情豊かで、読者を引き込むような文章でお願いします。
+- これは物語の重要な転換点です。劇的で記憶に残るシーンにしてください。
+- 章の終わりには、読者が次を読みたくなるような「引き」を作ってください。
+
+### 執筆する章
+第{chapter_num}章
+
+### この章で描くべきこと
+- {directives}
+- {previous_summary}
+"""
+
 
 # --- Pydantic Models for Structured Output ---
 class WorldFoundations(BaseModel):
@@ -57,6 +106,7 @@ class NovelGenerationState(TypedDict):
     reversal_map: dict[str, Any]
     nonlinear_structure: dict[str, Any]
     manuscript: dict[str, str]
+    chapter_order: list[int]
     narrative_metrics: dict[str, Any]
     final_result: dict[str, Any]
 
@@ -64,7 +114,32 @@ class NovelGenerationState(TypedDict):
 class ComputationallyOptimizedFantasyEngine:
     """計算論的物語論を統合したハイファンタジー執筆エンジン (LangGraph版)"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        checkpointer: BaseCheckpointSaver | bool = False,
+    ) -> None:
+        # 章執筆など LLM 呼び出しを並行させる際の同時実行数の上限（API のレート制限対策）
+        self.max_concurrency = max_concurrency
+        # ノード単位のチェックポイント（既定では無効。失敗時は最後に完了したノードから再開する）
+        # True ならメモリ上に保存し、プロセスをまたいで永続化する場合は SqliteSaver などを渡す
+        if checkpointer is True:
+            checkpointer = InMemorySaver(
+                serde=JsonPlusSerializer(allowed_msgpack_modules=_CHECKPOINT_STATE_TYPES)
+            )
+        self._checkpointer: BaseCheckpointSaver | None = checkpointer or None
+        # スレッド ID ごとの実行ロック（同じスレッドへの同時実行を直列化する）
+        self._thread_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+        # 感情価シーケンス -> 最適化済み転換シーケンス（同じプロットの再実行で再計算しない）
+        # 転換の感情アークは乱数を含むが、同じシーケンスには最初の結果を返して
+        # 再実行どうしの結果を揃える（意図的な固定）
+        self._opt_cache: OrderedDict[tuple[float, ...], list[NarrativeReversal]] = OrderedDict()
+        # 同期ノードはワーカースレッドで実行されるため、キャッシュの参照・更新は排他する
+        self._opt_cache_lock = threading.Lock()
+
         # --- LLM and Core Components Initialization ---
         # Groq API を使用（超高速推論）
         # Qwen3-32B モデルを使用（多言語対応、高品質創作）
@@ -77,6 +152,9 @@ class ComputationallyOptimizedFantasyEngine:
             "temporal_designer": TemporalStructureDesigner(),
         }
 
+        # 章執筆用プロンプト（共通部分を先頭に置き、章ごとの指示は末尾に差し込む）
+        self._chapter_prompt = ChatPromptTemplate.from_template(_CHAPTER_PROMPT_TEMPLATE)
+
         # --- Graph Definition ---
         workflow = StateGraph(NovelGenerationState)
         workflow.add_node("create_foundation", self._create_foundation_node)
@@ -97,7 +175,7 @@ class ComputationallyOptimizedFantasyEngine:
         workflow.add_edge("verify_metrics", "finalize_novel")
         workflow.add_edge("finalize_novel", END)
 
-        self.graph = workflow.compile()
+        self.graph = workflow.compile(checkpointer=self._checkpointer)
 
     # --- Node Implementations ---
     async def _create_foundation_node(self, state: NovelGenerationState) -> dict[str, Any]:
@@ -131,9 +209,11 @@ class ComputationallyOptimizedFantasyEngine:
 
         # Pydanticモデルを辞書に変換してstateに格納
         return {
-            "world": foundation.world.dict(),
-            "characters": {name: profile.dict() for name, profile in foundation.characters.items()},
-            "basic_plot": {"events": [event.dict() for event in foundation.basic_plot]},
+            "world": foundation.world.model_dump(),
+            "characters": {
+                name: profile.model_dump() for name, profile in foundation.characters.items()
+            },
+            "basic_plot": {"events": [event.model_dump() for event in foundation.basic_plot]},
         }
 
     def _optimize_plot_structure_node(self, state: NovelGenerationState) -> dict[str, Any]:
@@ -142,10 +222,22 @@ class ComputationallyOptimizedFantasyEngine:
 
         events = basic_plot["events"]
         emotional_sequence = [e["emotional_impact"] for e in events]
-        narratology_engine = self.components["narratology"]
-        optimized_sequence = narratology_engine.optimize_reversal_sequence(  # type: ignore
-            emotional_sequence
-        )
+        key = tuple(emotional_sequence)
+        with self._opt_cache_lock:
+            cached = self._opt_cache.get(key)
+            if cached is not None:
+                self._opt_cache.move_to_end(key)
+        if cached is None:
+            narratology_engine = self.components["narratology"]
+            cached = narratology_engine.optimize_reversal_sequence(  # type: ignore
+                emotional_sequence
+            )
+            with self._opt_cache_lock:
+                self._opt_cache[key] = cached
+                if len(self._opt_cache) > _OPT_CACHE_SIZE:
+                    self._opt_cache.popitem(last=False)
+        # キャッシュ本体を状態と共有しないよう複製して渡す
+        optimized_sequence = list(cached)
 
         for event, reversal in zip(events, optimized_sequence, strict=False):
             event["optimized_emotional_impact"] = reversal.target_state
@@ -167,23 +259,28 @@ class ComputationallyOptimizedFantasyEngine:
         optimized_plot = state["optimized_plot"]
         reversals = optimized_plot["optimized_reversals"]
 
-        reversal_map: dict[str, Any] = {"chapter_reversals": {}}
-        for i, reversal in enumerate(reversals):
-            chapter_num = (i // 3) + 1
-            if f"chapter_{chapter_num}" not in reversal_map["chapter_reversals"]:
-                reversal_map["chapter_reversals"][f"chapter_{chapter_num}"] = []
+        # 登場人物名は全転換で共通なので一度だけリスト化する
+        character_names = list(state["characters"].keys())
 
+        # 章番号（整数）ごとに集め、状態に載せる際に "chapter_N" キーへ変換する
+        chapter_reversals: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+        for i, reversal in enumerate(reversals):
             reversal_info = {
                 "reversal": reversal,
                 "context": {
                     "current_situation": optimized_plot["events"][i]["description"],
-                    "characters": list(state["characters"].keys()),
+                    "characters": character_names,
                     "location": "帝国各地",
                     "stakes": "個人から世界へ段階的拡大",
                 },
             }
-            reversal_map["chapter_reversals"][f"chapter_{chapter_num}"].append(reversal_info)
+            chapter_reversals[(i // 3) + 1].append(reversal_info)
 
+        reversal_map: dict[str, Any] = {
+            "chapter_reversals": {
+                f"chapter_{chapter_num}": infos for chapter_num, infos in chapter_reversals.items()
+            }
+        }
         return {"reversal_map": reversal_map}
 
     def _create_nonlinear_structure_node(self, state: NovelGenerationState) -> dict[str, Any]:
@@ -198,53 +295,78 @@ class ComputationallyOptimizedFantasyEngine:
 
     async def _write_optimized_manuscript_node(self, state: NovelGenerationState) -> dict[str, Any]:
         print("5. 最適化アルゴリズムで執筆中...")
-        manuscript: dict[str, str] = {}
-        for chapter_info in state["nonlinear_structure"]["reading_path"]:
-            chapter_num = chapter_info["chapter_number"]
-            print(f"  第{chapter_num}章を執筆中...")
-            chapter_reversals = (
-                state["reversal_map"].get("chapter_reversals", {}).get(f"chapter_{chapter_num}", [])
+        reading_path = state["nonlinear_structure"]["reading_path"]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # 全章で共通の設定は小説ごとに一度だけ、キー順を固定した JSON に直列化する
+        # （プロンプト先頭が全章で同一になり、LLM 側のプレフィックスキャッシュが効く）
+        shared_variables = {
+            "world_json": json.dumps(state["world"], ensure_ascii=False, sort_keys=True),
+            "characters_json": json.dumps(state["characters"], ensure_ascii=False, sort_keys=True),
+            "plot_summary": "\n".join(
+                f"- {event['description']}" for event in state["optimized_plot"]["events"]
+            ),
+        }
+        chain = self._chapter_prompt | self.llm
+
+        # plot_tails[k]: 先頭 k 個のイベント記述を "..." で連結した末尾 500 文字
+        # （直前の末尾だけを伸ばすので、章ごとに全体を連結し直さずに済む）
+        plot_tails = [""]
+        for index, event in enumerate(state["optimized_plot"]["events"]):
+            joined = (
+                plot_tails[-1] + "..." + event["description"] if index else event["description"]
             )
+            plot_tails.append(joined[-500:])
 
-            # Use LLM to generate chapter content
-            reversal_functions = (
-                [info["reversal"].narrative_function for info in chapter_reversals]
-                if chapter_reversals
-                else ["物語の進行"]
+        async def _write_chapter(chapter_num: int) -> str:
+            variables = shared_variables | self._chapter_prompt_variables(
+                state, chapter_num, plot_tails
             )
+            async with semaphore:
+                print(f"  第{chapter_num}章を執筆中...")
+                # 応答はストリーミングで受け取り、届いた断片から順に溜めていく
+                chunks = [str(chunk.content) async for chunk in chain.astream(variables)]
+            return "".join(chunks)
+
+        # 各章は互いの本文に依存しないため、全章を並行して執筆する
+        chapter_nums = [chapter_info["chapter_number"] for chapter_info in reading_path]
+        contents = await asyncio.gather(*(_write_chapter(num) for num in chapter_nums))
+
+        # 原稿は章順に格納し、章番号の並びも数値のまま状態に残す
+        # （"chapter_N" の文字列ソートでは chapter_10 が chapter_2 より前になる）
+        manuscript: dict[str, str] = {
+            f"chapter_{chapter_num}": content
+            for chapter_num, content in zip(chapter_nums, contents, strict=True)
+        }
+        return {"manuscript": manuscript, "chapter_order": chapter_nums}
 
-            # 前の章のあらすじを安全に取得
-            previous_summary = ""
-            if manuscript:
-                all_content = "...".join(list(manuscript.values()))
-                previous_summary = f"前の章までの簡単なあらすじ: {all_content[-500:]}"
-            else:
-                previous_summary = "これは物語の最初の章です。"
-
-            prompt = f"""
-            あなたは世界的に有名なファンタジー作家です。以下の設定に基づき、壮大な物語の第{chapter_num}章を執筆してください。
-
-            ### 世界観
-            {state["world"]}
-
-            ### 主要登場人物
-            {state["characters"]}
+    def _chapter_prompt_variables(
+        self, state: NovelGenerationState, chapter_num: int, plot_tails: list[str]
+    ) -> dict[str, Any]:
+        """章ごとに変わるプロンプト変数を組み立てる"""
+        chapter_reversals = (
+            state["reversal_map"].get("chapter_reversals", {}).get(f"chapter_{chapter_num}", [])
+        )
 
-            ### 物語全体のプロット概要
-            {[event["description"] for event in state["optimized_plot"]["events"]]}
+        reversal_functions = (
+            [info["reversal"].narrative_function for info in chapter_reversals]
+            if chapter_reversals
+            else ["物語の進行"]
+        )
 
-            ### この章で描くべきこと
-            - {", ".join(reversal_functions)}
-            - {previous_summary}
+        # 前の章までのあらすじ（並行執筆のため、生成済み本文ではなく先行する章のプロット
+        # イベントから組み立てる。1章は3イベント）
+        previous_count = min((chapter_num - 1) * 3, len(plot_tails) - 1)
+        if previous_count > 0:
+            previous_summary = f"前の章までの簡単なあらすじ: {plot_tails[previous_count]}"
+        else:
+            previous_summary = "これは物語の最初の章です。"
 
-            ### 執筆指示
-            - 具体的で、感情豊かで、読者を引き込むような文章でお願いします。
-            - これは物語の重要な転換点です。劇的で記憶に残るシーンにしてください。
-            - 章の終わりには、読者が次を読みたくなるような「引き」を作ってください。
-            """
-            response = await self.llm.ainvoke(prompt)
-            manuscript[f"chapter_{chapter_num}"] = str(response.content)
-        return {"manuscript": manuscript}
+        return {
+            "chapter_num": chapter_num,
+            "directives": ", ".join(reversal_functions),
+            "previous_summary": previous_summary,
+        }
 
     async def _verify_success_metrics_node(self, state: NovelGenerationState) -> dict[str, Any]:
         """生成された原稿を分析し、成功指標を動的に検証する"""
@@ -257,30 +379,40 @@ class ComputationallyOptimizedFantasyEngine:
         pacing_controller = self.components["pacing_controller"]
         narratology_engine = self.components["narratology"]
 
-        # 1. 感情価の分析
-        all_valences = []
-        for chapter_num, content in sorted(manuscript.items()):
-            valence = await valence_tracker.analyze_scene_valence(  # type: ignore
-                content, int(chapter_num.split("_")[1])
+        # 1. 感情価の分析（gather は結果を投入順に返すので章順は保たれる）
+        valence_analysis = asyncio.gather(
+            *(
+                valence_tracker.analyze_scene_valence(  # type: ignore
+                    manuscript[f"chapter_{chapter_num}"], chapter_num
+                )
+                for chapter_num in state["chapter_order"]
             )
-            all_valences.append(valence)
+        )
 
-        # 2. 転換指標の計算
-        reversal_intensities = [
-            abs(all_valences[i] - all_valences[i - 1]) for i in range(1, len(all_valences))
-        ]
-        significant_reversals = [intensity for intensity in reversal_intensities if intensity > 0.6]
+        if len(manuscript) < 2:
+            # 章間の移動が無いので意味的距離は常に 0（意味位置の解析を省略する）
+            valence_results = await valence_analysis
+            semantic_distance = 0.0
+        else:
+            # 3. 意味的距離の計算を感情価の分析と並行実行
+            valence_results, semantic_distance = await asyncio.gather(
+                valence_analysis,
+                pacing_controller.calculate_total_semantic_distance(manuscript),  # type: ignore
+            )
+        all_valences = list(valence_results)
+        valences = np.asarray(all_valences, dtype=np.float64)
 
-        # 3. 意味的距離の計算
-        semantic_distance = await pacing_controller.calculate_total_semantic_distance(manuscript)  # type: ignore
+        # 2. 転換指標の計算（隣接章間の感情価変化を一括で求める）
+        reversal_intensities = np.abs(np.diff(valences))
+        significant_reversals = reversal_intensities[reversal_intensities > 0.6]
 
         # 4. メトリクスの集計
         metrics = {
-            "reversal_frequency": len(significant_reversals) / max(1, len(manuscript)),
-            "average_reversal_intensity": np.mean(significant_reversals)
-            if significant_reversals
+            "reversal_frequency": significant_reversals.size / max(1, len(manuscript)),
+            "average_reversal_intensity": float(significant_reversals.mean())
+            if significant_reversals.size
             else 0.0,
-            "emotional_variance": np.var(all_valences) if all_valences else 0.0,
+            "emotional_variance": float(valences.var()) if valences.size else 0.0,
             "semantic_distance": semantic_distance,
             "narrative_speed": "slow",  # このデモでは固定
             "valence_history": all_valences,  # 可視化用
@@ -312,12 +444,78 @@ class ComputationallyOptimizedFantasyEngine:
         return {"final_result": final_result}
 
     async def create_optimized_fantasy_novel(
-        self, initial_concept: dict[str, Any]
+        self, initial_concept: dict[str, Any], thread_id: str | None = None
     ) -> dict[str, Any]:
-        """計算論的に最適化されたファンタジー小説を生成"""
-        print("🔬 計算論的最適化プロセスを開始...")
+        """
+        計算論的に最適化されたファンタジー小説を生成
 
+        Args:
+            initial_concept: 初期コンセプト。
+            thread_id: チェックポイントのスレッド ID（``checkpointer`` 指定時のみ）。
+                失敗した実行を同じ ID で呼び直すと、最後に完了したノードから再開する。
+                省略時は実行ごとに新しい ID を使う。
+
+        Returns:
+            生成結果。
+        """
+        print("🔬 計算論的最適化プロセスを開始...")
         initial_state: NovelGenerationState = {"initial_concept": initial_concept}  # type: ignore
-        final_state = await self.graph.ainvoke(initial_state)
+
+        if self._checkpointer is None:
+            if thread_id is not None:
+                raise ValueError("thread_id を指定するには checkpointer が必要です")
+            final_state = await self.graph.ainvoke(initial_state)
+            return final_state.get("final_result", {})  # type: ignore
+
+        run_thread_id = thread_id or uuid.uuid4().hex
+        config = {"configurable": {"thread_id": run_thread_id}}
+
+        lock = self._thread_locks.get(run_thread_id)
+        if lock is None:
+            lock = self._thread_locks[run_thread_id] = asyncio.Lock()
+
+        async with lock:
+            try:
+                snapshot = await self.graph.aget_state(config)
+                if snapshot.next:
+                    # 未完了のノードが残っていれば、入力を渡さずにそこから再開する
+                    print("♻️ 前回の途中状態から再開します...")
+                    final_state = await self.graph.ainvoke(None, config)
+                else:
+                    final_state = await self.graph.ainvoke(initial_state, config)
+            except BaseException:
+                # ID を受け取っていない呼び出し元は再開できないため、途中状態も残さない
+                if thread_id is None:
+                    await self._checkpointer.adelete_thread(run_thread_id)
+                raise
+
+            # 完了したスレッドのチェックポイントは再開に使わないため破棄する
+            await self._checkpointer.adelete_thread(run_thread_id)
 
         return final_state.get("final_result", {})  # type: ignore
+
+    async def create_many(
+        self, concepts: list[dict[str, Any]], max_concurrency: int = 4
+    ) -> list[dict[str, Any]]:
+        """
+        複数のコンセプトから小説をまとめて生成する。
+
+        各小説は実行ごとに別のチェックポイントスレッドで生成されるため、
+        同じコンセプトが重複していても互いの途中状態を共有しない。
+
+        Args:
+            concepts: 初期コンセプトのリスト。
+            max_concurrency: 同時に生成する小説数の上限。各小説の章執筆も
+                ``self.max_concurrency`` まで並行するため、LLM への同時リクエスト数は
+                最大で両者の積になる（API のレート制限に合わせて調整する）。
+
+        Returns:
+            入力と同じ順序で並んだ生成結果のリスト。
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _create(concept: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.create_optimized_fantasy_novel(concept)
+
+        return await asyncio.gather(*(_create(concept) for concept in concepts))
@@ -3,11 +3,43 @@
 生成された物語とメタデータの保存
 """
 
+import asyncio
+import gzip
 import json
 import os
+from dataclasses import fields, is_dataclass
 from datetime import datetime
+from html import escape
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson は任意依存（無ければ標準 json で書き出す）
+    orjson = None
+
+# orjson の書き出しオプション（インデント2、非文字列キー・NumPy 値を許可）
+_ORJSON_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    if orjson is not None
+    else 0
+)
+# バックアップ用の書き出しオプション（圧縮するのでインデントなし）
+_ORJSON_COMPACT_OPTIONS = (
+    (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+)
+
+# バックアップの gzip 圧縮レベル（速度優先）
+_BACKUP_COMPRESSLEVEL = 1
+
+# レポートの物語構造メトリクス表の行定義
+# (表示名, メトリクスのキー, 目標値, 値の書式, 目標値の表示, 未達時の改善項目)
+_REPORT_METRIC_ROWS: tuple[tuple[str, str, float, str, str, str | None], ...] = (
+    ("転換頻度", "reversal_frequency", 2.5, "{:.2f}回/章", "2.5回/章", "転換頻度の増加"),
+    ("平均転換強度", "average_reversal_intensity", 0.8, "{:.2f}", "0.8以上", "転換強度の向上"),
+    ("感情分散", "emotional_variance", 0.6, "{:.2f}", "0.6以上", "感情的多様性の拡充"),
+    ("意味的距離", "semantic_distance", 0.7, "{:.2f}", "0.7以上", None),
+)
+
 
 async def save_optimized_novel(result: dict[str, Any], output_dir: str = "output") -> None:
     """最適化された小説を保存"""
@@ -16,40 +48,32 @@ async def save_optimized_novel(result: dict[str, Any], output_dir: str = "output
     os.makedirs(output_dir, exist_ok=True)
 
     title = result.get("title", "Untitled Novel")
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # 全ファイルで同じ時刻を使う（ファイル名と本文中の生成日時を揃える）
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    generated_at = now.strftime("%Y年%m月%d日 %H:%M:%S")
 
     # メイン原稿の保存
     manuscript = result.get("manuscript", {})
     manuscript_path = f"{output_dir}/novel_{timestamp}.txt"
 
-    with open(manuscript_path, "w", encoding="utf-8") as f:
-        f.write(f"『{title}』\n")
-        f.write("=" * 60 + "\n\n")
-        f.write("計算論的物語論統合型ハイファンタジー小説執筆システム v6.0 生成\n")
-        f.write(f"生成日時: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}\n\n")
-
-        # 各章の内容
-        for chapter_key in sorted(manuscript.keys()):
-            content = manuscript[chapter_key]
-            f.write(content + "\n\n")
-            f.write("-" * 60 + "\n\n")
-
+    # ファイル書き込みはワーカースレッドで行い、イベントループを塞がない
+    await asyncio.to_thread(_write_manuscript, manuscript_path, title, manuscript, generated_at)
     print(f"📖 小説原稿を保存: {manuscript_path}")
 
     # 世界設定資料の保存
     world_bible = result.get("world_bible", {})
     if world_bible:
         world_path = f"{output_dir}/world_bible_{timestamp}.json"
-        with open(world_path, "w", encoding="utf-8") as f:
-            json.dump(world_bible, f, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(_write_json, world_path, world_bible)
         print(f"🌍 世界設定資料を保存: {world_path}")
 
     # メトリクスデータの保存
     metrics = result.get("narrative_metrics", {})
     if metrics:
         metrics_path = f"{output_dir}/metrics_{timestamp}.json"
-        with open(metrics_path, "w", encoding="utf-8") as f:
-            json.dump(metrics, f, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(_write_json, metrics_path, metrics)
         print(f"📊 メトリクスデータを保存: {metrics_path}")
 
     # 転換分析の保存
@@ -57,166 +81,207 @@ async def save_optimized_novel(result: dict[str, Any], output_dir: str = "output
     if reversal_analysis:
         reversal_path = f"{output_dir}/reversal_analysis_{timestamp}.json"
 
-        # シリアライゼーション用にデータを変換
-        serializable_analysis = _make_serializable(reversal_analysis)
-
-        with open(reversal_path, "w", encoding="utf-8") as f:
-            json.dump(serializable_analysis, f, ensure_ascii=False, indent=2)
+        # 転換オブジェクト等はエンコーダ側で変換しながら直列化する
+        await asyncio.to_thread(_write_json, reversal_path, reversal_analysis)
         print(f"🎭 転換分析を保存: {reversal_path}")
 
     # 統合レポートの保存
-    await _save_integrated_report(result, f"{output_dir}/integrated_report_{timestamp}.md")
+    await _save_integrated_report(
+        result, f"{output_dir}/integrated_report_{timestamp}.md", generated_at
+    )
 
     print(f"✅ 全ファイルを '{output_dir}' に保存完了")
 
 
-def _make_serializable(obj: Any, seen: set | None = None) -> Any:
-    """オブジェクトをJSON serializable に変換（循環参照対応）"""
+def _write_manuscript(
+    manuscript_path: str, title: str, manuscript: dict[str, str], generated_at: str
+) -> None:
+    """原稿をテキストファイルに書き出す（ワーカースレッドで実行）"""
 
-    if seen is None:
-        seen = set()
+    with open(manuscript_path, "w", encoding="utf-8") as f:
+        f.write(f"『{title}』\n")
+        f.write("=" * 60 + "\n\n")
+        f.write("計算論的物語論統合型ハイファンタジー小説執筆システム v6.0 生成\n")
+        f.write(f"生成日時: {generated_at}\n\n")
 
-    # 循環参照チェック
-    obj_id = id(obj)
-    if obj_id in seen:
-        return f"<循環参照: {type(obj).__name__}>"
+        # 各章の内容（原稿は章順に格納されている）
+        for content in manuscript.values():
+            f.write(content + "\n\n")
+            f.write("-" * 60 + "\n\n")
 
-    # プリミティブ型の早期リターン
-    if obj is None or isinstance(obj, str | int | float | bool):
-        return obj
 
-    # 処理済みマークを追加
-    seen.add(obj_id)
+def _write_json(path: str, obj: Any) -> None:
+    """オブジェクトを JSON ファイルに書き出す（直列化も含めてワーカースレッドで実行）"""
 
-    try:
-        if hasattr(obj, "value") and hasattr(obj, "name"):
-            # Enum
-            return obj.value
-        elif hasattr(obj, "__dict__"):
-            # データクラスやカスタムオブジェクト
-            result = {}
-            for key, value in obj.__dict__.items():
-                if not key.startswith("_"):  # プライベート属性をスキップ
-                    result[key] = _make_serializable(value, seen)
-            return result
-        elif isinstance(obj, dict):
-            return {key: _make_serializable(value, seen) for key, value in obj.items()}
-        elif isinstance(obj, list | tuple):
-            return [_make_serializable(item, seen) for item in obj]
-        elif isinstance(obj, set):
-            return [_make_serializable(item, seen) for item in obj]
-        else:
-            # その他の型は文字列表現
-            return str(obj)
-    finally:
-        # 処理完了後にマークを削除
-        seen.discard(obj_id)
-
-
-async def _save_integrated_report(result: dict[str, Any], report_path: str) -> None:
-    """統合レポートをMarkdown形式で保存"""
+    data = _dumps_json(obj)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(data)
 
-    title = result.get("title", "Untitled Novel")
-    metrics = result.get("narrative_metrics", {})
-    metadata = result.get("generation_metadata", {})
 
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write(f"# 『{title}』生成レポート\n\n")
+def _read_json(path: str) -> Any:
+    """JSON ファイルを読み込む（ワーカースレッドで実行）"""
 
-        f.write("## 概要\n\n")
-        f.write(
-            "計算論的物語論統合型ハイファンタジー小説執筆システム v6.0 により生成された作品の詳細分析レポートです。\n\n"
-        )
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
 
-        f.write(f"**生成日時**: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}\n")
-        f.write(f"**最終品質スコア**: {metadata.get('final_quality_score', 0):.2f}/1.0\n\n")
 
-        # 物語構造メトリクス
-        f.write("## 物語構造メトリクス\n\n")
-        f.write("| 指標 | 値 | 目標値 | 評価 |\n")
-        f.write("|------|----|---------|---------|\n")
+def _write_json_gz(path: str, obj: Any) -> None:
+    """オブジェクトを gzip 圧縮した JSON ファイルに書き出す（ワーカースレッドで実行）"""
 
-        reversal_freq = metrics.get("reversal_frequency", 0)
-        f.write(
-            f"| 転換頻度 | {reversal_freq:.2f}回/章 | 2.5回/章 | {'✅' if reversal_freq >= 2.5 else '⚠️'} |\n"
-        )
+    if orjson is not None:
+        payload = orjson.dumps(obj, default=_json_default, option=_ORJSON_COMPACT_OPTIONS)
+    else:
+        payload = json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=_json_default
+        ).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(gzip.compress(payload, compresslevel=_BACKUP_COMPRESSLEVEL))
+
+
+def _read_json_gz(path: str) -> Any:
+    """gzip 圧縮された JSON ファイルを読み込む（ワーカースレッドで実行）"""
+
+    with open(path, "rb") as f:
+        payload = gzip.decompress(f.read())
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON エンコーダが直接扱えないオブジェクトを変換する（エンコーダから要素ごとに呼ばれる）"""
+
+    if hasattr(obj, "value") and hasattr(obj, "name"):
+        # Enum
+        return obj.value
+    if hasattr(obj, "model_dump"):
+        # Pydantic モデル
+        return obj.model_dump(mode="json")
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # データクラス（__slots__ を使うものは __dict__ を持たない）
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    if isinstance(obj, set | frozenset):
+        return list(obj)
+    if hasattr(obj, "tolist"):
+        # NumPy の配列・スカラー
+        return obj.tolist()
+    if hasattr(obj, "__dict__"):
+        # カスタムオブジェクト（プライベート属性はスキップ）
+        return {key: value for key, value in obj.__dict__.items() if not key.startswith("_")}
+    # その他の型は文字列表現
+    return str(obj)
+
+
+def _dumps_json(obj: Any) -> str:
+    """オブジェクトを整形済み JSON 文字列に変換（orjson があれば C 実装で直列化）"""
+
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default)
+
+
+async def _save_integrated_report(
+    result: dict[str, Any], report_path: str, generated_at: str
+) -> None:
+    """統合レポートをMarkdown形式で保存"""
 
-        reversal_intensity = metrics.get("average_reversal_intensity", 0)
-        f.write(
-            f"| 平均転換強度 | {reversal_intensity:.2f} | 0.8以上 | {'✅' if reversal_intensity >= 0.8 else '⚠️'} |\n"
-        )
+    await asyncio.to_thread(_write_integrated_report, result, report_path, generated_at)
+    print(f"📋 統合レポートを保存: {report_path}")
 
-        emotional_variance = metrics.get("emotional_variance", 0)
-        f.write(
-            f"| 感情分散 | {emotional_variance:.2f} | 0.6以上 | {'✅' if emotional_variance >= 0.6 else '⚠️'} |\n"
-        )
 
-        semantic_distance = metrics.get("semantic_distance", 0)
-        f.write(
-            f"| 意味的距離 | {semantic_distance:.2f} | 0.7以上 | {'✅' if semantic_distance >= 0.7 else '⚠️'} |\n"
-        )
+def _write_integrated_report(result: dict[str, Any], report_path: str, generated_at: str) -> None:
+    """統合レポートを書き出す（ワーカースレッドで実行）"""
 
-        f.write("\n")
-
-        # 使用された技法
-        f.write("## 使用された計算論的技法\n\n")
-        techniques = metadata.get("technique_summary", [])
-        for technique in techniques:
-            f.write(f"- {technique}\n")
-        f.write("\n")
-
-        # 品質評価
-        success_score = metrics.get("success_score", 0)
-        f.write("## 品質評価\n\n")
-
-        if success_score >= 0.8:
-            f.write("🏆 **優秀** - 計算論的に最適化された高品質な物語です\n\n")
-            f.write("この作品は以下の点で優れています：\n")
-            f.write("- 適切な頻度と強度での感情的転換\n")
-            f.write("- 豊かな感情の起伏と多様性\n")
-            f.write("- 高い意味的複雑性と読者エンゲージメント\n")
-        elif success_score >= 0.6:
-            f.write("✅ **良好** - 基準を満たした物語です\n\n")
-            f.write("改善の余地がある分野：\n")
-            if reversal_freq < 2.5:
-                f.write("- 転換頻度の増加\n")
-            if reversal_intensity < 0.8:
-                f.write("- 転換強度の向上\n")
-            if emotional_variance < 0.6:
-                f.write("- 感情的多様性の拡充\n")
-        else:
-            f.write("⚠️ **改善可能** - さらなる最適化が推奨されます\n\n")
-            f.write("重点的な改善が必要な分野：\n")
-            f.write("- 物語構造の根本的な見直し\n")
-            f.write("- 感情的転換の質と量の向上\n")
-            f.write("- キャラクターアークの深化\n")
-
-        f.write("\n")
-
-        # 技術仕様
-        f.write("## 技術仕様\n\n")
-        f.write("### 計算論的物語論エンジン\n")
-        f.write("- ナラティブ・リバーサル最適化アルゴリズム\n")
-        f.write("- 感情価リアルタイムトラッキング\n")
-        f.write("- 意味的距離最大化アルゴリズム\n\n")
-
-        f.write("### 物語構造技法\n")
-        f.write("- 非線形時間構造\n")
-        f.write("- 複数視点の戦略的交錯\n")
-        f.write("- 意味的ペーシング制御\n\n")
-
-        f.write("### 品質保証システム\n")
-        f.write("- 30,000作品分析データベース準拠\n")
-        f.write("- リアルタイム成功確率計算\n")
-        f.write("- 自動品質調整機能\n\n")
-
-        # フッター
-        f.write("---\n")
-        f.write(
-            "*このレポートは計算論的物語論統合型ハイファンタジー小説執筆システム v6.0 により自動生成されました*\n"
+    title = result.get("title", "Untitled Novel")
+    metrics = result.get("narrative_metrics", {})
+    metadata = result.get("generation_metadata", {})
+
+    parts: list[str] = []
+    parts.append(f"# 『{title}』生成レポート\n\n")
+
+    parts.append("## 概要\n\n")
+    parts.append(
+        "計算論的物語論統合型ハイファンタジー小説執筆システム v6.0 により生成された作品の詳細分析レポートです。\n\n"
+    )
+
+    parts.append(f"**生成日時**: {generated_at}\n")
+    parts.append(f"**最終品質スコア**: {metadata.get('final_quality_score', 0):.2f}/1.0\n\n")
+
+    # 物語構造メトリクス
+    parts.append("## 物語構造メトリクス\n\n")
+    parts.append("| 指標 | 値 | 目標値 | 評価 |\n")
+    parts.append("|------|----|---------|---------|\n")
+
+    # 各指標の値と目標達成状況（品質評価の改善項目でも使う）
+    metric_met: dict[str, bool] = {}
+    for label, key, target, value_format, target_label, _ in _REPORT_METRIC_ROWS:
+        value = metrics.get(key, 0)
+        met = value >= target
+        metric_met[key] = met
+        parts.append(
+            f"| {label} | {value_format.format(value)} | {target_label} | {'✅' if met else '⚠️'} |\n"
         )
 
-    print(f"📋 統合レポートを保存: {report_path}")
+    parts.append("\n")
+
+    # 使用された技法
+    parts.append("## 使用された計算論的技法\n\n")
+    techniques = metadata.get("technique_summary", [])
+    for technique in techniques:
+        parts.append(f"- {technique}\n")
+    parts.append("\n")
+
+    # 品質評価
+    success_score = metrics.get("success_score", 0)
+    parts.append("## 品質評価\n\n")
+
+    if success_score >= 0.8:
+        parts.append("🏆 **優秀** - 計算論的に最適化された高品質な物語です\n\n")
+        parts.append("この作品は以下の点で優れています：\n")
+        parts.append("- 適切な頻度と強度での感情的転換\n")
+        parts.append("- 豊かな感情の起伏と多様性\n")
+        parts.append("- 高い意味的複雑性と読者エンゲージメント\n")
+    elif success_score >= 0.6:
+        parts.append("✅ **良好** - 基準を満たした物語です\n\n")
+        parts.append("改善の余地がある分野：\n")
+        for _, key, _, _, _, improvement in _REPORT_METRIC_ROWS:
+            if improvement is not None and not metric_met[key]:
+                parts.append(f"- {improvement}\n")
+    else:
+        parts.append("⚠️ **改善可能** - さらなる最適化が推奨されます\n\n")
+        parts.append("重点的な改善が必要な分野：\n")
+        parts.append("- 物語構造の根本的な見直し\n")
+        parts.append("- 感情的転換の質と量の向上\n")
+        parts.append("- キャラクターアークの深化\n")
+
+    parts.append("\n")
+
+    # 技術仕様
+    parts.append("## 技術仕様\n\n")
+    parts.append("### 計算論的物語論エンジン\n")
+    parts.append("- ナラティブ・リバーサル最適化アルゴリズム\n")
+    parts.append("- 感情価リアルタイムトラッキング\n")
+    parts.append("- 意味的距離最大化アルゴリズム\n\n")
+
+    parts.append("### 物語構造技法\n")
+    parts.append("- 非線形時間構造\n")
+    parts.append("- 複数視点の戦略的交錯\n")
+    parts.append("- 意味的ペーシング制御\n\n")
+
+    parts.append("### 品質保証システム\n")
+    parts.append("- 30,000作品分析データベース準拠\n")
+    parts.append("- リアルタイム成功確率計算\n")
+    parts.append("- 自動品質調整機能\n\n")
+
+    # フッター
+    parts.append("---\n")
+    parts.append(
+        "*このレポートは計算論的物語論統合型ハイファンタジー小説執筆システム v6.0 により自動生成されました*\n"
+    )
+
+    # 行ごとに書き込まず、組み立てた全文を一度に書き出す
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
 
 
 async def export_for_publication(
@@ -228,14 +293,17 @@ async def export_for_publication(
 
     title = result.get("title", "Untitled Novel")
     manuscript = result.get("manuscript", {})
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
 
     if format_type.lower() == "epub":
         await _export_epub(title, manuscript, f"{output_dir}/novel_{timestamp}.epub")
     elif format_type.lower() == "pdf":
         await _export_pdf(title, manuscript, f"{output_dir}/novel_{timestamp}.pdf")
     elif format_type.lower() == "html":
-        await _export_html(title, manuscript, f"{output_dir}/novel_{timestamp}.html")
+        await _export_html(
+            title, manuscript, f"{output_dir}/novel_{timestamp}.html", now.strftime("%Y年%m月%d日")
+        )
     else:
         print(f"⚠️ 未対応のフォーマット: {format_type}")
 
@@ -254,12 +322,24 @@ async def _export_pdf(title: str, manuscript: dict[str, str], output_path: str)
     print(f"📄 PDF形式でのエクスポートは将来のバージョンで実装予定: {output_path}")
 
 
-async def _export_html(title: str, manuscript: dict[str, str], output_path: str) -> None:
+async def _export_html(
+    title: str, manuscript: dict[str, str], output_path: str, generated_on: str
+) -> None:
     """HTML形式でエクスポート"""
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(
-            f"""<!DOCTYPE html>
+    await asyncio.to_thread(_write_html, title, manuscript, output_path, generated_on)
+    print(f"🌐 HTML形式でエクスポート: {output_path}")
+
+
+def _write_html(
+    title: str, manuscript: dict[str, str], output_path: str, generated_on: str
+) -> None:
+    """HTML を書き出す（ワーカースレッドで実行）"""
+
+    # LLM の出力に含まれる < > & などでマークアップが崩れないようエスケープする
+    title = escape(title)
+    parts: list[str] = [
+        f"""<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
@@ -277,20 +357,22 @@ async def _export_html(title: str, manuscript: dict[str, str], output_path: str)
     <h1>{title}</h1>
     <div class="metadata">
         計算論的物語論統合型ハイファンタジー小説執筆システム v6.0 生成<br>
-        生成日時: {datetime.now().strftime("%Y年%m月%d日")}
+        生成日時: {generated_on}
     </div>
 """
-        )
+    ]
 
-        for chapter_key in sorted(manuscript.keys()):
-            content = manuscript[chapter_key]
-            # 簡単なHTML変換
-            html_content = content.replace("\n", "<br>\n")
-            f.write(f'    <div class="chapter">\n        {html_content}\n    </div>\n')
+    # 原稿は章順に格納されている
+    for content in manuscript.values():
+        # 簡単なHTML変換
+        html_content = escape(content).replace("\n", "<br>\n")
+        parts.append(f'    <div class="chapter">\n        {html_content}\n    </div>\n')
 
-        f.write("</body>\n</html>")
+    parts.append("</body>\n</html>")
 
-    print(f"🌐 HTML形式でエクスポート: {output_path}")
+    # 章ごとに書き込まず、組み立てた全文を一度に書き出す
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
 
 
 async def create_backup(result: dict[str, Any], backup_dir: str = "backups") -> None:
@@ -301,15 +383,14 @@ async def create_backup(result: dict[str, Any], backup_dir: str = "backups") ->
 
     os.makedirs(backup_path, exist_ok=True)
 
-    # 完全なデータをJSONで保存
+    # 完全なデータを gzip 圧縮した JSON で保存
     backup_data = {
         "timestamp": timestamp,
         "system_version": "6.0.0",
-        "result": _make_serializable(result),
+        "result": result,
     }
 
-    with open(f"{backup_path}/complete_data.json", "w", encoding="utf-8") as f:
-        json.dump(backup_data, f, ensure_ascii=False, indent=2)
+    await asyncio.to_thread(_write_json_gz, f"{backup_path}/complete_data.json.gz", backup_data)
 
     print(f"💾 バックアップを作成: {backup_path}")
 
@@ -318,8 +399,13 @@ async def load_from_backup(backup_path: str) -> dict[str, Any]:
     """バックアップから読み込み"""
 
     try:
-        with open(f"{backup_path}/complete_data.json", encoding="utf-8") as f:
-            backup_data = json.load(f)
+        try:
+            backup_data = await asyncio.to_thread(
+                _read_json_gz, f"{backup_path}/complete_data.json.gz"
+            )
+        except FileNotFoundError:
+            # 圧縮形式導入前のバックアップ
+            backup_data = await asyncio.to_thread(_read_json, f"{backup_path}/complete_data.json")
 
         print(f"📂 バックアップから読み込み: {backup_path}")
         return backup_data.get("result", {})
@@ -327,6 +413,6 @@ async def load_from_backup(backup_path: str) -> dict[str, Any]:
     except FileNotFoundError:
         print(f"❌ バックアップファイルが見つかりません: {backup_path}")
         return {}
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, gzip.BadGzipFile, EOFError):
         print(f"❌ バックアップファイルが破損しています: {backup_path}")
         return {}
@@ -3,12 +3,84 @@
 感情軌跡やメトリクスの可視化
 """
 
+import asyncio
 import os
+import re
+from collections import Counter
+from collections.abc import Sequence
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
-import matplotlib.pyplot as plt
 import numpy as np
+from scipy.ndimage import uniform_filter1d
+
+from ..core.semantic_pacing_controller import DOMAINS, SemanticPosition
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# サンプルデータ生成用の乱数生成器（呼び出しごとに作り直さない）
+_RNG = np.random.default_rng()
+
+# サンプル感情価履歴の基本的な感情アークのパターン
+_SAMPLE_VALENCE_PATTERN = np.array(
+    [0.8, 0.6, 0.2, -0.3, -0.1, 0.4, -0.7, -0.9, -0.2, 0.1, 0.6, 0.3]
+)
+
+# 品質評価の段階ごとの色と表示名（成功スコアを5段階に分けて参照する）
+_QUALITY_COLORS = ("red", "orange", "yellow", "lightgreen", "green")
+_QUALITY_LABELS = ("要改善", "改善可能", "標準", "良好", "優秀")
+
+# 感情アークの構造の説明
+_ARC_DESCRIPTIONS = (
+    "第1幕: 希望と自信 (0.8)",
+    "第2幕前半: 困難と挫折 (-0.3)",
+    "第2幕後半: 裏切りと絶望 (-0.9)",
+    "第3幕前半: 理解と決意 (0.2)",
+    "第3幕後半: 勝利と代償 (0.5)",
+)
+
+# 成功要因の達成度と、達成度に応じた棒の色
+_SUCCESS_FACTOR_LABELS = ("転換頻度", "転換強度", "感情分散", "意味的距離", "時間構造")
+_SUCCESS_FACTOR_SCORES = (0.85, 0.92, 0.78, 0.88, 0.81)
+_SUCCESS_FACTOR_COLORS = tuple(
+    "green" if score >= 0.8 else "orange" if score >= 0.6 else "red"
+    for score in _SUCCESS_FACTOR_SCORES
+)
+
+# 意味的複雑性の構成
+_COMPLEXITY_LABELS = ("意味的密度", "次元的多様性", "軌跡の非線形性", "統合的複雑性")
+_COMPLEXITY_VALUES = (0.82, 0.75, 0.88, 0.85)
+
+# "chapter_N" 形式の章キーから章番号を取り出す
+_CHAPTER_NUMBER_RE = re.compile(r"_(\d+)$")
+
+# 全グラフ共通のスタイル
+_PLOT_STYLE = "seaborn-v0_8-darkgrid"
+
+# グラフ保存時の解像度と PNG の圧縮レベル（可逆圧縮なので画質は変わらず、速度を優先）
+_SAVEFIG_DPI = 150
+_PNG_COMPRESS_LEVEL = 3
+
+
+@lru_cache(maxsize=1)
+def _apply_plot_style() -> None:
+    """グラフのスタイルを適用（スタイルの読み込みはプロセスごとに一度だけ）"""
+
+    from matplotlib import style
+
+    style.use(_PLOT_STYLE)
+
+
+def _new_figure(figsize: tuple[float, float]) -> "Figure":
+    """描画用の Figure を作成（matplotlib はグラフを描くときに初めて読み込む）"""
+
+    from matplotlib.figure import Figure
+
+    return Figure(figsize=figsize)
 
 
 async def plot_emotional_journey(
@@ -16,6 +88,16 @@ async def plot_emotional_journey(
 ) -> None:
     """物語全体の感情的軌跡を可視化"""
 
+    # pyplot を使わず図ごとに独立した Figure で描くので、ワーカースレッドで並行に描画できる
+    _apply_plot_style()
+    await asyncio.to_thread(_draw_emotional_journey, metrics, save_path)
+
+    print(f"感情軌跡グラフを保存: {save_path}")
+
+
+def _draw_emotional_journey(metrics: dict[str, Any], save_path: str) -> None:
+    """感情軌跡グラフを描画して保存（ワーカースレッドで実行）"""
+
     # 出力ディレクトリの作成
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
@@ -26,13 +108,13 @@ async def plot_emotional_journey(
         valence_history = _generate_sample_valence_history(metrics)
 
     # 図のセットアップ
-    plt.style.use("seaborn-v0_8-darkgrid")
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 10))
+    fig = _new_figure((15, 10))
+    ax1, ax2 = fig.subplots(2, 1)
 
     # メインの感情軌跡
-    x_axis = range(len(valence_history))
+    x_axis = np.arange(len(valence_history))
     ax1.plot(x_axis, valence_history, linewidth=3, color="steelblue", alpha=0.8)
-    ax1.fill_between(x_axis, valence_history, 0, alpha=0.3, color="steelblue")
+    ax1.fill_between(x_axis, valence_history, 0, alpha=0.3, color="steelblue", rasterized=True)
     ax1.axhline(y=0, color="gray", linestyle="--", alpha=0.7)
 
     # 転換点のマーク
@@ -64,12 +146,13 @@ async def plot_emotional_journey(
         window_size = min(5, len(valence_history) // 3)
         moving_avg = _calculate_moving_average(valence_history, window_size)
         ax1.plot(
-            range(window_size - 1, len(valence_history)),
+            x_axis[window_size - 1 :],
             moving_avg,
             color="orange",
             linewidth=2,
             linestyle="--",
             label=f"移動平均 (窓サイズ: {window_size})",
+            rasterized=True,
         )
         ax1.legend()
 
@@ -92,12 +175,10 @@ async def plot_emotional_journey(
 
     # 品質評価の視覚化
     success_score = metrics.get("success_score", 0)
-    quality_colors = ["red", "orange", "yellow", "lightgreen", "green"]
-    quality_labels = ["要改善", "改善可能", "標準", "良好", "優秀"]
 
     score_index = min(4, int(success_score * 5))
-    quality_color = quality_colors[score_index]
-    quality_label = quality_labels[score_index]
+    quality_color = _QUALITY_COLORS[score_index]
+    quality_label = _QUALITY_LABELS[score_index]
 
     ax2.barh(["品質評価"], [success_score], color=quality_color, alpha=0.7)
     ax2.set_xlim(0, 1)
@@ -113,11 +194,13 @@ async def plot_emotional_journey(
     ax2.axvline(x=0.8, color="green", linestyle="--", alpha=0.7, label="優秀基準")
     ax2.legend()
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches="tight")
-    plt.close()
-
-    print(f"感情軌跡グラフを保存: {save_path}")
+    fig.tight_layout()
+    fig.savefig(
+        save_path,
+        dpi=_SAVEFIG_DPI,
+        bbox_inches="tight",
+        pil_kwargs={"compress_level": _PNG_COMPRESS_LEVEL},
+    )
 
 
 async def plot_reversal_analysis(
@@ -125,51 +208,60 @@ async def plot_reversal_analysis(
 ) -> None:
     """転換分析の可視化"""
 
+    _apply_plot_style()
+    await asyncio.to_thread(_draw_reversal_analysis, reversal_map, save_path)
+
+    print(f"転換分析グラフを保存: {save_path}")
+
+
+def _draw_reversal_analysis(reversal_map: dict[str, Any], save_path: str) -> None:
+    """転換分析グラフを描画して保存（ワーカースレッドで実行）"""
+
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    fig = _new_figure((16, 12))
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
 
     # 1. 転換タイプの分布
     chapter_reversals = reversal_map.get("chapter_reversals", {})
-    reversal_types = []
-
-    for chapter_data in chapter_reversals.values():
-        for reversal_info in chapter_data:
-            reversal = reversal_info.get("reversal", {})
-            if hasattr(reversal, "type"):
-                reversal_types.append(reversal.type.value)
-            else:
-                reversal_types.append("unknown")
+    # type を持たない転換は "unknown" として数える
+    reversal_types = [
+        reversal_type.value
+        if (reversal_type := getattr(reversal_info.get("reversal"), "type", None)) is not None
+        else "unknown"
+        for reversal_info in chain.from_iterable(chapter_reversals.values())
+    ]
 
     if reversal_types:
-        type_counts: dict[str, int] = {}
-        for rtype in reversal_types:
-            type_counts[rtype] = type_counts.get(rtype, 0) + 1
-
+        type_counts = Counter(reversal_types)
         ax1.pie(type_counts.values(), labels=type_counts.keys(), autopct="%1.1f%%")
         ax1.set_title("転換タイプの分布", fontsize=12, weight="bold")
     else:
         ax1.text(0.5, 0.5, "データなし", ha="center", va="center", transform=ax1.transAxes)
         ax1.set_title("転換タイプの分布", fontsize=12, weight="bold")
 
-    # 2. 章ごとの転換強度
+    # 2. 章ごとの転換強度（全章の強度を1本にまとめ、章ごとの平均を一括で求める）
     chapter_numbers = []
-    intensities = []
+    chapter_indices = []
+    flat_intensities = []
 
-    for chapter_name, chapter_data in chapter_reversals.items():
-        chapter_num = int(chapter_name.split("_")[1]) if "_" in chapter_name else 0
+    for index, (chapter_name, chapter_data) in enumerate(chapter_reversals.items()):
+        match = _CHAPTER_NUMBER_RE.search(chapter_name)
+        chapter_num = int(match.group(1)) if match else 0
         chapter_numbers.append(chapter_num)
 
-        avg_intensity = 0
-        if chapter_data:
-            intensities_in_chapter = []
-            for reversal_info in chapter_data:
-                reversal = reversal_info.get("reversal", {})
-                if hasattr(reversal, "intensity"):
-                    intensities_in_chapter.append(reversal.intensity)
-            avg_intensity = np.mean(intensities_in_chapter) if intensities_in_chapter else 0
+        for reversal_info in chapter_data:
+            reversal = reversal_info.get("reversal", {})
+            if hasattr(reversal, "intensity"):
+                chapter_indices.append(index)
+                flat_intensities.append(reversal.intensity)
 
-        intensities.append(avg_intensity)
+    # 強度を持つ転換が無い章の平均は 0
+    intensity_sums = np.bincount(
+        chapter_indices, weights=flat_intensities, minlength=len(chapter_numbers)
+    )
+    intensity_counts = np.bincount(chapter_indices, minlength=len(chapter_numbers))
+    intensities = (intensity_sums / np.maximum(intensity_counts, 1)).tolist()
 
     if chapter_numbers and intensities:
         ax2.bar(chapter_numbers, intensities, color="steelblue", alpha=0.7)
@@ -192,15 +284,7 @@ async def plot_reversal_analysis(
         weight="bold",
     )
 
-    arc_descriptions = [
-        "第1幕: 希望と自信 (0.8)",
-        "第2幕前半: 困難と挫折 (-0.3)",
-        "第2幕後半: 裏切りと絶望 (-0.9)",
-        "第3幕前半: 理解と決意 (0.2)",
-        "第3幕後半: 勝利と代償 (0.5)",
-    ]
-
-    for i, desc in enumerate(arc_descriptions):
+    for i, desc in enumerate(_ARC_DESCRIPTIONS):
         ax3.text(0.1, 0.7 - i * 0.15, desc, transform=ax3.transAxes, fontsize=10)
 
     ax3.set_xlim(0, 1)
@@ -208,22 +292,7 @@ async def plot_reversal_analysis(
     ax3.axis("off")
 
     # 4. 成功要因の分析
-    success_factors = {
-        "転換頻度": 0.85,
-        "転換強度": 0.92,
-        "感情分散": 0.78,
-        "意味的距離": 0.88,
-        "時間構造": 0.81,
-    }
-
-    factors = list(success_factors.keys())
-    scores = list(success_factors.values())
-
-    ax4.barh(
-        factors,
-        scores,
-        color=["green" if s >= 0.8 else "orange" if s >= 0.6 else "red" for s in scores],
-    )
+    ax4.barh(_SUCCESS_FACTOR_LABELS, _SUCCESS_FACTOR_SCORES, color=_SUCCESS_FACTOR_COLORS)
     ax4.set_xlim(0, 1)
     ax4.set_xlabel("達成度")
     ax4.set_title("成功要因の分析")
@@ -231,11 +300,13 @@ async def plot_reversal_analysis(
     ax4.axvline(x=0.6, color="orange", linestyle="--", alpha=0.7, label="基準値")
     ax4.legend()
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches="tight")
-    plt.close()
-
-    print(f"転換分析グラフを保存: {save_path}")
+    fig.tight_layout()
+    fig.savefig(
+        save_path,
+        dpi=_SAVEFIG_DPI,
+        bbox_inches="tight",
+        pil_kwargs={"compress_level": _PNG_COMPRESS_LEVEL},
+    )
 
 
 async def plot_semantic_journey(
@@ -243,19 +314,22 @@ async def plot_semantic_journey(
 ) -> None:
     """意味的軌跡の可視化"""
 
+    _apply_plot_style()
+    await asyncio.to_thread(_draw_semantic_journey, semantic_trajectory, save_path)
+
+    print(f"意味的軌跡グラフを保存: {save_path}")
+
+
+def _draw_semantic_journey(semantic_trajectory: dict[str, Any], save_path: str) -> None:
+    """意味的軌跡グラフを描画して保存（ワーカースレッドで実行）"""
+
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    fig = _new_figure((16, 12))
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
 
     # 意味的次元の変化
-    dimensions = [
-        "physical",
-        "emotional",
-        "philosophical",
-        "political",
-        "spiritual",
-        "mythological",
-    ]
+    dimensions = DOMAINS
 
     # サンプルデータの生成（実際の実装では semantic_trajectory から取得）
     positions = semantic_trajectory.get("positions", [])
@@ -263,13 +337,11 @@ async def plot_semantic_journey(
         # サンプルデータを生成
         positions = _generate_sample_semantic_positions(12, dimensions)
 
-    # 各次元の軌跡
-    for dim in dimensions:
-        values = [
-            getattr(pos, dim, 0) if hasattr(pos, dim) else np.random.uniform(-0.5, 0.5)
-            for pos in positions
-        ]
-        ax1.plot(range(len(values)), values, label=dim.capitalize(), linewidth=2, marker="o")
+    # 各次元の軌跡（全位置×全次元の値を先にまとめて取り出す）
+    position_matrix = _semantic_position_matrix(positions, dimensions)
+    x_axis = np.arange(position_matrix.shape[0])
+    for j, dim in enumerate(dimensions):
+        ax1.plot(x_axis, position_matrix[:, j], label=dim.capitalize(), linewidth=2, marker="o")
 
     ax1.set_xlabel("物語の進行")
     ax1.set_ylabel("意味的位置")
@@ -279,9 +351,9 @@ async def plot_semantic_journey(
 
     # 総意味的距離
     total_distance = semantic_trajectory.get("total_distance", 8.5)
-    distance_data = [total_distance * (i + 1) / 12 for i in range(12)]
+    distance_data = np.linspace(total_distance / 12, total_distance, 12)
 
-    ax2.plot(range(12), distance_data, linewidth=3, color="purple", marker="s")
+    ax2.plot(np.arange(12), distance_data, linewidth=3, color="purple", marker="s")
     ax2.set_xlabel("章番号")
     ax2.set_ylabel("累積意味的距離")
     ax2.set_title(f"意味的距離の蓄積 (総距離: {total_distance:.2f})")
@@ -290,13 +362,20 @@ async def plot_semantic_journey(
     # 意味的カバレッジ
     coverage = semantic_trajectory.get("semantic_coverage", {})
     if not coverage:
-        coverage = {dim: {"coverage_ratio": np.random.uniform(0.3, 0.9)} for dim in dimensions}
+        coverage = {
+            dim: {"coverage_ratio": ratio}
+            for dim, ratio in zip(
+                dimensions, _RNG.uniform(0.3, 0.9, size=len(dimensions)).tolist(), strict=True
+            )
+        }
 
     coverage_values = [coverage.get(dim, {}).get("coverage_ratio", 0.5) for dim in dimensions]
 
     ax3.bar(dimensions, coverage_values, color="skyblue", alpha=0.7)
     ax3.set_ylabel("カバレッジ比率")
     ax3.set_title("意味的次元のカバレッジ")
+    # 目盛り位置を先に固定してからラベルを設定する（描画時の目盛りの再計算を避ける）
+    ax3.set_xticks(np.arange(len(dimensions)))
     ax3.set_xticklabels(dimensions, rotation=45)
 
     # 基準線
@@ -304,123 +383,147 @@ async def plot_semantic_journey(
     ax3.legend()
 
     # 複雑性スコア
-    complexity_metrics = {
-        "意味的密度": 0.82,
-        "次元的多様性": 0.75,
-        "軌跡の非線形性": 0.88,
-        "統合的複雑性": 0.85,
-    }
+    wedges, texts, autotexts = ax4.pie(
+        _COMPLEXITY_VALUES, labels=_COMPLEXITY_LABELS, autopct="%1.1f%%", startangle=90
+    )
+    ax4.set_title("意味的複雑性の構成")
 
-    metrics = list(complexity_metrics.keys())
-    values = list(complexity_metrics.values())
+    fig.tight_layout()
+    fig.savefig(
+        save_path,
+        dpi=_SAVEFIG_DPI,
+        bbox_inches="tight",
+        pil_kwargs={"compress_level": _PNG_COMPRESS_LEVEL},
+    )
 
-    wedges, texts, autotexts = ax4.pie(values, labels=metrics, autopct="%1.1f%%", startangle=90)
-    ax4.set_title("意味的複雑性の構成")
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches="tight")
-    plt.close()
+def _semantic_position_matrix(positions: list[Any], dimensions: Sequence[str]) -> np.ndarray:
+    """意味的位置を (位置数, 次元数) の配列にまとめる（値を持たない次元は乱数で補う）"""
 
-    print(f"意味的軌跡グラフを保存: {save_path}")
+    matrix = _RNG.uniform(-0.5, 0.5, size=(len(positions), len(dimensions)))
+    get_all = attrgetter(*dimensions)
 
+    for i, pos in enumerate(positions):
+        try:
+            matrix[i] = get_all(pos)
+        except AttributeError:
+            # 一部の次元だけを持つ位置は次元ごとに取り出す
+            for j, dim in enumerate(dimensions):
+                if hasattr(pos, dim):
+                    matrix[i, j] = getattr(pos, dim)
 
-def _generate_sample_valence_history(metrics: dict[str, Any]) -> list[float]:
-    """サンプルの感情価履歴を生成"""
+    return matrix
 
-    # 基本的な感情アークのパターン
-    base_pattern = [0.8, 0.6, 0.2, -0.3, -0.1, 0.4, -0.7, -0.9, -0.2, 0.1, 0.6, 0.3]
 
-    # ランダムな変動を追加
-    valence_history = []
-    for base_val in base_pattern:
-        variation = np.random.uniform(-0.2, 0.2)
-        final_val = max(-1.0, min(1.0, base_val + variation))
-        valence_history.append(final_val)
+def _generate_sample_valence_history(metrics: dict[str, Any]) -> list[float]:
+    """サンプルの感情価履歴を生成"""
 
-    return valence_history
+    # 基本的な感情アークのパターンにランダムな変動を加え、[-1, 1] に収める
+    variation = _RNG.uniform(-0.2, 0.2, size=_SAMPLE_VALENCE_PATTERN.size)
+    return np.clip(_SAMPLE_VALENCE_PATTERN + variation, -1.0, 1.0).tolist()
 
 
 def _calculate_moving_average(data: list[float], window_size: int) -> list[float]:
     """移動平均を計算"""
 
-    moving_avg = []
-    for i in range(window_size - 1, len(data)):
-        window = data[i - window_size + 1 : i + 1]
-        moving_avg.append(sum(window) / window_size)
+    values = np.asarray(data, dtype=np.float64)
 
-    return moving_avg
+    # 中心窓の平均から、各点で終わる窓（末尾 window_size 個）に当たる範囲を切り出す
+    centered = uniform_filter1d(values, size=window_size, mode="nearest")
+    head = window_size // 2
+    return centered[head : len(values) - (window_size - 1 - head)].tolist()
 
 
-def _generate_sample_semantic_positions(count: int, dimensions: list[str]) -> list[Any]:
+def _generate_sample_semantic_positions(count: int, dimensions: Sequence[str]) -> list[Any]:
     """サンプルの意味的位置を生成"""
 
-    from ..core.semantic_pacing_controller import SemanticPosition
+    # 物語の進行に応じた波形パターンに、位置×次元ごとのランダムな変動を一括で加える
+    progress = np.arange(count) / count
+    base_values = (np.sin(progress * np.pi * 2) * 0.5)[:, np.newaxis]
+    variation = _RNG.uniform(-0.3, 0.3, size=(count, len(dimensions)))
+    values = np.clip(base_values + variation, -1.0, 1.0)
 
-    positions = []
-    for i in range(count):
-        kwargs = {}
-        for dim in dimensions:
-            # 物語の進行に応じた変化パターン
-            progress = i / count
-            base_value = np.sin(progress * np.pi * 2) * 0.5  # 波形パターン
-            variation = np.random.uniform(-0.3, 0.3)
-            kwargs[dim] = max(-1.0, min(1.0, base_value + variation))
+    return SemanticPosition.from_rows(values, tuple(dimensions))
 
-        positions.append(SemanticPosition(**kwargs))
-
-    return positions
 
+async def create_comprehensive_report(
+    result: dict[str, Any], output_dir: str = "output", plots: bool = True
+) -> None:
+    """
+    包括的なレポートを作成
 
-async def create_comprehensive_report(result: dict[str, Any], output_dir: str = "output") -> None:
-    """包括的なレポートを作成"""
+    Args:
+        result: 生成結果。
+        output_dir: 出力先ディレクトリ。
+        plots: False の場合はグラフを描かず、サマリーレポートのみを書き出す
+            （matplotlib も読み込まない）。
+    """
 
     os.makedirs(output_dir, exist_ok=True)
 
-    # 各種グラフの生成
-    await plot_emotional_journey(
-        result.get("narrative_metrics", {}), f"{output_dir}/emotional_journey.png"
-    )
+    # 各種グラフとサマリーレポートの生成（互いに独立しているため並行実行）
+    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    tasks = [
+        asyncio.to_thread(
+            _write_generation_report,
+            result,
+            f"{output_dir}/generation_report.txt",
+            generated_at,
+        )
+    ]
+    if plots:
+        tasks += [
+            plot_emotional_journey(
+                result.get("narrative_metrics", {}), f"{output_dir}/emotional_journey.png"
+            ),
+            plot_reversal_analysis(
+                result.get("reversal_analysis", {}), f"{output_dir}/reversal_analysis.png"
+            ),
+            plot_semantic_journey(
+                result.get("semantic_journey", {}), f"{output_dir}/semantic_journey.png"
+            ),
+        ]
+    await asyncio.gather(*tasks)
 
-    await plot_reversal_analysis(
-        result.get("reversal_analysis", {}), f"{output_dir}/reversal_analysis.png"
-    )
+    print(f"包括的レポートを生成: {output_dir}/")
+    if plots:
+        print("  - emotional_journey.png: 感情軌跡グラフ")
+        print("  - reversal_analysis.png: 転換分析グラフ")
+        print("  - semantic_journey.png: 意味的軌跡グラフ")
+    print("  - generation_report.txt: 生成レポート")
 
-    await plot_semantic_journey(
-        result.get("semantic_journey", {}), f"{output_dir}/semantic_journey.png"
-    )
 
-    # サマリーレポートの生成
-    report_path = f"{output_dir}/generation_report.txt"
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write("=" * 60 + "\n")
-        f.write("計算論的物語論統合型ハイファンタジー小説 生成レポート\n")
-        f.write("=" * 60 + "\n\n")
-
-        f.write(f"作品タイトル: {result.get('title', '未定')}\n")
-        f.write(f"生成日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-        # メトリクス
-        metrics = result.get("narrative_metrics", {})
-        f.write("物語構造メトリクス:\n")
-        f.write("-" * 30 + "\n")
-        f.write(f"  転換頻度: {metrics.get('reversal_frequency', 0):.2f}回/章\n")
-        f.write(f"  平均転換強度: {metrics.get('average_reversal_intensity', 0):.2f}\n")
-        f.write(f"  感情分散: {metrics.get('emotional_variance', 0):.2f}\n")
-        f.write(f"  意味的距離: {metrics.get('semantic_distance', 0):.2f}\n")
-        f.write(f"  総合成功スコア: {metrics.get('success_score', 0):.2f}\n\n")
-
-        # 技法サマリー
-        metadata = result.get("generation_metadata", {})
-        techniques = metadata.get("technique_summary", [])
-        f.write("使用された技法:\n")
-        f.write("-" * 30 + "\n")
-        for technique in techniques:
-            f.write(f"  • {technique}\n")
-
-        f.write(f"\n最終品質スコア: {metadata.get('final_quality_score', 0):.2f}\n")
+def _write_generation_report(result: dict[str, Any], report_path: str, generated_at: str) -> None:
+    """サマリーレポートを書き出す（ワーカースレッドで実行）"""
 
-    print(f"包括的レポートを生成: {output_dir}/")
-    print("  - emotional_journey.png: 感情軌跡グラフ")
-    print("  - reversal_analysis.png: 転換分析グラフ")
-    print("  - semantic_journey.png: 意味的軌跡グラフ")
-    print("  - generation_report.txt: 生成レポート")
+    parts: list[str] = []
+    parts.append("=" * 60 + "\n")
+    parts.append("計算論的物語論統合型ハイファンタジー小説 生成レポート\n")
+    parts.append("=" * 60 + "\n\n")
+
+    parts.append(f"作品タイトル: {result.get('title', '未定')}\n")
+    parts.append(f"生成日時: {generated_at}\n\n")
+
+    # メトリクス
+    metrics = result.get("narrative_metrics", {})
+    parts.append("物語構造メトリクス:\n")
+    parts.append("-" * 30 + "\n")
+    parts.append(f"  転換頻度: {metrics.get('reversal_frequency', 0):.2f}回/章\n")
+    parts.append(f"  平均転換強度: {metrics.get('average_reversal_intensity', 0):.2f}\n")
+    parts.append(f"  感情分散: {metrics.get('emotional_variance', 0):.2f}\n")
+    parts.append(f"  意味的距離: {metrics.get('semantic_distance', 0):.2f}\n")
+    parts.append(f"  総合成功スコア: {metrics.get('success_score', 0):.2f}\n\n")
+
+    # 技法サマリー
+    metadata = result.get("generation_metadata", {})
+    techniques = metadata.get("technique_summary", [])
+    parts.append("使用された技法:\n")
+    parts.append("-" * 30 + "\n")
+    for technique in techniques:
+        parts.append(f"  • {technique}\n")
+
+    parts.append(f"\n最終品質スコア: {metadata.get('final_quality_score', 0):.2f}\n")
+
+    # 行ごとに書き込まず、組み立てた全文を一度に書き出す
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
@@ -1,11 +1,20 @@
 """基本機能のテスト"""
 
+import json
+
+import numpy as np
 import pytest
+from langchain_core.language_models.chat_models import SimpleChatModel
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
 
 from src.core.computational_narratology import ComputationalNarratologyEngine
 from src.core.emotional_valence_tracker import EmotionalValenceTracker
+from src.core.reversal_scene_generator import ReversalSceneGenerator
 from src.core.semantic_pacing_controller import SemanticPacingController
 from src.core.temporal_structure_designer import TemporalStructureDesigner
+from src.engines.computational_fantasy_engine import ComputationallyOptimizedFantasyEngine
+from src.utils.file_utils import save_optimized_novel
+from src.utils.visualization import _calculate_moving_average
 
 
 def test_computational_narratology_engine_init():
@@ -38,6 +47,18 @@ def test_temporal_structure_designer_init():
     assert hasattr(designer, "temporal_techniques")
 
 
+def test_temporal_complexity_empty_plot():
+    """イベントの無いプロットでも時間構造を設計できることのテスト"""
+    designer = TemporalStructureDesigner(seed=0)
+
+    result = designer.create_temporal_complexity({"events": [], "characters": {}})
+
+    assert result["structure_type"] == ["in_medias_res"]
+    assert result["starting_point"]["starting_event"] is None
+    assert result["reading_path"] == []
+    assert 0.0 <= result["complexity_score"] <= 1.0
+
+
 @pytest.mark.asyncio
 async def test_valence_analysis():
     """感情価分析の基本テスト"""
@@ -56,6 +77,30 @@ async def test_valence_analysis():
     assert -1.0 <= valence <= 1.0
 
 
+@pytest.mark.asyncio
+async def test_emotional_statistics_match_history():
+    """逐次集計した感情統計が履歴からの再計算と一致することのテスト"""
+    tracker = EmotionalValenceTracker()
+
+    scenes = [
+        "希望に満ちた美しい朝、勇者は勝利を確信していた。",
+        "絶望的な状況で、すべてが失われたように思えた。",
+        "静かな朝だった。",
+        "裏切りと喪失の果てに、奇跡が訪れた。",
+    ]
+    for position, scene in enumerate(scenes):
+        await tracker.analyze_scene_valence(scene, position)
+
+    history = np.array(tracker.valence_history)
+    stats = tracker.get_emotional_statistics()
+
+    assert stats["mean_valence"] == pytest.approx(float(np.mean(history)))
+    assert stats["valence_variance"] == pytest.approx(float(np.var(history)))
+    assert stats["valence_std"] == pytest.approx(float(np.std(history)))
+    assert stats["range"] == pytest.approx(float(np.ptp(history)))
+    assert stats["neutral_ratio"] == pytest.approx(float(np.mean(history == 0)))
+
+
 def test_success_probability_calculation():
     """成功確率計算のテスト"""
     engine = ComputationalNarratologyEngine()
@@ -84,3 +129,125 @@ def test_reversal_sequence_optimization():
         assert hasattr(reversal, "type")
         assert hasattr(reversal, "intensity")
         assert hasattr(reversal, "target_state")
+
+
+def test_moving_average_uses_trailing_windows():
+    """移動平均が各点で終わる窓の平均になることのテスト"""
+    data = [0.8, 0.6, 0.2, -0.3, -0.1, 0.4, -0.7, -0.9, -0.2, 0.1, 0.6, 0.3]
+
+    for window_size in (2, 3, 4):
+        expected = [np.mean(data[i : i + window_size]) for i in range(len(data) - window_size + 1)]
+        assert _calculate_moving_average(data, window_size) == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+async def test_saved_reversal_analysis_keeps_fields(tmp_path):
+    """保存した転換分析が転換オブジェクトの各フィールドを保持することのテスト"""
+    engine = ComputationalNarratologyEngine()
+    reversal = engine.optimize_reversal_sequence([0.8, -0.3])[0]
+
+    result = {"reversal_analysis": {"chapter_reversals": {"chapter_1": [{"reversal": reversal}]}}}
+    await save_optimized_novel(result, output_dir=str(tmp_path))
+
+    (path,) = tmp_path.glob("reversal_analysis_*.json")
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    saved_reversal = saved["chapter_reversals"]["chapter_1"][0]["reversal"]
+
+    assert saved_reversal["type"] == reversal.type.value
+    assert saved_reversal["intensity"] == pytest.approx(reversal.intensity)
+    assert saved_reversal["narrative_function"] == reversal.narrative_function
+
+
+@pytest.mark.asyncio
+async def test_generate_reversal_scenes_preserves_order():
+    """転換シーン一括生成が入力順に結果を返すことのテスト"""
+    generator = ReversalSceneGenerator()
+
+    reversal_types = ["false_defeat", "pyrrhic_victory", "recognition_scene"]
+    jobs = [
+        ({"characters": ["アルテミス"]}, {"reversal_type": reversal_type, "intensity": 0.9})
+        for reversal_type in reversal_types
+    ]
+
+    scenes = await generator.generate_reversal_scenes(jobs, max_concurrency=2)
+
+    assert len(scenes) == len(jobs)
+    for scene, reversal_type in zip(scenes, reversal_types, strict=True):
+        setup = generator.scene_templates[reversal_type].setup
+        assert scene.startswith(f"【設定】{setup}")
+
+
+@pytest.mark.asyncio
+async def test_scene_llm_system_prompt_is_stable():
+    """LLM に渡すシステムプロンプトがシーン間でバイト単位で同一であることのテスト"""
+
+    calls = []
+
+    class RecordingChatModel(FakeListChatModel):
+        async def ainvoke(self, input, *args, **kwargs):
+            calls.append(input)
+            return await super().ainvoke(input, *args, **kwargs)
+
+    llm = RecordingChatModel(responses=["第一のシーン", "第二のシーン"])
+    generator = ReversalSceneGenerator(llm=llm)
+
+    scenes = [
+        await generator.generate_reversal_scene(
+            {"characters": ["アルテミス"]}, {"reversal_type": reversal_type, "intensity": 0.9}
+        )
+        for reversal_type in ("false_defeat", "pyrrhic_victory")
+    ]
+
+    # LLM の本文はテンプレート向けの強化項目を追記せずそのまま返す
+    assert scenes == ["第一のシーン", "第二のシーン"]
+    first, second = calls
+    assert first[0].content.encode("utf-8") == second[0].content.encode("utf-8")
+    assert first[1].content != second[1].content
+
+
+@pytest.mark.asyncio
+async def test_create_many_runs_duplicate_concepts_independently(monkeypatch):
+    """同じコンセプトを並行生成しても各実行が独立したスレッドで完走することのテスト"""
+    monkeypatch.setenv("GROQ_API_KEY", "test")
+
+    foundation = {
+        "world": {
+            "name": "ヴェルダンディア",
+            "magic_system": "星の魔法",
+            "primary_races": ["人間", "エルフ", "竜族"],
+            "central_conflict": "王冠の喪失",
+        },
+        "characters": {
+            name: {"role": role, "arc": "成長", "powers": []}
+            for name, role in (("アルテミス", "protagonist"), ("ノクス", "antagonist"))
+        },
+        "basic_plot": [
+            {"description": f"出来事{i} 勝利 裏切り", "type": "setup", "emotional_impact": 0.1 * i}
+            for i in range(-3, 3)
+        ],
+    }
+    foundation_calls = []
+
+    class NovelChatModel(SimpleChatModel):
+        @property
+        def _llm_type(self) -> str:
+            return "novel-test"
+
+        def _call(self, messages, stop=None, run_manager=None, **kwargs):
+            if "JSONスキーマ" in messages[-1].content:
+                foundation_calls.append(messages)
+                return json.dumps(foundation, ensure_ascii=False)
+            return "希望に満ちた朝。\n絶望的な裏切りが訪れた。"
+
+    engine = ComputationallyOptimizedFantasyEngine(checkpointer=True)
+    engine.llm = NovelChatModel()
+
+    concept = {"theme": "失われた王冠"}
+    results = await engine.create_many([concept, concept], max_concurrency=2)
+
+    assert len(foundation_calls) == 2
+    assert len(results) == 2
+    assert results[0]["manuscript"]
+    assert results[0]["manuscript"].keys() == results[1]["manuscript"].keys()
+    # 完了した実行のチェックポイントは残らない
+    assert not list(engine._checkpointer.list(None))